@@ -1,8 +1,14 @@
 from .aisert import Aisert
+from .async_aisert import AsyncAisert
 from .config.config import AisertConfig
 from .exception import AisertError
+from .models.batch_report import BatchReport
+from .models.ndjson_report import NdjsonReport
 from .models.report import AisertReport
+from .pipeline import Pipeline
+from .validators.streaming_schema_validator import StreamingSchemaValidator
 from .validators.token_validator.token_validator_base import TokenValidatorBase
 
 __version__ = "0.1.1"
-__all__ = ["Aisert", "AisertConfig", "AisertError", "AisertReport", "TokenValidatorBase"]
+__all__ = ["Aisert", "AsyncAisert", "AisertConfig", "AisertError", "AisertReport", "BatchReport", "NdjsonReport",
+           "Pipeline", "StreamingSchemaValidator", "TokenValidatorBase"]
@@ -1,14 +1,23 @@
+import json
 import logging
-from typing import List, Optional
+import os
+from collections import deque
+from typing import Any, Callable, Iterator, List, Optional
 
+from .models.batch_report import BatchReport
+from .models.content_view import ContentView
+from .models.ndjson_report import NdjsonReport
 from .models.report import AisertReport
 
 from .exception import AisertError
 
 from .config.config import AisertConfig
+from .models.plan import ExecutionPlan, Rule
 from .models.result import AisertStatus, Result
 from .validators.contains_validator import ContainsValidator
 from .validators.not_contains_validator import NotContainsValidator
+from .validators.path_validator import PathValidator
+from .validators.schema_any_validator import SchemaAnyValidator
 from .validators.schema_validator import SchemaValidator
 from .validators.semantic_validator import SemanticValidator
 from .validators.token_validator.token_validator import TokenValidator
@@ -23,41 +32,66 @@ class Aisert:
     Validation methods include:
     
     * :meth:`assert_schema` -- Validate against Pydantic models
+    * :meth:`assert_schema_any` -- Validate against whichever of several models matches
     * :meth:`assert_contains` -- Check for required content
     * :meth:`assert_not_contains` -- Check for forbidden content
+    * :meth:`assert_path` -- Check values selected by a JSONPath expression
     * :meth:`assert_tokens` -- Validate token count limits
     * :meth:`assert_semantic_matches` -- Check semantic similarity
     
     Each validation method supports both strict mode (raises exceptions on failure)
     and non-strict mode (collects errors for later inspection).
     
+    By default each ``assert_*`` call runs immediately. With ``deferred=True`` the
+    calls only record a plan, and :meth:`collect` runs the recorded rules
+    concurrently on the managed thread pool, so a chain costs as much as its
+    slowest rule rather than the sum of all rules.
+    
+    With ``fail_fast=True`` the chain stops paying for rules once the overall
+    status is known: after the first failure the remaining rules are skipped and
+    reported as skipped. In deferred mode the rules are also reordered by the
+    validators' declared ``cost`` so cheap checks run first, and
+    :meth:`depends_on` makes a rule conditional on earlier rules passing.
+    
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, content, config: Optional[AisertConfig] = None):
+    logger = logging.getLogger("Aisert")
+
+    def __init__(self, content, config: Optional[AisertConfig] = None, deferred: bool = False,
+                 fail_fast: bool = False):
         """Initialize Aisert with content to validate.
         
         Args:
             content: Text, dict, or list to validate (typically LLM response)
             config: Optional configuration for token counting and semantic models
+            deferred: If True, ``assert_*`` calls are recorded and run concurrently by :meth:`collect`
+            fail_fast: If True, rules after the first failure are skipped (cheapest first when deferred)
         
         Example:
             >>> aisert = Aisert("Hello world")
             >>> config = AisertConfig(token_provider="openai", token_model="gpt-4")
             >>> aisert = Aisert("Hello world", config)
+            >>> report = Aisert("Hello world", config, deferred=True).assert_tokens(10).collect()
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
         self.content = content
+        self._view = ContentView(content)
         self.status = AisertStatus()
         self.config = config if config is not None else AisertConfig.get_default_config()
+        self.deferred = deferred
+        self.fail_fast = fail_fast
+        self._plan = []
 
-    def assert_schema(self, schema, strict: bool = True):
+    def assert_schema(self, schema, strict: bool = True, extract: bool = False):
         """
         Validate content against a Pydantic model schema.
         
         Args:
-            schema: Pydantic model class or generic type to validate against
+            schema: Pydantic model class or generic type to validate against, or a JSON Schema
+                document (dict), compiled once and cached by its canonical hash
             strict: If True, raises exception on failure; if False, collects error
+            extract: If True, validate the JSON object or array found inside markdown
+                fences or surrounding prose instead of requiring the whole content to be JSON
         
         Returns:
             Self for method chaining
@@ -68,40 +102,95 @@ class Aisert:
         Example:
             >>> aisert.assert_schema(UserModel)  # Validates JSON against UserModel
             <aisert.aisert.Aisert object at 0x...>
+            >>> Aisert("Here you go:\n```json\n{...}\n```").assert_schema(UserModel, extract=True)
+            <aisert.aisert.Aisert object at 0x...>
+        """
+        self.logger.debug("Checking if content is matching %s", schema)
+        self._validate(SchemaValidator.get_instance(), strict, self._view, schema, extract=extract)
+        return self
+
+    def assert_schema_any(self, schemas: List, strict: bool = True, discriminator: Optional[str] = None,
+                          extract: bool = False):
+        """Validate that content matches one of several Pydantic schemas, parsing it once.
+        
+        The schemas are validated as one cached union. When every schema is a
+        model with a ``Literal`` field of the same name and distinct values,
+        that field is used as the discriminator so only the matching model is
+        validated. The report's reason names the schema that matched.
+        
+        :param schemas: Pydantic model classes or generic types, e.g. the response shapes of an agent
+        :type schemas: list
+        :param strict: If ``True``, raises exception on failure; if ``False``, collects error
+        :type strict: bool
+        :param discriminator: Field selecting the model; detected from ``Literal`` fields if not given
+        :type discriminator: str
+        :param extract: If ``True``, validate the JSON found inside markdown fences or surrounding prose
+        :type extract: bool
+        :return: Self for method chaining
+        :rtype: Aisert
+        :raises SchemaValidationError: If no schema matches and *strict* is ``True``
+        
+        Example usage::
+        
+            report = Aisert(response).assert_schema_any([Answer, Clarification, Refusal]).collect()
+            report.rules[1]["reason"]  # "Matched schema: Clarification"
+        
+        .. versionadded:: 0.2.0
         """
-        self.logger.debug(f"Checking if content is matching {schema}")
-        self._validate(SchemaValidator(), strict, self.content, schema)
+        self.logger.debug("Checking if content is matching any of %s", schemas)
+        self._validate(SchemaAnyValidator.get_instance(), strict, self._view, schemas,
+                       discriminator=discriminator, extract=extract)
         return self
 
-    def assert_contains(self, items: List[str], strict: bool = True):
+    def assert_contains(self, items: List[str], strict: bool = True, keys: bool = False,
+                        paths: Optional[List[str]] = None, substring: bool = False):
         """Validate that content contains all specified items.
         
+        Dict and list content is searched in place, without serializing it: each item
+        must equal a value nested in it (a list element or dict value; string items
+        also match the ``str()`` of numbers, booleans and ``None``).
+        
         :param items: List of strings that must be present in the content
         :type items: List[str]
         :param strict: If ``True``, raises exception on failure; if ``False``, collects error
         :type strict: bool
+        :param keys: If ``True``, dict keys of structured content are searched too
+        :type keys: bool
+        :param paths: JSONPath expressions restricting the search to the values they select;
+            JSON text content is parsed (once per chain) when given
+        :type paths: List[str]
+        :param substring: If ``True``, string items are also found inside the string values
+            of structured content, e.g. ``"refund"`` in ``{"reason": "wants a refund"}``
+        :type substring: bool
         :return: Self for method chaining
         :rtype: Aisert
-        :raises ContainsValidationError: If any items are missing and *strict* is ``True``
+        :raises ContainsValidationError: If any items are missing and *strict* is ``True``,
+            or if a path is not a valid JSONPath expression
         
         Example usage::
         
             aisert = Aisert("Hello world")
             aisert.assert_contains(["Hello", "world"])
+            Aisert(tool_call).assert_contains(["refund"], paths=["$.arguments.reason"], substring=True)
         
         .. versionadded:: 0.1.0
         """
-        self.logger.debug(f"Checking if content contains {items}")
-        self._validate(ContainsValidator(), strict, self.content, items)
+        self.logger.debug("Checking if content contains %s", items)
+        self._validate(ContainsValidator.get_instance(), strict, self._view, items, keys=keys, paths=paths,
+                       substring=substring)
         return self
 
-    def assert_not_contains(self, items: List[str], strict: bool = True):
+    def assert_not_contains(self, items: List[str], strict: bool = True, keys: bool = False,
+                            paths: Optional[List[str]] = None, substring: bool = False):
         """
         Validate that content does NOT contain any of the specified items.
         
         Args:
             items: List of strings that must NOT be present in the content
             strict: If True, raises exception on failure; if False, collects error
+            keys: If True, dict keys of structured content are searched too
+            paths: JSONPath expressions restricting the search to the values they select
+            substring: If True, string items are also found inside the string values of structured content
         
         Returns:
             Self for method chaining
@@ -113,8 +202,44 @@ class Aisert:
             >>> aisert.assert_not_contains(["spam", "inappropriate"])
             <aisert.aisert.Aisert object at 0x...>
         """
-        self.logger.debug(f"Checking if content not contains {items}")
-        self._validate(NotContainsValidator(), strict, self.content, items)
+        self.logger.debug("Checking if content not contains %s", items)
+        self._validate(NotContainsValidator.get_instance(), strict, self._view, items, keys=keys, paths=paths,
+                       substring=substring)
+        return self
+
+    def assert_path(self, path: str, predicate: Optional[Callable[[Any], bool]] = None, strict: bool = True):
+        """Validate values selected by a JSONPath expression in JSON content.
+        
+        Without *predicate* the path must match at least one value; with it,
+        every matched value must satisfy the predicate, and a path matching
+        nothing passes (combine with a rule without predicate to also require
+        a match). The path is compiled
+        once and cached, the check stops at the first violating value, and the
+        content is parsed once per chain however many path rules use it.
+        Supported syntax: ``.name``, ``['name']``, ``[0]``, ``[1:3]``, ``[*]``,
+        ``.*`` and ``..`` (descendants); filters are not supported.
+        
+        :param path: JSONPath expression starting with ``$``
+        :type path: str
+        :param predicate: Callable every matched value must satisfy, e.g. ``lambda price: price > 0``;
+            checks nothing when the path matches nothing
+        :param strict: If ``True``, raises exception on failure; if ``False``, collects error
+        :type strict: bool
+        :return: Self for method chaining
+        :rtype: Aisert
+        :raises PathValidationError: If the path is invalid, or the check fails and *strict* is ``True``
+        
+        Example usage::
+        
+            (Aisert(response)
+                .assert_path("$.user.email")
+                .assert_path("$.items[*].price", lambda price: price > 0)
+                .collect())
+        
+        .. versionadded:: 0.2.0
+        """
+        self.logger.debug("Checking values at %s", path)
+        self._validate(PathValidator.get_instance(), strict, self._view, path, predicate)
         return self
 
     def assert_tokens(self, max_tokens: int, strict: bool = True):
@@ -137,8 +262,8 @@ class Aisert:
             >>> aisert.assert_tokens(max_tokens=100)  # Ensure response is under 100 tokens
             <aisert.aisert.Aisert object at 0x...>
         """
-        self.logger.debug(f"Checking if tokens less than: {max_tokens}")
-        self._validate(TokenValidator(self.config), strict, self.content, token_limit=max_tokens)
+        self.logger.debug("Checking if tokens less than: %s", max_tokens)
+        self._validate(TokenValidator.get_instance(self.config), strict, self._view, token_limit=max_tokens)
         return self
 
     def assert_semantic_matches(self, expected_text: str, threshold: float = 0.8, strict: bool = True):
@@ -163,43 +288,417 @@ class Aisert:
             >>> aisert.assert_semantic_matches("Information about AI", threshold=0.75)
             <aisert.aisert.Aisert object at 0x...>
         """
-        self.logger.debug(f"Checking semantic match")
-        self._validate(SemanticValidator(self.config), strict, self.content, expected_text, threshold=threshold)
+        self.logger.debug("Checking semantic match")
+        self._validate(SemanticValidator.get_instance(self.config), strict, self._view, expected_text,
+                       threshold=threshold)
+        return self
+
+    def depends_on(self, *orders: int):
+        """Make the most recently added rule run only if the given rules pass.
+        
+        Rules are referenced by their report order (1 for the first ``assert_*``
+        call, 2 for the second, ...). Only available in deferred mode.
+        
+        :param orders: Report orders of the rules that must pass
+        :return: Self for method chaining
+        :raises AisertError: If not deferred, or the orders do not refer to earlier rules
+        
+        Example usage::
+        
+            report = (
+                Aisert(response, config, deferred=True)
+                .assert_schema(Answer)
+                .assert_semantic_matches("refund policy").depends_on(1)
+                .collect()
+            )
+        
+        .. versionadded:: 0.2.0
+        """
+        if not self.deferred:
+            raise AisertError("depends_on requires deferred=True")
+        if not self._plan:
+            raise AisertError("depends_on must follow an assert_* call")
+        rule = self._plan[-1]
+        recorded = {r.order for r in self._plan[:-1]}
+        if not set(orders) <= recorded:
+            raise AisertError(f"depends_on must reference earlier rules in this chain, got {list(orders)}")
+        rule.depends_on = tuple(orders)
         return self
 
+    @classmethod
+    def rules(cls, config: Optional[AisertConfig] = None, fail_fast: bool = False):
+        """Start a reusable rule set for :meth:`validate_many` or :meth:`compile`.
+        
+        Returns a deferred chain without content; the ``assert_*`` calls made on
+        it are recorded once and applied to every row. ``strict`` is ignored in
+        batch runs (every failure is recorded), while :meth:`depends_on` is honoured.
+        
+        :param config: Optional configuration for token counting and semantic models
+        :param fail_fast: If True, compiled pipelines skip the rules after the first failure
+        :return: Deferred chain to record rules on
+        :rtype: Aisert
+        
+        Example usage::
+        
+            rules = Aisert.rules(config).assert_schema(Answer).assert_tokens(200)
+            report = Aisert.validate_many(responses, rules)
+        
+        .. versionadded:: 0.2.0
+        """
+        return cls(None, config, deferred=True, fail_fast=fail_fast)
+
+    def compile(self):
+        """Compile a rule set into a reusable, thread-safe :class:`~aisert.Pipeline`.
+        
+        Rule arguments are validated and providers, schema adapters and
+        semantic reference embeddings are prepared once, here.
+        
+        :return: Pipeline running the recorded rules on one content per call
+        :rtype: Pipeline
+        :raises AisertError: If this is not a rule set, or a rule cannot be prepared
+        
+        Example usage::
+        
+            pipeline = Aisert.rules(config).assert_contains(["refund"]).assert_tokens(200).compile()
+            report = pipeline.run(response)
+        
+        .. versionadded:: 0.2.0
+        """
+        from .pipeline import Pipeline
+
+        if not self.deferred:
+            raise AisertError("compile requires a rule set built with Aisert.rules()")
+        return Pipeline(self._plan, self.config, self.fail_fast)
+
+    @staticmethod
+    def validate_many(contents, rules: "Aisert", workers: Optional[int] = None, dedupe: bool = True,
+                      chunk_size: int = 256, max_failure_samples: int = 10):
+        """Validate many contents against one rule set and return a columnar report.
+        
+        The rules (and their shared validators) are built once and applied to
+        every content. Identical contents are validated once, and chunks of rows
+        run on a worker pool. Outcomes are returned as NumPy arrays rather than
+        one report per row.
+        
+        :param contents: Iterable of texts, dicts or lists to validate
+        :param rules: Rule set built with :meth:`rules`
+        :param workers: ``None`` for the managed thread pool, ``1`` to run inline, or a dedicated pool size
+        :param dedupe: Validate identical contents only once
+        :param chunk_size: Rows per task submitted to the pool
+        :param max_failure_samples: Failure reasons kept per rule
+        :return: Columnar report with per-rule pass/score arrays
+        :rtype: BatchReport
+        :raises AisertError: If numpy is not installed or *rules* is not a rule set
+        
+        Example usage::
+        
+            rules = Aisert.rules().assert_contains(["refund"]).assert_not_contains(["spam"])
+            report = Aisert.validate_many(responses, rules)
+            print(report.pass_rate, report.failures[1][:3])
+        
+        .. versionadded:: 0.2.0
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise AisertError("numpy is required for validate_many. Install with: pip install aisert[batch]")
+        if not (isinstance(rules, Aisert) and rules.deferred and rules._plan):
+            raise AisertError("rules must be built with Aisert.rules() and contain at least one assert_* call")
+
+        plan = list(rules._plan)
+        columns = {rule.order: column for column, rule in enumerate(plan)}
+        contents = contents if isinstance(contents, list) else list(contents)
+
+        if dedupe:
+            positions, unique = {}, []
+            inverse = np.empty(len(contents), dtype=np.intp)
+            for row, content in enumerate(contents):
+                key = Aisert._dedupe_key(content)
+                position = positions.get(key)
+                if position is None:
+                    position = positions[key] = len(unique)
+                    unique.append(content)
+                inverse[row] = position
+        else:
+            unique, inverse = contents, None
+
+        shape = (len(unique), len(plan))
+        passed = np.zeros(shape, dtype=bool)
+        scores = np.full(shape, np.nan)
+        skipped = np.zeros(shape, dtype=bool)
+
+        def run_chunk(start: int, stop: int):
+            # Each task writes only its own rows of the shared arrays, so no locking is needed.
+            samples = {}
+            for position in range(start, stop):
+                content = ContentView(unique[position])
+                for column, rule in enumerate(plan):
+                    if any(not passed[position, columns[order]] for order in rule.depends_on):
+                        skipped[position, column] = True
+                        continue
+                    result = rules._run(rule.validator, False, content, *rule.args[1:], **rule.kwargs)
+                    if result.status is True:
+                        passed[position, column] = True
+                    elif len(samples.setdefault(column, [])) < max_failure_samples:
+                        samples[column].append((position, result))
+                    if result.score is not None:
+                        scores[position, column] = result.score
+            return samples
+
+        chunks = [(start, min(start + chunk_size, len(unique))) for start in range(0, len(unique), chunk_size)]
+        if workers == 1 or len(chunks) <= 1:
+            sampled = [run_chunk(*chunk) for chunk in chunks]
+        elif workers is None:
+            from .utils.async_util import get_executor
+            sampled = [future.result() for future in [get_executor().submit(run_chunk, *chunk) for chunk in chunks]]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aisert-batch") as pool:
+                sampled = list(pool.map(lambda chunk: run_chunk(*chunk), chunks))
+
+        # Chunks are in row order, so the first samples of each chunk are the earliest failures.
+        rows = np.arange(len(contents)) if inverse is None else np.unique(inverse, return_index=True)[1]
+        failures = {rule.order: [] for rule in plan}
+        for samples in sampled:
+            for column, pairs in samples.items():
+                bucket = failures[plan[column].order]
+                for position, result in pairs[:max_failure_samples - len(bucket)]:
+                    bucket.append((int(rows[position]), result.reason))
+
+        if inverse is not None:
+            passed, scores, skipped = passed[inverse], scores[inverse], skipped[inverse]
+        return BatchReport([rule.validator.validator_name for rule in plan], passed, scores, skipped, failures)
+
+    @staticmethod
+    def validate_ndjson(source, schema, workers: Optional[int] = None, chunk_bytes: int = 1 << 20,
+                        max_failure_samples: int = 10):
+        """Validate every line of an NDJSON file or stream against one schema.
+        
+        The source is read in blocks of about *chunk_bytes* and each block's
+        lines are validated with the schema's cached adapter on a worker pool,
+        a bounded number of blocks at a time, so memory depends on the block
+        size and the number of lines (one byte each in the report), not on the
+        size of the file. Blank lines are skipped.
+        
+        :param source: Path of an NDJSON file, a binary or text file object, or an iterable of lines
+        :param schema: Pydantic model, generic type or JSON Schema dict, as for :meth:`assert_schema`
+        :param workers: ``None`` for the managed thread pool, ``1`` to run inline, or a dedicated pool size
+        :param chunk_bytes: Approximate size of the blocks read and validated per task
+        :param max_failure_samples: Failure reasons kept, earliest lines first
+        :return: Per-line pass/fail report
+        :rtype: NdjsonReport
+        :raises AisertError: If numpy is not installed
+        :raises SchemaValidationError: If the schema is invalid
+        
+        Example usage::
+        
+            report = Aisert.validate_ndjson("nightly.ndjson", Answer)
+            print(report.pass_rate, report.failures[:3])
+        
+        .. versionadded:: 0.2.0
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise AisertError("numpy is required for validate_ndjson. Install with: pip install aisert[batch]")
+        check = SchemaValidator.get_instance().prepare(schema)
+
+        def run_chunk(lines):
+            passed = np.ones(len(lines), dtype=bool)
+            blank = np.zeros(len(lines), dtype=bool)
+            samples = []
+            for index, line in enumerate(lines):
+                if not line or line.isspace():
+                    blank[index] = True
+                    continue
+                result = check(line)
+                if result.status is not True:
+                    passed[index] = False
+                    if len(samples) < max_failure_samples:
+                        samples.append((index, result.reason))
+            return passed, blank, samples
+
+        passed, blank, failures = [], [], []
+        line_number = 1
+
+        def record(chunk):
+            nonlocal line_number
+            chunk_passed, chunk_blank, samples = chunk
+            for index, reason in samples[:max_failure_samples - len(failures)]:
+                failures.append((line_number + index, reason))
+            passed.append(chunk_passed)
+            blank.append(chunk_blank)
+            line_number += len(chunk_passed)
+
+        chunks = Aisert._ndjson_chunks(source, chunk_bytes)
+        if workers == 1:
+            for lines in chunks:
+                record(run_chunk(lines))
+        else:
+            if workers is None:
+                from .utils.async_util import get_executor
+                pool, window = get_executor(), (os.cpu_count() or 1) * 2
+            else:
+                from concurrent.futures import ThreadPoolExecutor
+                pool, window = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aisert-batch"), workers * 2
+            try:
+                # At most `window` blocks are held at once; results are recorded in file order.
+                pending = deque()
+                for lines in chunks:
+                    pending.append(pool.submit(run_chunk, lines))
+                    if len(pending) >= window:
+                        record(pending.popleft().result())
+                while pending:
+                    record(pending.popleft().result())
+            finally:
+                if workers is not None:
+                    pool.shutdown()
+
+        if not passed:
+            return NdjsonReport(np.ones(0, dtype=bool), np.zeros(0, dtype=bool), failures)
+        return NdjsonReport(np.concatenate(passed), np.concatenate(blank), failures)
+
+    @staticmethod
+    def _ndjson_chunks(source, chunk_bytes: int) -> Iterator[list]:
+        """Lists of lines read from a path, file object or iterable of lines, about *chunk_bytes* at a time."""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                yield from Aisert._ndjson_chunks(file, chunk_bytes)
+            return
+        if hasattr(source, "read"):
+            tail = None
+            for block in iter(lambda: source.read(chunk_bytes), source.read(0)):
+                lines = (block if tail is None else tail + block).split(b"\n" if isinstance(block, bytes) else "\n")
+                tail = lines.pop()
+                yield lines
+            if tail:
+                yield [tail]
+            return
+        lines, size = [], 0
+        for line in source:
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_bytes:
+                yield lines
+                lines, size = [], 0
+        if lines:
+            yield lines
+
+    @staticmethod
+    def _dedupe_key(content):
+        """
+        Hashable key under which identical contents are validated once.
+
+        Structured content is keyed by its canonical JSON only when that JSON
+        represents it exactly; content that cannot be serialized, or would change
+        on the way (non-string keys, tuples, ``Decimal``...), gets a key of its own
+        so distinct rows are never merged.
+        """
+        if isinstance(content, (str, bytes)):
+            return content
+        try:
+            dumped = json.dumps(content, sort_keys=True)
+            if json.loads(dumped) == content:
+                return ("json", dumped)
+        except (TypeError, ValueError):
+            pass
+        return ("row", id(content))
+
     def _validate(self, validator, strict, *args, **kwargs):
         """
         Calls the validate method of validator and updates result.
+        In deferred mode the call is recorded and run by :meth:`collect` instead.
         :param validator: The validator instance.
         :param args: Positional arguments for the validator.
         :param kwargs: Keyword arguments for the validator.
         """
+        if self.deferred:
+            self._plan.append(Rule(self.status._order + len(self._plan), validator, strict, args, kwargs))
+            return
+        if self.fail_fast and any(result.status is False for result in self.status.validators.values()):
+            self.status.update(Result(validator.validator_name, None, "Skipped: an earlier rule already failed",
+                                      skipped=True))
+            return
+        self.status.update(self._run(validator, strict, *args, **kwargs))
+
+    def _run(self, validator, strict, *args, **kwargs) -> Result:
+        """
+        Runs validator and returns its result.
+        Validators report failures as results (see ``check``); an exception is
+        only built here, at the strict boundary.
+        """
+        check = getattr(type(validator), "check", None)
         try:
-            result = validator.validate(*args, **kwargs)
-            # self.logger.debug(f"{validator.validator_name} validation result: {result.status}")
+            if check is None:
+                result = validator.validate(*args, **kwargs)
+            else:
+                result = check(validator, *args, **kwargs)
         except AisertError as e:
             if strict:
-                self.logger.error(f"{validator.validator_name} validation failed")
+                self.logger.error("%s validation failed", validator.validator_name)
                 raise
-            else:
-                self.logger.error(f"{validator.validator_name} validation failed: {str(e)}")
-                result = Result(validator.validator_name, False, str(e))
-        self.status.update(result)
+            result = Result(validator.validator_name, False, str(e))
+        if result.status is False:
+            if strict:
+                self.logger.error("%s validation failed", validator.validator_name)
+                raise validator.error_class(result.reason)
+            self.logger.debug("%s validation failed: %s", validator.validator_name, result.reason)
+        return result
 
-    def collect(self):
+    def _run_plan(self):
+        """
+        Runs the recorded rules in concurrent waves and records results in plan order.
+        If a strict rule fails, the results finished so far are recorded and the
+        first failure in plan order within its wave is raised.
+        """
+        from .utils.async_util import get_executor
+
+        rules, self._plan = self._plan, []
+        plan = ExecutionPlan(rules, fail_fast=self.fail_fast)
+        try:
+            while True:
+                wave = plan.next_wave()
+                if not wave:
+                    break
+                if len(wave) == 1:
+                    plan.record(wave[0], self._run_rule(wave[0]))
+                    continue
+                futures = [(rule, get_executor().submit(self._run_rule, rule)) for rule in wave]
+                error = None
+                for rule, future in futures:
+                    try:
+                        plan.record(rule, future.result())
+                    except AisertError as e:
+                        error = error or e
+                if error is not None:
+                    raise error
+        finally:
+            for result in plan.results():
+                self.status.update(result)
+
+    def _run_rule(self, rule: Rule) -> Result:
+        return self._run(rule.validator, rule.strict, *rule.args, **rule.kwargs)
+
+    def collect(self, detail: str = "full"):
         """Finalize validation chain and return comprehensive results.
         
         This method must be called at the end of a validation chain to execute
         all queued validations and return the results.
         
-        :return: Validation report containing status and detailed results
-        :rtype: AisertReport
+        :param detail: ``"full"`` for an :class:`AisertReport`, or ``"status"`` for just the overall boolean
+        :type detail: str
+        :return: Validation report containing status and detailed results, or the status alone
+        :rtype: AisertReport | bool
+        :raises AisertError: If *detail* is not ``"full"`` or ``"status"``
         
         The returned :class:`AisertReport` contains:
         
         * ``status`` -- ``True`` if all validations passed, ``False`` otherwise
         * ``rules`` -- Dictionary mapping execution order to validation results
         
+        The per-rule dictionaries and reason strings are only built when
+        ``rules`` is read; ``detail="status"`` skips the report altogether.
+        
         Example usage::
         
             report = aisert.assert_contains(["test"]).collect()
@@ -208,12 +707,15 @@ class Aisert:
             else:
                 print(f"Failures: {report.rules}")
         
+            passed = Aisert(response).assert_contains(["refund"], strict=False).collect(detail="status")
+        
         .. versionadded:: 0.1.0
         """
-        results = {
-            "status": all(result.status for result in self.status.validators.values()),
-            "rules": {}
-        }
-        for k, v in self.status.validators.items():
-            results["rules"][k] = v.to_dict()
-        return AisertReport(**results)
+        if detail not in ("full", "status"):
+            raise AisertError(f"detail must be 'full' or 'status', got {detail!r}")
+        if self._plan:
+            self._run_plan()
+        status = all(result.status for result in self.status.validators.values())
+        if detail == "status":
+            return status
+        return AisertReport(status, results=dict(self.status.validators))
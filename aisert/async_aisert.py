@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Optional
+
+from .aisert import Aisert
+from .config.config import AisertConfig
+from .exception import AisertError
+from .models.plan import ExecutionPlan
+from .models.result import Result
+from .utils import async_util
+
+
+class AsyncAisert(Aisert):
+    """Asyncio variant of :class:`Aisert`.
+
+    Offers the same fluent ``assert_*`` methods, but the chain only records the
+    validations; they run when :meth:`collect` is awaited. Remote providers
+    (OpenAI embeddings, Anthropic and Google token counting, HuggingFace
+    inference) use their async clients, while model loading and CPU-bound
+    validators run on a managed executor so the event loop is never blocked.
+
+    The recorded rules are awaited concurrently, so a chain costs as much as its
+    slowest rule. Results keep the order of the ``assert_*`` calls, and strict
+    failures are raised from :meth:`collect`.
+
+    Example usage::
+
+        report = await (
+            AsyncAisert(response, config)
+            .assert_contains(["refund"])
+            .assert_tokens(200, strict=False)
+            .collect()
+        )
+
+    .. versionadded:: 0.2.0
+    """
+
+    logger = logging.getLogger("AsyncAisert")
+
+    def __init__(self, content, config: Optional[AisertConfig] = None, fail_fast: bool = False):
+        """Initialize AsyncAisert with content to validate.
+
+        Args:
+            content: Text, dict, or list to validate (typically LLM response)
+            config: Optional configuration for token counting and semantic models
+            fail_fast: If True, cheap rules run first and the rest are skipped after the first failure
+        """
+        super().__init__(content, config, deferred=True, fail_fast=fail_fast)
+
+    @staticmethod
+    def set_executor(executor: Executor):
+        """Use *executor* for model loading and CPU-bound validation work.
+
+        The previous executor is not shut down; that is left to its owner.
+        """
+        async_util.set_executor(executor)
+
+    @staticmethod
+    def shutdown_executor(wait: bool = True):
+        """Shut down the managed executor; a new one is created on next use."""
+        async_util.shutdown_executor(wait)
+
+    async def _arun(self, validator, strict, *args, **kwargs) -> Result:
+        """
+        Awaits validator and returns its result.
+        Failures are returned by ``acheck`` and only raised here when strict.
+        """
+        acheck = getattr(type(validator), "acheck", None)
+        try:
+            if acheck is None:
+                result = await validator.avalidate(*args, **kwargs)
+            else:
+                result = await acheck(validator, *args, **kwargs)
+        except AisertError as e:
+            if strict:
+                self.logger.error("%s validation failed", validator.validator_name)
+                raise
+            result = Result(validator.validator_name, False, str(e))
+        if result.status is False:
+            if strict:
+                self.logger.error("%s validation failed", validator.validator_name)
+                raise validator.error_class(result.reason)
+            self.logger.debug("%s validation failed: %s", validator.validator_name, result.reason)
+        return result
+
+    async def collect(self, detail: str = "full"):
+        """Run the recorded validations concurrently and return the results.
+
+        :param detail: ``"full"`` for an :class:`AisertReport`, or ``"status"`` for just the overall boolean
+        :return: Validation report containing status and detailed results, or the status alone
+        :rtype: AisertReport | bool
+        :raises AisertError: If a validation added with ``strict=True`` fails
+        """
+        if detail not in ("full", "status"):
+            raise AisertError(f"detail must be 'full' or 'status', got {detail!r}")
+        rules, self._plan = self._plan, []
+        plan = ExecutionPlan(rules, fail_fast=self.fail_fast)
+        try:
+            while True:
+                wave = plan.next_wave()
+                if not wave:
+                    break
+                outcomes = await asyncio.gather(
+                    *(self._arun(rule.validator, rule.strict, *rule.args, **rule.kwargs) for rule in wave),
+                    return_exceptions=True
+                )
+                error = None
+                for rule, outcome in zip(wave, outcomes):
+                    if isinstance(outcome, BaseException):
+                        error = error or outcome
+                    else:
+                        plan.record(rule, outcome)
+                if error is not None:
+                    raise error
+        finally:
+            for result in plan.results():
+                self.status.update(result)
+        return super().collect(detail)
@@ -14,6 +14,8 @@ class AisertConfig:
         token_encoding: Specific encoding for tokenization (OpenAI only)
         semantic_provider: Semantic similarity provider ("openai", "sentence_transformers", "tfidf")
         semantic_model: Model name for semantic similarity
+        semantic_options: Extra provider-specific options passed to the semantic provider
+            (e.g. ``{"intra_op_num_threads": 4}`` for the "onnx" provider)
     
     Example:
         >>> config = AisertConfig(
@@ -24,16 +26,18 @@ class AisertConfig:
         ... )
     """
 
+    logger = logging.getLogger("AisertConfig")
+    _default_config = None
+
     def __init__(self, token_provider: str = None, token_model: str = None, token_encoding: str = None,
-                 semantic_provider: str = None, semantic_model: str = None):
+                 semantic_provider: str = None, semantic_model: str = None, semantic_options: dict = None):
         self._token_provider = token_provider
         self._token_model = token_model
         self._token_encoding = token_encoding
 
         self._semantic_provider = semantic_provider
         self._semantic_model = semantic_model
-
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self._semantic_options = dict(semantic_options) if semantic_options else {}
 
     @property
     def token_provider(self):
@@ -55,6 +59,10 @@ class AisertConfig:
     def semantic_model(self):
         return self._semantic_model
 
+    @property
+    def semantic_options(self) -> dict:
+        return dict(self._semantic_options)
+
     def has_token_config(self) -> bool:
         """Check if token config is set."""
         return self._token_provider is not None
@@ -65,7 +73,7 @@ class AisertConfig:
 
     @classmethod
     def set_defaults(cls, token_provider: str = None, token_model: str = None, token_encoding: str = None,
-                     semantic_provider: str = None, semantic_model: str = None):
+                     semantic_provider: str = None, semantic_model: str = None, semantic_options: dict = None):
         """Set global default configuration values.
         
         Args:
@@ -74,9 +82,12 @@ class AisertConfig:
             token_encoding: Default token encoding
             semantic_provider: Default semantic similarity provider
             semantic_model: Default semantic similarity model
+            semantic_options: Default provider-specific options for the semantic provider;
+                replaces the previous options (pass ``{}`` to clear them)
         
         Example:
             >>> AisertConfig.set_defaults(token_provider="anthropic", token_model="claude-3")
+            >>> AisertConfig.set_defaults(semantic_provider="onnx", semantic_options={"intra_op_num_threads": 4})
         """
         if token_provider:
             DefaultConfig.token_provider = token_provider
@@ -88,11 +99,16 @@ class AisertConfig:
             DefaultConfig.semantic_provider = semantic_provider
         if semantic_model:
             DefaultConfig.semantic_model = semantic_model
+        if semantic_options is not None:
+            DefaultConfig.semantic_options = dict(semantic_options)
+        cls._default_config = None
 
     @classmethod
     def get_default_config(cls) -> "AisertConfig":
         """Get default configuration with all default values applied.
         
+        The instance is cached and shared until :meth:`set_defaults` changes the defaults.
+        
         Returns:
             AisertConfig: Configuration instance with default values
         
@@ -101,7 +117,10 @@ class AisertConfig:
             >>> print(config.token_provider)
             openai
         """
-        return DefaultConfig.apply_all_defaults(cls)
+        config = cls._default_config
+        if config is None:
+            config = cls._default_config = DefaultConfig.apply_all_defaults(cls)
+        return config
 
     def __repr__(self):
         parts = []
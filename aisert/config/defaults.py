@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 
 
 class DefaultConfig:
@@ -13,11 +13,12 @@ class DefaultConfig:
     token_provider: str = "openai"
     semantic_provider: str = "openai"
     semantic_model: str = "text-embedding-3-small"
+    semantic_options: Dict[str, Any] = {}
     
 
 
     @staticmethod
-    def to_dict() -> Dict[str, str]:
+    def to_dict() -> Dict[str, Any]:
         """
         Converts the DefaultConfig to a dictionary.
         :return: A dictionary containing the default configuration values.
@@ -28,6 +29,7 @@ class DefaultConfig:
             "token_provider": DefaultConfig.token_provider,
             "semantic_provider": DefaultConfig.semantic_provider,
             "semantic_model": DefaultConfig.semantic_model,
+            "semantic_options": dict(DefaultConfig.semantic_options),
         }
 
     @staticmethod
@@ -38,5 +40,6 @@ class DefaultConfig:
             token_model=DefaultConfig.token_model,
             token_encoding=DefaultConfig.token_encoding,
             semantic_provider=DefaultConfig.semantic_provider,
-            semantic_model=DefaultConfig.semantic_model
+            semantic_model=DefaultConfig.semantic_model,
+            semantic_options=DefaultConfig.semantic_options
         )
@@ -26,3 +26,8 @@ class ContainsValidationError(AisertError):
 class NotContainsValidationError(AisertError):
     """Text not contains validation errors"""
     pass
+
+
+class PathValidationError(AisertError):
+    """JSONPath assertion errors"""
+    pass
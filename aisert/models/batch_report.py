@@ -0,0 +1,63 @@
+from typing import Dict, List, Tuple
+
+
+class BatchReport:
+    """Columnar validation report returned by :meth:`Aisert.validate_many`.
+
+    Instead of one :class:`AisertReport` per row, outcomes are stored as NumPy
+    arrays with one row per content and one column per rule (column ``j`` is
+    rule order ``j + 1``), plus a bounded sample of failure reasons.
+
+    :param validators: Validator name of each rule, in rule order
+    :type validators: list
+    :param passed: Boolean array of shape ``(rows, rules)``
+    :param scores: Float array of shape ``(rows, rules)``; ``nan`` where the validator reports no score
+    :param skipped: Boolean array of shape ``(rows, rules)``; ``True`` where a dependency did not pass
+    :param failures: Up to ``max_failure_samples`` ``(row, reason)`` pairs per rule order, earliest rows first
+    :type failures: dict
+
+    Example usage::
+
+        report = Aisert.validate_many(responses, rules)
+        print(report.pass_rate, report.pass_rates)
+        failed_rows = (~report.status).nonzero()[0]
+        for row, reason in report.failures[1]:
+            print(row, reason)
+
+    .. versionadded:: 0.2.0
+    """
+
+    __slots__ = ("validators", "passed", "scores", "skipped", "failures", "status")
+
+    def __init__(self, validators: List[str], passed, scores, skipped, failures: Dict[int, List[Tuple[int, str]]]):
+        self.validators = validators
+        self.passed = passed
+        self.scores = scores
+        self.skipped = skipped
+        self.failures = failures
+        self.status = passed.all(axis=1)
+
+    @property
+    def size(self) -> int:
+        """Number of validated rows."""
+        return len(self.status)
+
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of rows that passed every rule."""
+        return float(self.status.mean()) if self.size else 1.0
+
+    @property
+    def pass_rates(self):
+        """Fraction of rows that passed each rule, as an array indexed by column."""
+        return self.passed.sum(axis=0) / max(self.size, 1)
+
+    def __str__(self) -> str:
+        """Human-readable summary with the pass rate of every rule.
+
+        :return: Formatted string showing rows, overall and per-rule pass rates
+        :rtype: str
+        """
+        rates = ", ".join(f"{order}: {name} {rate:.3f}"
+                          for order, (name, rate) in enumerate(zip(self.validators, self.pass_rates.tolist()), 1))
+        return f"Rows: {self.size} \n Pass rate: {self.pass_rate:.3f} \n Rules: {rates}"
@@ -0,0 +1,96 @@
+import json
+from typing import Any, Callable, Hashable
+
+
+class ContentView:
+    """
+    Content under validation plus lazily derived forms of it, shared by the validators of one chain.
+
+    Each :class:`~aisert.Aisert` instance wraps its content in a view and hands
+    the view to its validators, so work such as parsing JSON, serializing
+    dict content, counting tokens or embedding the text is done once per chain
+    instead of once per validator. Validators called directly with plain
+    content still work; they only get the caching when given a view.
+
+    Views are filled on first use. Concurrent rules (deferred mode) may compute
+    the same value twice, but all of them see the first stored value.
+
+    Example:
+        view = ContentView('{"answer": "yes"}')
+        view.json()    # parsed once
+        view.text      # the string itself; dict/list content is JSON-serialized once
+        view.derived(("tokens", counter), lambda: counter.count(view.text))
+    """
+
+    __slots__ = ("content", "_cache")
+
+    def __init__(self, content: Any):
+        """
+        Args:
+            content: Text, dict, or list under validation
+        """
+        self.content = content
+        self._cache = {}
+
+    @staticmethod
+    def unwrap(content: Any) -> Any:
+        """Return the raw content of a view, or ``content`` itself if it is not a view."""
+        return content.content if type(content) is ContentView else content
+
+    @staticmethod
+    def parse(content: Any) -> Any:
+        """
+        Return the parsed JSON of ``content``, through the view's cache if it is a view.
+
+        Raises:
+            ValueError: If text content is not valid JSON
+        """
+        if type(content) is ContentView:
+            return content.json()
+        if isinstance(content, (str, bytes, bytearray)):
+            return json.loads(content)
+        return content
+
+    def derived(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the value cached under ``key``, computing it on first request.
+
+        Args:
+            key: Cache key, e.g. ``("tokens", provider)`` or ``("embedding", provider)``
+            compute: Zero-argument callable producing the value
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            return self._cache.setdefault(key, compute())
+
+    @property
+    def text(self) -> str:
+        """Text form of the content: the string itself, or dict/list content serialized as JSON."""
+        content = self.content
+        if isinstance(content, str):
+            return content
+        return self.derived("text", lambda: json.dumps(content))
+
+    def json(self) -> Any:
+        """
+        Parsed JSON form of the content; dict/list content is returned as is.
+
+        Raises:
+            ValueError: ``json.JSONDecodeError`` if text content is not valid JSON, or ``UnicodeDecodeError``
+                for bytes that are not UTF-8 (the failure is cached too)
+        """
+        content = self.content
+        if not isinstance(content, (str, bytes, bytearray)):
+            return content
+        value, error = self.derived("json", lambda: self._parse(content))
+        if error is not None:
+            raise error
+        return value
+
+    @staticmethod
+    def _parse(content):
+        try:
+            return json.loads(content), None
+        except ValueError as e:
+            return None, e.with_traceback(None)
@@ -0,0 +1,71 @@
+from typing import List, Tuple
+
+
+class NdjsonReport:
+    """Per-line schema report returned by :meth:`Aisert.validate_ndjson`.
+
+    Holds one boolean per line rather than one :class:`AisertReport` per line,
+    plus a bounded sample of failure reasons, so its size does not depend on
+    the length of the lines.
+
+    :param passed: Boolean array with one entry per line; blank lines count as passed
+    :param blank: Boolean array with one entry per line; ``True`` for empty or whitespace-only lines,
+        which are not validated
+    :param failures: Up to ``max_failure_samples`` ``(line_number, reason)`` pairs, 1-based, earliest lines first
+    :type failures: list
+
+    Example usage::
+
+        report = Aisert.validate_ndjson("outputs.ndjson", Answer)
+        print(report.pass_rate, report.failed_lines[:10])
+        for line_number, reason in report.failures:
+            print(line_number, reason)
+
+    .. versionadded:: 0.2.0
+    """
+
+    __slots__ = ("passed", "blank", "failures")
+
+    def __init__(self, passed, blank, failures: List[Tuple[int, str]]):
+        self.passed = passed
+        self.blank = blank
+        self.failures = failures
+
+    @property
+    def status(self) -> bool:
+        """``True`` if every line passed."""
+        return bool(self.passed.all())
+
+    @property
+    def size(self) -> int:
+        """Number of lines read, blank lines included."""
+        return len(self.passed)
+
+    @property
+    def validated(self) -> int:
+        """Number of non-blank lines validated."""
+        return self.size - int(self.blank.sum())
+
+    @property
+    def failed(self) -> int:
+        """Number of lines that failed validation."""
+        return self.size - int(self.passed.sum())
+
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of validated lines that passed."""
+        validated = self.validated
+        return 1.0 - self.failed / validated if validated else 1.0
+
+    @property
+    def failed_lines(self):
+        """1-based numbers of the failed lines, as an array."""
+        return (~self.passed).nonzero()[0] + 1
+
+    def __str__(self) -> str:
+        """Human-readable summary.
+
+        :return: Formatted string showing lines, failures and the pass rate
+        :rtype: str
+        """
+        return f"Lines: {self.validated} \n Failed: {self.failed} \n Pass rate: {self.pass_rate:.3f}"
@@ -0,0 +1,108 @@
+from typing import Dict, List
+
+from .result import Result
+
+
+class Rule:
+    """
+    A validation recorded by a deferred :class:`~aisert.Aisert` chain.
+
+    Attributes:
+        order: Position of the rule in the report (matches AisertStatus numbering)
+        validator: Validator instance that runs the rule
+        strict: Whether a failure raises
+        args: Positional arguments for the validator
+        kwargs: Keyword arguments for the validator
+        depends_on: Orders of rules that must pass before this rule runs
+    """
+
+    def __init__(self, order: int, validator, strict: bool, args: tuple, kwargs: dict):
+        self.order = order
+        self.validator = validator
+        self.strict = strict
+        self.args = args
+        self.kwargs = kwargs
+        self.depends_on = ()
+
+    @property
+    def cost(self) -> int:
+        """Relative cost declared by the validator (cheaper rules run first when failing fast)."""
+        return getattr(self.validator, "cost", 1)
+
+
+class ExecutionPlan:
+    """
+    Schedules recorded rules into waves that can run concurrently.
+
+    A rule is ready once all the rules it depends on have finished. Rules whose
+    dependencies did not pass are skipped. With ``fail_fast`` each wave holds
+    only the cheapest ready rules, and everything left is skipped as soon as a
+    rule fails, because the overall status is then already known.
+
+    Example:
+        plan = ExecutionPlan(rules, fail_fast=True)
+        while True:
+            wave = plan.next_wave()
+            if not wave:
+                break
+            for rule in wave:
+                plan.record(rule, run(rule))
+        ordered = plan.results()
+    """
+
+    def __init__(self, rules: List[Rule], fail_fast: bool = False):
+        self.fail_fast = fail_fast
+        self._pending = sorted(rules, key=lambda r: (r.cost, r.order)) if fail_fast else list(rules)
+        self._orders = sorted(rule.order for rule in rules)
+        self._results: Dict[int, Result] = {}
+        self._failed = False
+
+    def record(self, rule: Rule, result: Result):
+        self._results[rule.order] = result
+        if result.status is False:
+            self._failed = True
+
+    def _skip(self, rule: Rule, reason: str):
+        self._results[rule.order] = Result(rule.validator.validator_name, None, reason, skipped=True)
+
+    def next_wave(self) -> List[Rule]:
+        """Return the next rules to run, recording skips; empty when the plan is finished."""
+        while self._pending:
+            if self.fail_fast and self._failed:
+                for rule in self._pending:
+                    self._skip(rule, "Skipped: an earlier rule already failed")
+                self._pending = []
+                break
+
+            ready, blocked = [], []
+            for rule in self._pending:
+                deps = [self._results.get(order) for order in rule.depends_on]
+                if any(dep is not None and dep.status is not True for dep in deps):
+                    self._skip(rule, f"Skipped: depends on rules {list(rule.depends_on)} which did not all pass")
+                elif all(dep is not None for dep in deps):
+                    ready.append(rule)
+                else:
+                    blocked.append(rule)
+
+            if self.fail_fast and ready:
+                cheapest = min(rule.cost for rule in ready)
+                blocked = [rule for rule in ready if rule.cost != cheapest] + blocked
+                ready = [rule for rule in ready if rule.cost == cheapest]
+                blocked.sort(key=lambda r: (r.cost, r.order))
+
+            self._pending = blocked
+            if ready:
+                return ready
+            for rule in blocked:
+                self._skip(rule, f"Skipped: dependencies {list(rule.depends_on)} never ran")
+            self._pending = []
+        return []
+
+    def results(self) -> List[Result]:
+        """Results in report order, up to the first rule that has not finished (e.g. after a strict failure)."""
+        results = []
+        for order in self._orders:
+            if order not in self._results:
+                break
+            results.append(self._results[order])
+        return results
@@ -1,3 +1,8 @@
+from typing import Dict, Optional
+
+from .result import Result
+
+
 class AisertReport:
     """Final validation report containing overall status and detailed results.
     
@@ -11,7 +16,14 @@ class AisertReport:
     
     The ``rules`` dictionary has the format::
     
-        {1: {'validator': 'ContainsValidator', 'status': True, 'reason': '...'}}
+        {1: {'validator': 'ContainsValidator', 'status': True, 'reason': '...', 'skipped': False}}
+    
+    Skipped rules (fail-fast or unmet dependencies) have ``'status': None`` and ``'skipped': True``.
+    Rules also carry ``'score'`` and ``'count'`` when the validator reported them.
+    
+    Reports built by :meth:`Aisert.collect` hold the :class:`Result` objects and
+    only build the ``rules`` dictionaries (and format reasons) when accessed;
+    :attr:`results` gives the typed results without any formatting.
     
     Example usage::
     
@@ -24,16 +36,36 @@ class AisertReport:
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, status: bool, rules: dict):
+    __slots__ = ("status", "_rules", "_results")
+
+    def __init__(self, status: bool, rules: Optional[dict] = None, results: Optional[Dict[int, Result]] = None):
         """Create a new validation report.
         
         :param status: Overall validation status (``True`` if all passed)
         :type status: bool
         :param rules: Dictionary of validation results keyed by execution order
         :type rules: dict
+        :param results: :class:`Result` objects keyed by execution order; ``rules`` is built from them on first access
+        :type results: dict
         """
         self.status = status
-        self.rules = rules
+        self._rules = rules
+        self._results = results
+
+    @property
+    def rules(self) -> dict:
+        """Per-rule dictionaries keyed by execution order, built on first access."""
+        rules = self._rules
+        if rules is None:
+            rules = self._rules = {order: result.to_dict() for order, result in (self._results or {}).items()}
+        return rules
+
+    @property
+    def results(self) -> Dict[int, Result]:
+        """:class:`Result` objects keyed by execution order, with typed ``status``/``score``/``count`` fields."""
+        if self._results is None:
+            return {}
+        return self._results
 
     def __str__(self) -> str:
         """Human-readable string representation of the validation report.
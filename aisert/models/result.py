@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Dict
+from typing import Any, Dict, Optional
 
 from ..models.validator_enums import ValidatorEnums
 
@@ -10,40 +10,79 @@ class Result:
     
     Each Result contains:
     - validator: Name of the validator that produced this result
-    - status: Boolean indicating if validation passed (True) or failed (False)
+    - status: Boolean indicating if validation passed (True) or failed (False);
+      ``None`` when the rule was skipped
     - reason: Human-readable explanation of the validation outcome
+    - skipped: True if the rule was not run (fail-fast or an unmet dependency)
+    - score: Numeric score behind the outcome (e.g. semantic similarity), if any
+    - count: Count behind the outcome (e.g. tokens, missing items, schema errors), if any
+    
+    The reason can be given as a ``%``-style template plus ``args``; it is only
+    formatted the first time it is read, so results that are never inspected
+    cost no string formatting.
     
     Example:
         result = Result("ContainsValidator", True, "Found all required items")
+        result = Result("TokenValidator", False, "Token count %d exceeds limit %d", args=(150, 100), count=150)
     """
 
-    def __init__(self, validator: str, status: bool, reason: str = ""):
+    __slots__ = ("validator", "status", "skipped", "score", "count", "_reason")
+
+    def __init__(self, validator: str, status: bool, reason: str = "", skipped: bool = False, *,
+                 args: tuple = (), score: Optional[float] = None, count: Optional[int] = None):
         """
         Create a new validation result.
         
         Args:
             validator: Name of the validator that produced this result
             status: True if validation passed, False if it failed
-            reason: Human-readable explanation of why validation passed/failed
+            reason: Human-readable explanation of why validation passed/failed,
+                or a ``%``-style template when ``args`` are given
+            skipped: True if the rule was skipped instead of run
+            args: Arguments for the reason template
+            score: Numeric score behind the outcome
+            count: Count behind the outcome
         
         Example:
             result = Result("TokenValidator", False, "Token count 150 exceeds limit 100")
         """
         self.validator = validator
         self.status = status
-        self.reason = reason
+        self.skipped = skipped
+        self.score = score
+        self.count = count
+        # A pending template is kept as one (template, args) tuple so concurrent readers never see half an update
+        self._reason = (reason, args) if args else reason
+
+    @property
+    def reason(self) -> str:
+        """Human-readable explanation, formatted from the template on first access."""
+        reason = self._reason
+        if type(reason) is tuple:
+            reason = self._reason = reason[0] % reason[1]
+        return reason
 
-    def to_dict(self) -> Dict[str, str]:
+    @reason.setter
+    def reason(self, value: str):
+        self._reason = value
+
+    def to_dict(self) -> Dict[str, Any]:
         """
         Convert the Result to a dictionary for serialization or reporting.
         
         Returns:
-            Dictionary with 'validator', 'status', and 'reason' keys
+            Dictionary with 'validator', 'status', 'reason' and 'skipped' keys, plus
+            'score' and 'count' when the validator reported them
         
         Example:
-            {"validator": "ContainsValidator", "status": True, "reason": "All items found"}
+            {"validator": "ContainsValidator", "status": True, "reason": "All items found", "skipped": False}
         """
-        return {"validator": self.validator, "status": self.status, "reason": self.reason}
+        result = {"validator": self.validator, "status": self.status, "reason": self.reason, "skipped": self.skipped}
+        if self.score is not None:
+            result["score"] = self.score
+        if self.count is not None:
+            result["count"] = self.count
+        return result
 
 
 class AisertStatus:
@@ -66,6 +105,8 @@ class AisertStatus:
         # status.validators = {1: Result(...), 2: Result(...)}
     """
 
+    __slots__ = ("validators", "_order")
+
     def __init__(self):
         """
         Initialize an empty status tracker.
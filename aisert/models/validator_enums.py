@@ -10,6 +10,7 @@ class ValidatorEnums(Enum):
     NOT_CONTAINS = "NotContainsValidator"
     TOKENS = "TokenValidator"
     SEMANTIC = "SemanticValidator"
+    PATH = "PathValidator"
 
 
     @classmethod
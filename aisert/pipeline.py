@@ -0,0 +1,86 @@
+from typing import List, Optional
+
+from .aisert import Aisert
+from .config.config import AisertConfig
+from .models.plan import Rule
+from .models.result import Result
+
+
+class _Step:
+    """A recorded rule with everything but the content bound by its validator's ``prepare``."""
+
+    __slots__ = ("order", "strict", "depends_on", "validator_name", "error_class", "_check")
+
+    def __init__(self, rule: Rule):
+        self.order = rule.order
+        self.strict = rule.strict
+        self.depends_on = rule.depends_on
+        self.validator_name = rule.validator.validator_name
+        self.error_class = rule.validator.error_class
+        self._check = rule.validator.prepare(*rule.args[1:], **rule.kwargs)
+
+    def check(self, content) -> Result:
+        return self._check(content)
+
+
+class Pipeline:
+    """Validation chain compiled once and run per content.
+
+    Created with :meth:`Aisert.compile` from a rule set recorded with
+    :meth:`Aisert.rules`. Compiling validates the rule arguments, resolves the
+    token and semantic providers from the config (loading models), builds the
+    schema adapters and embeds the semantic reference texts, so :meth:`run`
+    only does per-content work.
+
+    A pipeline holds no per-run state and is safe to call from many threads.
+    Rules run in the order they were recorded; ``strict`` rules raise as in an
+    immediate chain, and :meth:`Aisert.depends_on` is honoured.
+
+    Example usage::
+
+        pipeline = (
+            Aisert.rules(config)
+            .assert_contains(["refund"])
+            .assert_tokens(200, strict=False)
+            .assert_semantic_matches("refund policy", threshold=0.7, strict=False)
+            .compile()
+        )
+        report = pipeline.run(response)
+
+    .. versionadded:: 0.2.0
+    """
+
+    def __init__(self, rules: List[Rule], config: Optional[AisertConfig] = None, fail_fast: bool = False):
+        """Compile recorded rules.
+
+        :param rules: Rules recorded by a deferred chain
+        :param config: Configuration used by the runs (token and semantic settings)
+        :param fail_fast: If True, rules after the first failure are skipped
+        :raises AisertError: If a rule's arguments are invalid or its provider cannot be loaded
+        """
+        self.config = config if config is not None else AisertConfig.get_default_config()
+        self.fail_fast = fail_fast
+        self._steps = tuple(_Step(rule) for rule in rules)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def run(self, content, detail: str = "full"):
+        """Validate one content with the compiled rules.
+
+        :param content: Text, dict, or list to validate
+        :param detail: ``"full"`` for an :class:`AisertReport`, or ``"status"`` for just the overall boolean
+        :return: Validation report, or the status alone
+        :rtype: AisertReport | bool
+        :raises AisertError: If a rule compiled with ``strict=True`` fails
+        """
+        chain = Aisert(content, self.config, fail_fast=self.fail_fast)
+        results = chain.status.validators
+        for step in self._steps:
+            if step.depends_on and any(results[order].status is not True for order in step.depends_on):
+                chain.status.update(Result(step.validator_name, None,
+                                           f"Skipped: depends on rules {list(step.depends_on)} which did not all pass",
+                                           skipped=True))
+                continue
+            chain._validate(step, step.strict, chain._view)
+        return chain.collect(detail)
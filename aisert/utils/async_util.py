@@ -0,0 +1,77 @@
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+_executor = None
+_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """
+    Return the executor used for blocking and CPU-bound work from async code.
+
+    A thread pool is created on first use unless one was installed with :func:`set_executor`.
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="aisert")
+        return _executor
+
+
+def set_executor(executor: Executor):
+    """
+    Replace the executor used by async validation.
+
+    The previous executor is not shut down; that is left to its owner.
+    """
+    global _executor
+    with _lock:
+        _executor = executor
+
+
+def shutdown_executor(wait: bool = True):
+    """Shut down the managed executor; a new one is created on next use."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+async def run_sync(func, *args, **kwargs):
+    """Run a blocking callable on the managed executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+class LoopClient:
+    """
+    Lazily created async client bound to the running event loop.
+
+    Async HTTP clients pool connections on the loop that opened them, so one
+    client shared across ``asyncio.run`` calls fails with "Event loop is
+    closed". :meth:`get` returns the client created for the running loop and
+    creates a new one when called from another loop; only the latest is kept.
+    """
+
+    def __init__(self, factory):
+        """
+        Args:
+            factory: Zero-argument callable creating the client
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._loop = None
+        self._client = None
+
+    def get(self):
+        """Return the client for the running event loop, creating it on first use in that loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is None or self._loop() is not loop:
+                self._client = self._factory()
+                self._loop = weakref.ref(loop)
+            return self._client
@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe, bounded least-recently-used cache.
+
+    Values are built outside the lock by :meth:`get_or_create`, so a slow build
+    does not block lookups of other keys; two threads missing the same key at
+    once may both build it, and the first stored value wins.
+
+    Example:
+        adapters = LRUCache(max_entries=256)
+        adapter = adapters.get_or_create(Model, lambda: TypeAdapter(Model))
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store ``value`` unless ``key`` is already cached; returns the cached value."""
+        if self.max_entries <= 0:
+            return value
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.put(key, factory())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,145 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CompactEmbeddings:
+    """
+    A block of embeddings stored in a compact format.
+
+    Vectors are optionally truncated to their leading ``dimensions`` (for
+    Matryoshka-trained models), L2-normalized, then stored as:
+
+    - ``float32`` -- unchanged (4 bytes per value)
+    - ``float16`` -- half precision (2 bytes per value)
+    - ``int8`` -- symmetric per-vector quantization with one float32 scale per vector (1 byte per value)
+
+    Similarities are computed directly on the stored format in blocks, so the
+    full float32 matrix is never materialized.
+
+    Example:
+        store = CompactEmbeddings.encode(vectors, dtype="int8", dimensions=512)
+        scores = store.similarity(query_vector)
+    """
+
+    DTYPES = ("float32", "float16", "int8")
+    BLOCK_ROWS = 65536
+
+    def __init__(self, data: np.ndarray, scales: np.ndarray = None):
+        """
+        Wrap already-encoded data.
+
+        :param data: 2-D array of encoded vectors (float32, float16 or int8).
+        :param scales: Per-vector float32 scales, required for int8 data.
+        """
+        if data.dtype == np.int8 and scales is None:
+            raise ValueError("int8 embeddings require per-vector scales")
+        self.data = data
+        self.scales = scales
+
+    @classmethod
+    def encode(cls, vectors, dtype: str = "float16", dimensions: int = None) -> "CompactEmbeddings":
+        """
+        Encode float vectors into the compact format.
+
+        :param vectors: 1-D or 2-D array-like of float vectors.
+        :param dtype: Storage type: "float32", "float16" or "int8".
+        :param dimensions: Keep only the leading dimensions (Matryoshka truncation).
+        :return: Encoded embeddings.
+        """
+        if dtype not in cls.DTYPES:
+            raise ValueError(f"dtype must be one of {cls.DTYPES}, got {dtype!r}")
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if dimensions:
+            vectors = vectors[:, :dimensions]
+        vectors = vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+
+        if dtype == "int8":
+            scales = np.clip(np.abs(vectors).max(axis=1), 1e-12, None) / 127.0
+            data = np.round(vectors / scales[:, None]).astype(np.int8)
+            return cls(data, scales.astype(np.float32))
+        return cls(vectors.astype(dtype))
+
+    @property
+    def dtype(self) -> str:
+        return self.data.dtype.name
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the encoded vectors and scales."""
+        return self.data.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def decode(self) -> np.ndarray:
+        """Return the vectors as (approximately unit-length) float32."""
+        if self.scales is not None:
+            return self.data.astype(np.float32) * self.scales[:, None]
+        return self.data.astype(np.float32)
+
+    def similarity(self, query) -> np.ndarray:
+        """
+        Cosine similarity between every stored vector and ``query``.
+
+        :param query: A float vector, or a single-row :class:`CompactEmbeddings`.
+        :return: float32 array of shape (len(self),).
+        """
+        if isinstance(query, CompactEmbeddings):
+            query = query.decode()[0]
+        else:
+            query = np.asarray(query, dtype=np.float32)[:self.data.shape[1]]
+            query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        scores = np.empty(len(self), dtype=np.float32)
+        for start in range(0, len(self), self.BLOCK_ROWS):
+            block = self.data[start:start + self.BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+
+class EmbeddingCache:
+    """
+    Thread-safe, bounded LRU cache of text embeddings kept in compact form.
+
+    Example:
+        cache = EmbeddingCache(max_entries=100_000, dtype="int8")
+        cache.put("hello", vector)
+        cache.get("hello")  # -> CompactEmbeddings with one row
+    """
+
+    def __init__(self, max_entries: int = 10000, dtype: str = "float16", dimensions: int = None):
+        self.max_entries = max_entries
+        self.dtype = dtype
+        self.dimensions = dimensions
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str):
+        with self._lock:
+            entry = self._entries.get(text)
+            if entry is not None:
+                self._entries.move_to_end(text)
+            return entry
+
+    def put(self, text: str, vector) -> "CompactEmbeddings":
+        entry = CompactEmbeddings.encode(vector, dtype=self.dtype, dimensions=self.dimensions)
+        if self.max_entries <= 0:
+            return entry
+        with self._lock:
+            self._entries[text] = entry
+            self._entries.move_to_end(text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(entry.nbytes for entry in self._entries.values())
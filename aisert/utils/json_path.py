@@ -0,0 +1,163 @@
+import re
+from typing import Any, Iterator, Tuple
+
+from .cache_util import LRUCache
+
+
+class JsonPath:
+    """
+    A JSONPath expression compiled into a chain of lazy steps.
+
+    Supported syntax: ``$`` (root), ``.name`` and ``['name']`` (member),
+    ``[0]`` / ``[-1]`` (index), ``[1:3]`` (slice), ``.*`` / ``[*]``
+    (every member or item) and ``..`` (the node and all its descendants,
+    e.g. ``$..price``). Filter expressions are not supported.
+
+    Matches are produced one at a time, so a caller that stops at the first
+    match (or first violation) never walks the rest of the document. Each
+    match comes with its location, rendered only on request.
+
+    Example:
+        path = JsonPath.compile("$.items[*].price")
+        prices = [value for _, value in path.find({"items": [{"price": 3}, {"price": 5}]})]
+        JsonPath.location(next(path.find(document))[0])  # "$.items[0].price"
+    """
+
+    _compiled = LRUCache(max_entries=1024)
+
+    _NAME = re.compile(r"[A-Za-z_][\w-]*|\*")
+    _BRACKET = re.compile(r"""\[\s*(?:
+        (?P<quoted>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<slice>-?\d*\s*:\s*-?\d*)
+      | (?P<index>-?\d+)
+      | (?P<star>\*)
+    )\s*\]""", re.VERBOSE)
+    _ESCAPE = re.compile(r"\\(.)")
+    _IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+    __slots__ = ("path", "_steps")
+
+    def __init__(self, path: str):
+        """
+        Compile a path; prefer :meth:`compile`, which caches compiled paths.
+
+        :param path: JSONPath expression starting with ``$``.
+        :raises ValueError: If the expression is not valid or uses unsupported syntax.
+        """
+        self.path = path
+        self._steps = tuple(self._parse(path))
+
+    @classmethod
+    def compile(cls, path: str) -> "JsonPath":
+        """Return the compiled path, compiling it once per expression."""
+        return cls._compiled.get_or_create(path, lambda: cls(path))
+
+    def find(self, document: Any) -> Iterator[Tuple[tuple, Any]]:
+        """
+        Yields ``(location, value)`` for each match in document order.
+
+        :param document: Parsed JSON (dicts, lists and scalars).
+        """
+        nodes = iter((((), document),))
+        for step in self._steps:
+            nodes = step(nodes)
+        return nodes
+
+    @staticmethod
+    def location(location: tuple) -> str:
+        """Render a match location as a path, e.g. ``$.items[2].price``."""
+        parts = []
+        while location:
+            location, key = location
+            if type(key) is int:
+                parts.append(f"[{key}]")
+            elif JsonPath._IDENTIFIER.fullmatch(key):
+                parts.append(f".{key}")
+            else:
+                parts.append("[%r]" % key)
+        return "$" + "".join(reversed(parts))
+
+    def _parse(self, path: str):
+        if not path.startswith("$"):
+            raise ValueError(f"Invalid JSONPath {path!r}: must start with '$'")
+        pos, end = 1, len(path)
+        while pos < end:
+            if path.startswith("..", pos):
+                yield _descendants
+                pos += 2
+                if pos < end and path[pos] == "[":
+                    continue
+                name = self._NAME.match(path, pos)
+            elif path[pos] == ".":
+                name = self._NAME.match(path, pos + 1)
+            elif path[pos] == "[":
+                bracket = self._BRACKET.match(path, pos)
+                if bracket is None:
+                    raise ValueError(f"Invalid JSONPath {path!r} at position {pos}")
+                yield self._bracket_step(bracket)
+                pos = bracket.end()
+                continue
+            else:
+                name = None
+            if name is None:
+                raise ValueError(f"Invalid JSONPath {path!r} at position {pos}")
+            yield _wildcard if name.group() == "*" else _member(name.group())
+            pos = name.end()
+
+    def _bracket_step(self, bracket):
+        if bracket.group("quoted"):
+            return _member(self._ESCAPE.sub(r"\1", bracket.group("quoted")[1:-1]))
+        if bracket.group("index"):
+            return _index(int(bracket.group("index")))
+        if bracket.group("slice"):
+            start, stop = (int(part) if part.strip() else None for part in bracket.group("slice").split(":"))
+            return _slice(slice(start, stop))
+        return _wildcard
+
+
+def _member(key: str):
+    def step(nodes):
+        for location, value in nodes:
+            if isinstance(value, dict) and key in value:
+                yield (location, key), value[key]
+    return step
+
+
+def _index(index: int):
+    def step(nodes):
+        for location, value in nodes:
+            if isinstance(value, list) and -len(value) <= index < len(value):
+                yield (location, index % len(value)), value[index]
+    return step
+
+
+def _slice(items: slice):
+    def step(nodes):
+        for location, value in nodes:
+            if isinstance(value, list):
+                for index in range(*items.indices(len(value))):
+                    yield (location, index), value[index]
+    return step
+
+
+def _wildcard(nodes):
+    for location, value in nodes:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                yield (location, key), item
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                yield (location, index), item
+
+
+def _descendants(nodes):
+    """Each node followed by all its descendants, depth first in document order."""
+    for location, value in nodes:
+        stack = [(location, value)]
+        while stack:
+            location, value = stack.pop()
+            yield location, value
+            if isinstance(value, dict):
+                stack.extend(((location, key), value[key]) for key in reversed(value.keys()))
+            elif isinstance(value, list):
+                stack.extend(((location, index), value[index]) for index in range(len(value) - 1, -1, -1))
@@ -0,0 +1,192 @@
+import re
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+class JsonUtil:
+    """
+    Locates JSON embedded in model output: inside markdown fences or surrounded by prose.
+
+    Spans are found in a forward scan. Compiled patterns jump between
+    brackets, and strings inside a candidate are consumed whole so brackets in
+    them are ignored. A mismatched bracket abandons the candidate and resumes
+    from that point; a candidate that never closes (a stray ``{`` or ``[`` in
+    prose, or a stray quote inside one) is abandoned and the scan resumes just
+    after its opener, skipping openers already known never to close.
+
+    Example:
+        text = 'Sure! Here it is:\\n```json\\n{"answer": "yes"}\\n```'
+        JsonUtil.extract(text)  # '{"answer": "yes"}'
+    """
+
+    FENCE = "```"
+    JSON_FENCE_TAGS = ("", "json", "jsonc", "json5")
+
+    _OPEN = re.compile(r"[\[{]")
+    # inside a candidate: a whole string (unrolled, so it cannot backtrack catastrophically),
+    # a bracket, or a lone quote that starts an unterminated string
+    _TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]', re.DOTALL)
+    # "[" only opens a candidate when followed by a JSON value, so "[note]" in prose is skipped
+    _ARRAY_VALUE = re.compile(r'\s*(?:[\[\]{"\-0-9]|true\b|false\b|null\b)')
+    _OPENER = {"}": "{", "]": "["}
+
+    @staticmethod
+    def extract(text: str) -> Optional[str]:
+        """
+        Returns the first JSON object or array found in the text, or None.
+
+        :param text: Model output, possibly with markdown fences or prose around the JSON.
+        :return: The JSON text, not parsed or validated.
+        """
+        for start, end in JsonUtil.iter_spans(text):
+            return text[start:end]
+        return None
+
+    @staticmethod
+    def iter_spans(text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields ``(start, end)`` of each balanced top-level object or array, in order.
+
+        Fenced blocks are searched first, those tagged ``json`` (or untagged)
+        before other languages; the whole text is only searched if no fence holds a span.
+        Spans are balanced but not necessarily valid JSON.
+        :param text: Model output.
+        """
+        found = False
+        for start, end in JsonUtil._fences(text):
+            for span in JsonUtil._scan(text, start, end):
+                found = True
+                yield span
+        if not found:
+            yield from JsonUtil._scan(text, 0, len(text))
+
+    @staticmethod
+    def iter_values(document: Any, keys: bool = False, paths: Sequence = ()) -> Iterator[Any]:
+        """
+        Yields every value nested in dicts and lists, containers and leaves alike, without serializing the document.
+
+        The walk keeps its own stack, so deep nesting cannot hit the recursion
+        limit, and is lazy, so a caller that stops early never visits the rest.
+        Values are yielded in document order, each container before its contents.
+        :param document: Parsed JSON (dicts, lists and scalars).
+        :param keys: If True, dict keys are yielded as well, before the dict's values.
+        :param paths: Compiled :class:`~aisert.utils.json_path.JsonPath` objects; if given,
+            only the values they select (and everything nested in them) are walked.
+        """
+        if paths:
+            roots = (value for path in paths for _, value in path.find(document))
+        else:
+            roots = (document,)
+        # a stack of iterators: only containers are pushed, leaves are yielded straight from their container
+        stack = [iter(roots)]
+        push, pop = stack.append, stack.pop
+        while stack:
+            for value in stack[-1]:
+                yield value
+                kind = type(value)
+                if kind is str or kind is int or kind is float or kind is bool or value is None:
+                    continue
+                if isinstance(value, dict):
+                    if keys:
+                        yield from value
+                    push(iter(value.values()))
+                    break
+                elif isinstance(value, (list, tuple)):
+                    push(iter(value))
+                    break
+            else:
+                pop()
+
+    @staticmethod
+    def find_items(items: Sequence, values: Iterable[Any], substring: bool = False) -> Set[int]:
+        """
+        Returns the indexes of the items found among the values.
+
+        An item is found if it equals a value, or if it is a string equal to the
+        ``str()`` of a scalar value (so ``"5"`` finds ``5``). With ``substring``,
+        a string item is also found inside a string value (or the ``str()`` of a
+        scalar). Each item stops being searched at its first hit and the values
+        stop being consumed once every item is found.
+        """
+        strings, others = {}, []
+        for index, item in enumerate(items):
+            if type(item) is str:
+                strings.setdefault(item, []).append(index)
+            else:
+                others.append((index, item))
+        found = set()
+        for value in values:
+            if others:
+                hits = [pair for pair in others if pair[1] == value]
+                if hits:
+                    found.update(index for index, _ in hits)
+                    others = [pair for pair in others if pair not in hits]
+            if strings:
+                kind = type(value)
+                if kind is str:
+                    text = value
+                elif kind is dict or kind is list or isinstance(value, (dict, list, tuple)):
+                    text = None
+                else:
+                    text = str(value)
+                if text is None:
+                    pass
+                elif not substring:
+                    if text in strings:
+                        found.update(strings.pop(text))
+                else:
+                    for item in strings:
+                        if item in text:
+                            for item in [item for item in strings if item in text]:
+                                found.update(strings.pop(item))
+                            break
+            if not strings and not others:
+                break
+        return found
+
+    @staticmethod
+    def _fences(text: str) -> List[Tuple[int, int]]:
+        """Bodies of fenced blocks, JSON-tagged ones first. An unclosed fence runs to the end."""
+        tagged, other = [], []
+        fence = JsonUtil.FENCE
+        pos = text.find(fence)
+        while pos != -1:
+            line_end = text.find("\n", pos + len(fence))
+            if line_end == -1:
+                break
+            close = text.find(fence, line_end)
+            body_end = len(text) if close == -1 else close
+            tag = text[pos + len(fence):line_end].strip().lower()
+            (tagged if tag in JsonUtil.JSON_FENCE_TAGS else other).append((line_end + 1, body_end))
+            pos = -1 if close == -1 else text.find(fence, close + len(fence))
+        return tagged + other
+
+    @staticmethod
+    def _scan(text: str, pos: int, end: int) -> Iterator[Tuple[int, int]]:
+        find_open, find_token = JsonUtil._OPEN.search, JsonUtil._TOKEN.search
+        array_value, opener = JsonUtil._ARRAY_VALUE.match, JsonUtil._OPENER
+        # openers left unclosed by an abandoned candidate cannot close when scanned again
+        unclosed = set()
+        while True:
+            match = find_open(text, pos, end)
+            if match is None:
+                return
+            start, pos = match.start(), match.end()
+            if start in unclosed or match.group() == "[" and not array_value(text, pos, end):
+                continue
+            stack = [(match.group(), start)]
+            while stack:
+                match = find_token(text, pos, end)
+                if match is None or match.group() == '"':
+                    # the candidate (or a string in it) never closes, so it was prose: resume after its opener
+                    unclosed.update(position for _, position in stack)
+                    pos = start + 1
+                    break
+                token, pos = match.group(), match.end()
+                if token[0] == '"':
+                    continue
+                if token in "{[":
+                    stack.append((token, match.start()))
+                elif stack.pop()[0] != opener[token]:
+                    break
+            else:
+                yield start, pos
@@ -1,3 +1,4 @@
+import reprlib
 
 
 class PrintUtil:
@@ -5,13 +6,23 @@ class PrintUtil:
     Utility class for validator-related functions.
     """
 
+    MAX_PREVIEW = 200
+
+    _repr = reprlib.Repr()
+    _repr.maxstring = MAX_PREVIEW
+    _repr.maxother = MAX_PREVIEW
+
     @staticmethod
-    def sanitize_text(text: str) -> str:
+    def sanitize_text(text) -> str:
         """
         Sanitizes the text for printing by removing sensitive information.
-        :param text: The text to sanitize.
+        Only a bounded preview is built, so large content is never copied in full.
+        :param text: The text (or dict/list content) to sanitize.
         :return: Sanitized text.
         """
         # Implement sanitization logic here if needed
-        safe_text = str(text).replace("\n", "\\n").replace("\r", "\\r")[:200]
+        limit = PrintUtil.MAX_PREVIEW
+        if not isinstance(text, str):
+            text = PrintUtil._repr.repr(text)
+        safe_text = text[:limit].replace("\n", "\\n").replace("\r", "\\r")[:limit]
         return safe_text
@@ -1,33 +1,62 @@
-from typing import List
+import functools
+from typing import List, Optional, Sequence
 
+from .content_search import ContentSearchMixin
 from .validator import BaseValidator
 from ..exception import ContainsValidationError
 from ..models.result import Result
 from ..models.validator_enums import ValidatorEnums
 
 
-class ContainsValidator(BaseValidator):
+class ContainsValidator(ContentSearchMixin, BaseValidator):
     """
     Validates if a text contains a specific substring.
+
+    Dict and list content is searched in place: the values nested in it are
+    walked once, without serializing the structure to text, and the walk
+    stops as soon as every item is found. An item must equal a nested value
+    (a list element, a dict value, or a scalar's ``str()`` for string items);
+    ``substring=True`` also finds string items inside string values. Dict keys
+    are searched too with ``keys=True`` (text content is unaffected), and
+    ``paths`` restricts the search to the values selected by JSONPath
+    expressions (JSON text is then parsed first).
     """
 
+    error_class = ContainsValidationError
+
     def __init__(self):
         super().__init__(ValidatorEnums.CONTAINS)
 
-    def validate(self, content, items: List) -> Result:
+    def check(self, content, items: List, keys: bool = False, paths: Optional[Sequence[str]] = None,
+              substring: bool = False) -> Result:
         """
-        Validate if the content contains the specified substring.
+        Check if the content contains the specified substrings; failures are returned, not raised.
         """
         if not isinstance(items, list):
             raise ContainsValidationError("items must be a list")
+        return self._check_items(items, keys, self._compile_paths(paths), substring, content)
+
+    def prepare(self, items: List, keys: bool = False, paths: Optional[Sequence[str]] = None,
+                substring: bool = False):
+        """Validate the items and compile the paths once and return a callable checking one content."""
+        if not isinstance(items, list):
+            raise ContainsValidationError("items must be a list")
+        return functools.partial(self._check_items, tuple(items), keys, self._compile_paths(paths), substring)
 
-        # Capture both missing and found in single pass
-        missing, found = [], []
-        for item in items:
-            (found if item in content else missing).append(item)
+    def _check_items(self, items, keys, paths, substring, content) -> Result:
+        try:
+            found = self._find_items(items, keys, paths, substring, content)
+        except ValueError as e:
+            return Result(self.validator_name, False, f"Content is not a valid JSON: {e}")
+        missing = [item for item in items if item not in found]
 
         # success when nothing is missing
         if missing:
-            raise ContainsValidationError(f"Following items not present in the content: {missing}")
-        reason = f"Found all items: {found}"
-        return Result(self.validator_name, True, reason)
+            return Result(self.validator_name, False, "Following items not present in the content: %s",
+                          args=(missing,), count=len(missing))
+        return Result(self.validator_name, True, "Found all items: %s", args=(found,), count=len(found))
+
+    async def acheck(self, content, items: List, keys: bool = False, paths: Optional[Sequence[str]] = None,
+                     substring: bool = False) -> Result:
+        """Substring checks are cheap, so they run inline rather than on the executor."""
+        return self.check(content, items, keys, paths, substring)
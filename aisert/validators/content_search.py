@@ -0,0 +1,46 @@
+from typing import List, Optional, Sequence
+
+from ..models.content_view import ContentView
+from ..utils.json_path import JsonPath
+from ..utils.json_util import JsonUtil
+
+
+class ContentSearchMixin:
+    """
+    Finds items in text, or among the values of dict/list content, for the contains validators.
+
+    Text is searched with plain substring checks. Dict and list content is
+    walked in place (see :meth:`JsonUtil.iter_values`) and never serialized:
+    an item is found if it equals a nested value (list elements included), or
+    if it is a string equal to a scalar's ``str()``, e.g. ``"5"`` for ``5``.
+    ``substring`` finds string items inside string values as well, ``keys``
+    adds dict keys to the search, and ``paths`` restricts the search to the
+    values selected by JSONPath expressions, parsing JSON text content (once
+    per chain) to find them.
+    """
+
+    @classmethod
+    def _compile_paths(cls, paths: Optional[Sequence[str]]) -> tuple:
+        """Compiled paths; raises the validator's ``error_class`` for invalid ones."""
+        if paths is None:
+            return ()
+        if isinstance(paths, str) or not all(isinstance(path, str) for path in paths):
+            raise cls.error_class("paths must be a list of JSONPath strings")
+        try:
+            return tuple(JsonPath.compile(path) for path in paths)
+        except ValueError as e:
+            raise cls.error_class(str(e))
+
+    @staticmethod
+    def _find_items(items, keys: bool, paths: tuple, substring: bool, content) -> List:
+        """
+        The items present in the content, in the order given.
+
+        :raises ValueError: If ``paths`` are given and text content is not valid JSON.
+        """
+        raw = ContentView.unwrap(content)
+        if not paths and not isinstance(raw, (dict, list)):
+            return [item for item in items if item in raw]
+        document = ContentView.parse(content)
+        hits = JsonUtil.find_items(items, JsonUtil.iter_values(document, keys, paths), substring)
+        return [item for index, item in enumerate(items) if index in hits]
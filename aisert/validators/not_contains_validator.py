@@ -1,17 +1,21 @@
-from typing import List
+import functools
+from typing import List, Optional, Sequence
 
+from .content_search import ContentSearchMixin
 from .validator import BaseValidator
 from ..exception import NotContainsValidationError
 from ..models.validator_enums import ValidatorEnums
 from ..models.result import Result
 
 
-class NotContainsValidator(BaseValidator):
+class NotContainsValidator(ContentSearchMixin, BaseValidator):
     """
     Validates that content does NOT contain any of the specified flagged items.
     
     Used for content moderation, spam detection, and ensuring unwanted terms
     are absent from AI responses. Fails validation if any flagged items are found.
+    Dict and list content is searched in place, like in
+    :class:`~aisert.validators.contains_validator.ContainsValidator`.
     
     Example:
         validator = NotContainsValidator()
@@ -19,6 +23,8 @@ class NotContainsValidator(BaseValidator):
         # Returns success since no flagged items found
     """
 
+    error_class = NotContainsValidationError
+
     def __init__(self):
         """
         Initialize the NotContainsValidator.
@@ -28,29 +34,51 @@ class NotContainsValidator(BaseValidator):
         """
         super().__init__(ValidatorEnums.NOT_CONTAINS)
 
-    def validate(self, content, items: List) -> Result:
+    def check(self, content, items: List, keys: bool = False, paths: Optional[Sequence[str]] = None,
+              substring: bool = False) -> Result:
         """
-        Validate that content does not contain any of the flagged items.
+        Check that content does not contain any of the flagged items.
         
         Args:
             content: Text content to check for absence of flagged items.
             items: List of strings that must NOT be present in the content.
+            keys: If True, dict keys of structured content are searched too.
+            paths: JSONPath expressions restricting the search to the values they select.
+            substring: If True, string items are also found inside the string values of structured content.
         
         Returns:
-            Result object with success status and explanation
+            Result object with status and explanation; failed if any flagged items are found
         
         Raises:
-            NotContainsValidationError: If any flagged items are found or if items is not a list
+            NotContainsValidationError: If items is not a list or a path is not a valid JSONPath
         
         Example:
-            validator.validate("Hello world", ["spam", "bad"])  # Success
+            validator.check("Hello world", ["spam", "bad"])  # Success
+            validator.check("This is spam", ["spam"])  # Failed Result
             validator.validate("This is spam", ["spam"])  # Raises exception
         """
         if not isinstance(items, list):
             raise NotContainsValidationError("items must be a list")
+        return self._check_items(items, keys, self._compile_paths(paths), substring, content)
 
-        found = [item for item in items if item in content]
+    def prepare(self, items: List, keys: bool = False, paths: Optional[Sequence[str]] = None,
+                substring: bool = False):
+        """Validate the flagged items and compile the paths once and return a callable checking one content."""
+        if not isinstance(items, list):
+            raise NotContainsValidationError("items must be a list")
+        return functools.partial(self._check_items, tuple(items), keys, self._compile_paths(paths), substring)
+
+    def _check_items(self, items, keys, paths, substring, content) -> Result:
+        try:
+            found = self._find_items(items, keys, paths, substring, content)
+        except ValueError as e:
+            return Result(self.validator_name, False, f"Content is not a valid JSON: {e}")
         if found:
-            raise NotContainsValidationError(f"Found flagged items: {found}")
+            return Result(self.validator_name, False, "Found flagged items: %s", args=(found,), count=len(found))
 
         return Result(self.validator_name, True, "No flagged items found")
+
+    async def acheck(self, content, items: List, keys: bool = False, paths: Optional[Sequence[str]] = None,
+                     substring: bool = False) -> Result:
+        """Substring checks are cheap, so they run inline rather than on the executor."""
+        return self.check(content, items, keys, paths, substring)
@@ -0,0 +1,88 @@
+import functools
+from typing import Any, Callable, Optional
+
+from .validator import BaseValidator
+from ..exception import PathValidationError
+from ..models.content_view import ContentView
+from ..models.result import Result
+from ..models.validator_enums import ValidatorEnums
+from ..utils.json_path import JsonPath
+from ..utils.print_util import PrintUtil
+
+
+class PathValidator(BaseValidator):
+    """
+    Validates values selected by a JSONPath expression in JSON content.
+
+    Without a predicate the path must match at least one value; with one,
+    every matched value must satisfy it, so a path matching nothing passes.
+    Paths are compiled once and cached
+    (see :class:`~aisert.utils.json_path.JsonPath`), matches are produced
+    lazily so the check stops at the first violating value, and content in a
+    chain is parsed once and shared by all its path rules.
+
+    Example:
+        validator = PathValidator()
+        validator.check('{"items": [{"price": 3}]}', "$.items[*].price", lambda price: price > 0)  # Success
+        validator.check('{"user": {}}', "$.user.email")  # Failed Result: matched nothing
+    """
+
+    cost = 2
+    error_class = PathValidationError
+
+    def __init__(self):
+        super().__init__(ValidatorEnums.PATH)
+
+    def check(self, content, path: str, predicate: Optional[Callable[[Any], bool]] = None) -> Result:
+        """
+        Check the values at a JSONPath in the content.
+
+        Args:
+            content: JSON text, or parsed dict/list content
+            path: JSONPath expression, e.g. ``"$.items[*].price"`` or ``"$.user.email"``
+            predicate: Callable every matched value must satisfy (a path matching nothing passes); if omitted
+                the path must match at least one value
+
+        Returns:
+            Result object with status and explanation; count is the number of values checked on success
+
+        Raises:
+            PathValidationError: If the path is not a valid JSONPath expression
+        """
+        return self._check_prepared(self._compile(path), predicate, content)
+
+    def prepare(self, path: str, predicate: Optional[Callable[[Any], bool]] = None):
+        """Compile the path once and return a callable checking one content."""
+        return functools.partial(self._check_prepared, self._compile(path), predicate)
+
+    @staticmethod
+    def _compile(path: str) -> JsonPath:
+        if not isinstance(path, str):
+            raise PathValidationError("path must be a string")
+        try:
+            return JsonPath.compile(path)
+        except ValueError as e:
+            raise PathValidationError(str(e))
+
+    def _check_prepared(self, compiled: JsonPath, predicate, content) -> Result:
+        try:
+            document = ContentView.parse(content)
+        except ValueError as e:
+            return Result(self.validator_name, False, f"Content is not a valid JSON: {e}")
+        matches = compiled.find(document)
+        checked = 0
+        for location, value in matches:
+            if predicate is None:
+                return Result(self.validator_name, True, "")
+            checked += 1
+            try:
+                passed = predicate(value)
+            except Exception as e:
+                return Result(self.validator_name, False, "Value at %s failed the check (%s: %s): %s",
+                              args=(JsonPath.location(location), type(e).__name__, e, PrintUtil.sanitize_text(value)))
+            if not passed:
+                return Result(self.validator_name, False, "Value at %s failed the check: %s",
+                              args=(JsonPath.location(location), PrintUtil.sanitize_text(value)))
+        if predicate is None:
+            return Result(self.validator_name, False, "Path %s matched nothing", args=(compiled.path,), count=0)
+        return Result(self.validator_name, True, "", count=checked)
@@ -0,0 +1,155 @@
+import functools
+import logging
+from typing import Annotated, Any, Literal, Optional, Sequence, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from .schema_validator import SchemaValidator
+from ..exception import SchemaValidationError
+from ..models.content_view import ContentView
+from ..models.result import Result
+from ..utils.print_util import PrintUtil
+
+
+class SchemaAnyValidator(SchemaValidator):
+    """
+    A class to validate content against whichever of several schemas it matches.
+
+    The schemas are combined into one union TypeAdapter, built once per set of
+    schemas and cached, so the content is parsed once instead of once per
+    schema. When every schema is a model with a ``Literal`` field of the same
+    name and distinct values (e.g. ``type: Literal["answer"]``), that field is
+    used as the discriminator and only the matching model is validated.
+    A passing Result's reason names the matched schema.
+    """
+
+    def check(self, content: Any, schemas: Sequence[Any], discriminator: Optional[str] = None,
+              extract: bool = False):
+        """
+        Checks if the content matches any of the schemas; mismatches are returned, not raised.
+
+        :param content: The content to validate.
+        :param schemas: Pydantic models or generic types, tried as one union.
+        :param discriminator: Field selecting the model; detected from ``Literal`` fields if not given.
+        :param extract: If True, validate the JSON found inside fences or prose rather than the whole text.
+        :return: Result true/false with reason; the reason of a pass is ``"Matched schema: <name>"``.
+        :raises SchemaValidationError: If a schema is not a Pydantic model or generic type.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Validating content against any of: %s", schemas)
+            self.logger.debug("content: %s", PrintUtil.sanitize_text(ContentView.unwrap(content)))
+        check = self._check_extracted if extract else self._check_prepared
+        return check(self._union_adapter(schemas, discriminator), content)
+
+    def prepare(self, schemas: Sequence[Any], discriminator: Optional[str] = None, extract: bool = False):
+        """
+        Validates the schemas and builds their union TypeAdapter once; returns a callable checking one content.
+
+        :param schemas: Pydantic models or generic types, tried as one union.
+        :param discriminator: Field selecting the model; detected from ``Literal`` fields if not given.
+        :param extract: If True, validate the JSON found inside fences or prose rather than the whole text.
+        :raises SchemaValidationError: If a schema is not a Pydantic model or generic type.
+        """
+        adapter = self._union_adapter(schemas, discriminator)
+        return functools.partial(self._check_extracted if extract else self._check_prepared, adapter)
+
+    def _passed(self, union: "_SchemaUnion", value: Any) -> Result:
+        return Result(self.validator_name, True, "Matched schema: %s", args=(_MatchedSchema(union, value),))
+
+    @classmethod
+    def _union_adapter(cls, schemas: Sequence[Any], discriminator: Optional[str]) -> "_SchemaUnion":
+        schemas = tuple(schemas)
+        if not schemas:
+            raise SchemaValidationError("At least one schema is required")
+        for schema in schemas:
+            cls._require_pydantic(schema)
+        key = ("any", schemas, discriminator)
+        try:
+            hash(key)
+        except TypeError:
+            return cls._build_union(schemas, discriminator)
+        return cls._adapters.get_or_create(key, lambda: cls._build_union(schemas, discriminator))
+
+    @classmethod
+    def _build_union(cls, schemas: tuple, discriminator: Optional[str]) -> "_SchemaUnion":
+        if discriminator is None:
+            discriminator = cls._find_discriminator(schemas)
+        union = Union[schemas]
+        if discriminator is not None:
+            union = Annotated[union, Field(discriminator=discriminator)]
+        return _SchemaUnion(cls._build_adapter(union), schemas, discriminator)
+
+    @staticmethod
+    def _find_discriminator(schemas: tuple) -> Optional[str]:
+        """First field that every model declares as a ``Literal`` with values no other model uses."""
+        if len(schemas) < 2 or not all(isinstance(schema, type) and issubclass(schema, BaseModel)
+                                       for schema in schemas):
+            return None
+        for name in schemas[0].model_fields:
+            seen = set()
+            for schema in schemas:
+                field = schema.model_fields.get(name)
+                if field is None or get_origin(field.annotation) is not Literal:
+                    break
+                values = set(get_args(field.annotation))
+                if values & seen:
+                    break
+                seen |= values
+            else:
+                return name
+        return None
+
+
+class _SchemaUnion:
+    """The union TypeAdapter of a set of schemas, with what is needed to tell which one matched."""
+
+    __slots__ = ("adapter", "schemas", "discriminator", "validate_json", "validate_python")
+
+    def __init__(self, adapter: TypeAdapter, schemas: tuple, discriminator: Optional[str]):
+        self.adapter = adapter
+        self.schemas = schemas
+        self.discriminator = discriminator
+        self.validate_json = adapter.validate_json
+        self.validate_python = adapter.validate_python
+
+    def matched(self, value: Any) -> Optional[Any]:
+        """The entry of ``schemas`` that produced ``value``, or None if it cannot be told."""
+        for schema in self.schemas:
+            if type(value) is schema:
+                return schema
+        if self.discriminator is not None:
+            tag = getattr(value, self.discriminator, None)
+            for schema in self.schemas:
+                field = getattr(schema, "model_fields", {}).get(self.discriminator)
+                if field is not None and get_origin(field.annotation) is Literal and tag in get_args(field.annotation):
+                    return schema
+        generics = [schema for schema in self.schemas if not (isinstance(schema, type) and issubclass(schema, BaseModel))]
+        for strict in (True, False):
+            for schema in generics:
+                try:
+                    SchemaValidator._type_adapter(schema).validate_python(value, strict=strict)
+                    return schema
+                except ValidationError:
+                    continue
+        return None
+
+
+class _MatchedSchema:
+    """Name of the schema a value matched, resolved only when a passing Result's reason is read."""
+
+    __slots__ = ("union", "value")
+
+    def __init__(self, union: _SchemaUnion, value: Any):
+        self.union = union
+        self.value = value
+
+    def __str__(self) -> str:
+        schema = self.union.matched(self.value)
+        if schema is None:
+            return type(self.value).__name__
+        if not isinstance(schema, type):
+            return repr(schema)
+        if any(other is not schema and getattr(other, "__name__", None) == schema.__name__
+               for other in self.union.schemas):
+            return f"{schema.__module__}.{schema.__qualname__}"
+        return schema.__name__
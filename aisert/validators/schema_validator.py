@@ -1,47 +1,252 @@
+import functools
+import hashlib
 import json
-from json import JSONDecodeError
+import logging
 from typing import Any
+from jsonschema import SchemaError
+from jsonschema.validators import validator_for
 from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .validator import BaseValidator
 from ..exception import SchemaValidationError
+from ..models.content_view import ContentView
 from ..models.result import Result
 from ..models.validator_enums import ValidatorEnums
+from ..utils.cache_util import LRUCache
+from ..utils.json_util import JsonUtil
+from ..utils.print_util import PrintUtil
+
+
+JSON_TYPES = (str, bytes, bytearray, memoryview)
 
 
 class SchemaValidator(BaseValidator):
     """
     A class to validate content against a schema.
+
+    JSON text (``str``, ``bytes``, ``bytearray`` or ``memoryview``) is parsed and
+    validated in a single pass by pydantic-core; dicts and lists are validated as
+    Python objects. Schemas may also be JSON Schema documents (dicts), compiled
+    once with ``jsonschema`` and cached by their canonical hash. With
+    ``extract=True`` the JSON is first located in text that wraps it in markdown
+    fences or prose (see :class:`~aisert.utils.json_util.JsonUtil`).
     """
 
+    cost = 2
+    error_class = SchemaValidationError
+    _adapters = LRUCache(max_entries=256)
+
     def __init__(self):
         super().__init__(ValidatorEnums.SCHEMA)
 
-    def validate(self, content: Any, schema: Any):
+    def check(self, content: Any, schema: Any, extract: bool = False):
         """
-        Validates if the content matches the schema.
+        Checks if the content matches the schema; mismatches are returned, not raised.
 
         :param content: The content to validate.
-        :param schema: The schema to validate against.
+        :param schema: The schema to validate against: a Pydantic model, generic type or JSON Schema dict.
+        :param extract: If True, validate the JSON found inside fences or prose rather than the whole text.
         :return: Result true/false with reason.
+        :raises SchemaValidationError: If the schema is not a Pydantic model, generic type or valid JSON Schema.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Validating content against schema: %s", schema)
+            self.logger.debug("content: %s", PrintUtil.sanitize_text(ContentView.unwrap(content)))
+        check = self._check_extracted if extract else self._check_prepared
+        return check(self._adapter(schema), content)
+
+    def prepare(self, schema: Any, extract: bool = False):
+        """
+        Validates the schema and builds its TypeAdapter (or JSON Schema validator) once;
+        returns a callable checking one content.
+
+        :param schema: The schema to validate against: a Pydantic model, generic type or JSON Schema dict.
+        :param extract: If True, validate the JSON found inside fences or prose rather than the whole text.
+        :raises SchemaValidationError: If the schema is not a Pydantic model, generic type or valid JSON Schema.
+        """
+        return functools.partial(self._check_extracted if extract else self._check_prepared, self._adapter(schema))
+
+    def _check_prepared(self, adapter: TypeAdapter, content: Any) -> Result:
+        if type(adapter) is _CompiledJsonSchema:
+            return self._check_json_schema(adapter, content)
+        content = ContentView.unwrap(content)
+        if isinstance(content, JSON_TYPES):
+            if isinstance(content, memoryview):
+                content = content.tobytes()
+            return self._validate_json(adapter, content)
+        return self._validate_parsed(adapter, content)
+
+    def _check_json_schema(self, adapter: "_CompiledJsonSchema", content: Any) -> Result:
+        """Validates against a JSON Schema; JSON text in a ContentView is parsed once per chain."""
+        if isinstance(ContentView.unwrap(content), memoryview):
+            content = ContentView.unwrap(content).tobytes()
+        try:
+            parsed = ContentView.parse(content)
+        except ValueError as e:
+            return Result(self.validator_name, False, f"Content is not a valid JSON: {e}")
+        return self._validate_parsed(adapter, parsed)
+
+    def _check_extracted(self, adapter: TypeAdapter, content: Any) -> Result:
         """
-        self.logger.debug(f"Validating content against schema: {schema}")
-        self.logger.debug(f"content: {content}")
+        Validates the JSON spans found in text content, in order, until one matches the schema.
+        Spans do not overlap, so the content is still scanned and parsed at most once. If none
+        match, the failure for the longest span (most likely the intended payload) is reported.
+        """
+        content = ContentView.unwrap(content)
+        if not isinstance(content, JSON_TYPES):
+            return self._validate_parsed(adapter, content)
+        try:
+            text = content if isinstance(content, str) else str(content, "utf-8")
+        except UnicodeDecodeError:
+            return self._check_prepared(adapter, content)
+        failure, longest = None, -1
+        for start, end in JsonUtil.iter_spans(text):
+            result = self._validate_json(adapter, text[start:end])
+            if result.status:
+                return result
+            if end - start > longest:
+                failure, longest = result, end - start
+        if failure is None:
+            return Result(self.validator_name, False, "No JSON object or array found in content")
+        return failure
+
+    def _validate_json(self, adapter: TypeAdapter, content) -> Result:
+        """Parses and validates JSON text in one pass in pydantic-core, without building Python dicts first."""
+        if type(adapter) is _CompiledJsonSchema:
+            try:
+                parsed = json.loads(content)
+            except ValueError as e:
+                return Result(self.validator_name, False, f"Content is not a valid JSON: {e}")
+            return self._validate_parsed(adapter, parsed)
         try:
-            if type(content) is str:
-                content = json.loads(content)
-        except JSONDecodeError as e:
-            raise SchemaValidationError(f"Content is not a valid JSON: {e}")
+            return self._passed(adapter, adapter.validate_json(content))
+        except ValidationError as e:
+            if e.errors(include_url=False)[0]["type"] == "json_invalid":
+                return self._invalid_json(adapter, content)
+            return Result(self.validator_name, False, "%s", args=(e.with_traceback(None),), count=e.error_count())
+        except Exception as e:
+            raise SchemaValidationError(f"Unexpected error: {e}")
+
+    def _invalid_json(self, adapter: TypeAdapter, content) -> Result:
+        """
+        Reports malformed JSON with the standard library's message. If only
+        pydantic-core rejects the text (e.g. ``NaN``), the parsed value is validated instead.
+        """
+        try:
+            parsed = json.loads(content)
+        except ValueError as e:
+            return Result(self.validator_name, False, f"Content is not a valid JSON: {e}")
+        return self._validate_parsed(adapter, parsed)
+
+    @classmethod
+    def _adapter(cls, schema: Any) -> TypeAdapter:
+        """
+        Returns the TypeAdapter for the schema, built once per schema and kept in a bounded LRU cache.
+        Generic aliases such as ``List[Model]`` are cached by value; unhashable schemas are not cached.
+        JSON Schema dicts get a compiled ``jsonschema`` validator instead.
+        """
+        if isinstance(schema, dict):
+            return cls._json_schema_validator(schema)
+        cls._require_pydantic(schema)
+        return cls._type_adapter(schema)
 
+    @staticmethod
+    def _require_pydantic(schema: Any):
         is_pydantic_model = isinstance(schema, type) and issubclass(schema, BaseModel)
         is_generic_type = hasattr(schema, "__origin__")
 
         if not (is_pydantic_model or is_generic_type):
             raise SchemaValidationError("Provided schema is not a valid Pydantic model")
+
+    @classmethod
+    def _type_adapter(cls, schema: Any) -> TypeAdapter:
+        """Returns the cached TypeAdapter for any type, including field types such as ``int``."""
+        try:
+            hash(schema)
+        except TypeError:
+            return cls._build_adapter(schema)
+        return cls._adapters.get_or_create(schema, lambda: cls._build_adapter(schema))
+
+    @classmethod
+    def _json_schema_validator(cls, schema: dict):
+        """
+        Returns the compiled validator for a JSON Schema document, cached under the SHA-256 of its
+        canonical JSON, so equal schemas share one validator whatever their key order or identity.
+        The draft is taken from ``$schema`` (latest supported draft if absent), and ``format`` keywords
+        are enforced with that draft's format checker.
+        """
+        try:
+            canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            raise SchemaValidationError(f"Provided schema is not a valid JSON Schema: {e}")
+        key = ("jsonschema", hashlib.sha256(canonical.encode("utf-8")).hexdigest())
+        return cls._adapters.get_or_create(key, lambda: cls._compile_json_schema(schema))
+
+    @staticmethod
+    def _compile_json_schema(schema: dict):
+        validator_class = validator_for(schema)
+        try:
+            validator_class.check_schema(schema)
+        except SchemaError as e:
+            raise SchemaValidationError(f"Provided schema is not a valid JSON Schema: {e.message}")
+        return _CompiledJsonSchema(validator_class(schema, format_checker=validator_class.FORMAT_CHECKER),
+                                   schema.get("title", "JSON Schema"))
+
+    @staticmethod
+    def _build_adapter(schema: Any) -> TypeAdapter:
+        try:
+            return TypeAdapter(schema)
+        except Exception as e:
+            raise SchemaValidationError(f"Unexpected error: {e}")
+
+    def _validate_parsed(self, adapter: TypeAdapter, content: Any) -> Result:
+        if type(adapter) is _CompiledJsonSchema:
+            try:
+                errors = list(adapter.validator.iter_errors(content))
+            except Exception as e:
+                raise SchemaValidationError(f"Unexpected error: {e}")
+            if not errors:
+                return Result(self.validator_name, True, "")
+            return Result(self.validator_name, False, "%s", args=(_JsonSchemaErrors(adapter.title, errors),),
+                          count=len(errors))
         try:
-            TypeAdapter(schema).validate_python(content)
-            return Result(self.validator_name,True, "")
+            return self._passed(adapter, adapter.validate_python(content))
         except ValidationError as e:
-            raise SchemaValidationError(f"{e}")
+            return Result(self.validator_name, False, "%s", args=(e.with_traceback(None),), count=e.error_count())
         except Exception as e:
             raise SchemaValidationError(f"Unexpected error: {e}")
+
+    def _passed(self, adapter: TypeAdapter, value: Any) -> Result:
+        """Result for content that matched; ``value`` is the object ``adapter`` validated."""
+        return Result(self.validator_name, True, "")
+
+
+class _CompiledJsonSchema:
+    """A compiled ``jsonschema`` validator, used by SchemaValidator in place of a TypeAdapter."""
+
+    __slots__ = ("validator", "title")
+
+    def __init__(self, validator, title: str):
+        self.validator = validator
+        self.title = title
+
+
+class _JsonSchemaErrors:
+    """
+    ``jsonschema`` errors for one content, formatted like pydantic's ValidationError when the reason is read.
+    """
+
+    __slots__ = ("title", "errors")
+
+    def __init__(self, title: str, errors: list):
+        self.title = title
+        self.errors = errors
+
+    def __str__(self):
+        count = len(self.errors)
+        lines = [f"{count} validation error{'' if count == 1 else 's'} for {self.title}"]
+        for error in self.errors:
+            if error.absolute_path:
+                lines.append(".".join(str(part) for part in error.absolute_path))
+            lines.append(f"  {PrintUtil.sanitize_text(error.message)} [validator={error.validator}]")
+        return "\n".join(lines)
@@ -7,27 +7,24 @@ from ...models.result import Result
 
 
 class TFIDFSemanticValidator(SemanticValidatorBase):
-    """TF-IDF based semantic similarity validator."""
+    """TF-IDF based semantic similarity validator.
+
+    The vocabulary is fitted on each pair of texts, so every check fits its own
+    vectorizer; the shared instance holds no fitted state and is safe to use
+    from concurrent rules and threads.
+    """
+    label = "TF-IDF"
     _instances = {}
     _lock = threading.RLock()
 
-    def __init__(self):
-        super().__init__()
-        self.vectorizer = TfidfVectorizer()
-
-    def validate(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
         if not (0 <= threshold <= 1):
             raise SemanticValidationError("Threshold must be between 0 and 1")
 
-        tfidf_matrix = self.vectorizer.fit_transform([text1, text2])
+        tfidf_matrix = TfidfVectorizer().fit_transform([text1, text2])
         similarity_score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
 
-        if similarity_score < threshold:
-            raise SemanticValidationError(
-                f"TF-IDF similarity score: {similarity_score} is lesser than threshold: {threshold}")
-
-        return Result(self.validator_name, True,
-                      f"TF-IDF similarity score: {similarity_score}, Threshold: {threshold}")
+        return self._score_result(self.label, similarity_score, threshold)
 
     @classmethod
     def get_instance(cls, **kwargs):
@@ -37,8 +34,74 @@ class TFIDFSemanticValidator(SemanticValidatorBase):
             return cls._instances["tfidf"]
 
 
+class HashingSemanticValidator(SemanticValidatorBase):
+    """Feature-hashing based lexical similarity validator.
+
+    Hashes word (1-2) and character (3-5) n-grams into fixed-size sparse
+    vectors and compares them by cosine similarity. Nothing is fitted and the
+    vectorizers hold no mutable state, so one instance is safe to share across
+    threads.
+    """
+    label = "Hashing"
+    _instances = {}
+    _lock = threading.RLock()
+
+    def __init__(self, n_features: int = 2 ** 18):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        super().__init__()
+        self.vectorizers = (
+            HashingVectorizer(analyzer="word", ngram_range=(1, 2), n_features=n_features,
+                              alternate_sign=False, norm="l2"),
+            HashingVectorizer(analyzer="char_wb", ngram_range=(3, 5), n_features=n_features,
+                              alternate_sign=False, norm="l2"),
+        )
+
+    def transform(self, texts):
+        """Hash texts into an L2-normalized sparse matrix of shape (len(texts), 2 * n_features)."""
+        from scipy.sparse import hstack
+        from sklearn.preprocessing import normalize
+
+        return normalize(hstack([vectorizer.transform(texts) for vectorizer in self.vectorizers], format="csr"))
+
+    def similarities(self, contents, reference: str):
+        """Cosine similarity of every content against ``reference`` in one sparse matrix product."""
+        matrix = self.transform(list(contents) + [reference])
+        return (matrix[:-1] @ matrix[-1].T).toarray().ravel()
+
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+
+        similarity_score = float(self.similarities([text1], text2)[0])
+
+        return self._score_result(self.label, similarity_score, threshold)
+
+    def _embed_text(self, text: str):
+        return self.transform([text])
+
+    def _embedding_similarity(self, embedding, reference) -> float:
+        return float((embedding @ reference.T).toarray()[0, 0])
+
+    def validate_many(self, contents, text2: str, threshold: float = 0.8):
+        """Score many contents against ``text2`` at once; returns one Result per content."""
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+
+        return [self._score_result(self.label, score, threshold)
+                for score in self.similarities(contents, text2).tolist()]
+
+    @classmethod
+    def get_instance(cls, n_features: int = 2 ** 18, **kwargs):
+        with cls._lock:
+            if n_features not in cls._instances:
+                cls._instances[n_features] = cls(n_features)
+            return cls._instances[n_features]
+
+
 class HuggingFaceSemanticValidator(SemanticValidatorBase):
     """HuggingFace API based semantic similarity validator."""
+    label = "HuggingFace"
     _instances = {}
     _lock = threading.RLock()
 
@@ -46,7 +109,7 @@ class HuggingFaceSemanticValidator(SemanticValidatorBase):
         super().__init__()
         self.model_name = model_name
 
-    def validate(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
         try:
             from huggingface_hub import InferenceClient
         except ImportError:
@@ -62,12 +125,25 @@ class HuggingFaceSemanticValidator(SemanticValidatorBase):
         embeddings = client.feature_extraction([text1, text2], model=self.model_name)
         similarity_score = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
 
-        if similarity_score < threshold:
+        return self._score_result(self.label, similarity_score, threshold)
+
+    async def acheck(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        try:
+            from huggingface_hub import AsyncInferenceClient
+        except ImportError:
             raise SemanticValidationError(
-                f"HuggingFace similarity score: {similarity_score} is lesser than threshold: {threshold}")
+                "huggingface_hub not installed. Install with: pip install aisert[huggingface]"
+            )
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+
+        async with AsyncInferenceClient() as client:
+            embeddings = await client.feature_extraction([text1, text2], model=self.model_name)
+        similarity_score = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
 
-        return Result(self.validator_name, True,
-                      f"HuggingFace similarity score: {similarity_score}, Threshold: {threshold}")
+        return self._score_result(self.label, similarity_score, threshold)
 
     @classmethod
     def get_instance(cls, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", **kwargs):
@@ -79,81 +155,369 @@ class HuggingFaceSemanticValidator(SemanticValidatorBase):
 
 
 class OpenAISemanticValidator(SemanticValidatorBase):
-    """OpenAI API based semantic similarity validator."""
+    """OpenAI API based semantic similarity validator.
+
+    Embeddings are cached per text in compact form (``embedding_dtype`` of
+    "float32", "float16" or "int8"; ``cache_size=0`` disables the cache).
+    ``dimensions`` requests shortened Matryoshka embeddings from the API.
+    """
+    label = "OpenAI"
     _instances = {}
     _lock = threading.RLock()
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, dimensions: int = None, embedding_dtype: str = "float32",
+                 cache_size: int = 1024):
+        from ...utils.async_util import LoopClient
+        from ...utils.embedding_util import CompactEmbeddings, EmbeddingCache
+
+        if embedding_dtype not in CompactEmbeddings.DTYPES:
+            raise SemanticValidationError(f"embedding_dtype must be one of {CompactEmbeddings.DTYPES}")
         super().__init__()
         self.model_name = model_name
+        self.dimensions = dimensions
+        self.cache = EmbeddingCache(max_entries=cache_size, dtype=embedding_dtype, dimensions=dimensions)
+        self.async_client = LoopClient(self._async_openai)
 
-    def validate(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+    @staticmethod
+    def _async_openai():
         import openai
-        from sklearn.metrics.pairwise import cosine_similarity
 
+        return openai.AsyncOpenAI()
+
+    def _request(self, texts):
+        request = {"model": self.model_name, "input": texts}
+        if self.dimensions:
+            request["dimensions"] = self.dimensions
+        return request
+
+    def _merge(self, texts, entries, response):
+        missing = [text for text, entry in zip(texts, entries) if entry is None]
+        fetched = {text: self.cache.put(text, data.embedding) for text, data in zip(missing, response.data)}
+        return [entry if entry is not None else fetched[text] for text, entry in zip(texts, entries)]
+
+    def _embed(self, texts):
+        """Return one compact embedding per text, calling the API only for cache misses."""
+        import openai
+
+        entries = [self.cache.get(text) for text in texts]
+        missing = [text for text, entry in zip(texts, entries) if entry is None]
+        if missing:
+            entries = self._merge(texts, entries, openai.OpenAI().embeddings.create(**self._request(missing)))
+        return entries
+
+    async def _aembed(self, texts):
+        """Async variant of :meth:`_embed` using one ``openai.AsyncOpenAI`` client per event loop."""
+        entries = [self.cache.get(text) for text in texts]
+        missing = [text for text, entry in zip(texts, entries) if entry is None]
+        if missing:
+            response = await self.async_client.get().embeddings.create(**self._request(missing))
+            entries = self._merge(texts, entries, response)
+        return entries
+
+    def _result(self, embedding1, embedding2, threshold: float) -> Result:
+        similarity_score = self._embedding_similarity(embedding1, embedding2)
+
+        return self._score_result(self.label, similarity_score, threshold)
+
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
         if not (0 <= threshold <= 1):
             raise SemanticValidationError("Threshold must be between 0 and 1")
 
-        client = openai.OpenAI()
-        response = client.embeddings.create(model=self.model_name, input=[text1, text2])
-        embeddings = [data.embedding for data in response.data]
-        similarity_score = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+        return self._result(*self._embed([text1, text2]), threshold)
 
-        if similarity_score < threshold:
-            raise SemanticValidationError(
-                f"OpenAI similarity score: {similarity_score} is lesser than threshold: {threshold}")
+    async def acheck(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
 
-        return Result(self.validator_name, True,
-                      f"OpenAI similarity score: {similarity_score}, Threshold: {threshold}")
+        return self._result(*(await self._aembed([text1, text2])), threshold)
+
+    def _embed_text(self, text: str):
+        return self._embed([text])[0]
+
+    def _embed_pair(self, text: str, reference: str):
+        return tuple(self._embed([text, reference]))
+
+    def _embedding_similarity(self, embedding, reference) -> float:
+        return float(embedding.similarity(reference)[0])
 
     @classmethod
-    def get_instance(cls, model_name: str = "text-embedding-3-small", **kwargs):
-        key = f"{model_name}"
+    def get_instance(cls, model_name: str = "text-embedding-3-small", dimensions: int = None,
+                     embedding_dtype: str = "float32", cache_size: int = 1024, **kwargs):
+        key = f"{model_name}:{dimensions}:{embedding_dtype}:{cache_size}"
         with cls._lock:
             if key not in cls._instances:
-                cls._instances[key] = cls(model_name)
+                cls._instances[key] = cls(model_name, dimensions, embedding_dtype, cache_size)
             return cls._instances[key]
 
 
 class SentenceTransformersSemanticValidator(SemanticValidatorBase):
-    """Sentence Transformers based semantic similarity validator."""
+    """Sentence Transformers based semantic similarity validator.
+
+    By default the content is encoded in one pass and truncated at the model's
+    max sequence length. Setting ``chunk_size`` (in tokens) enables chunked mode:
+    the content is split into overlapping token windows that are embedded in one
+    batch, and the per-window scores are combined with ``chunk_aggregate``
+    ("max" or "mean"). ``max_chunks`` caps the number of windows.
+    """
     _instances = {}
+    _models = {}
     _lock = threading.RLock()
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, chunk_size: int = None, chunk_overlap: int = 32,
+                 chunk_aggregate: str = "max", max_chunks: int = 16):
         try:
             from sentence_transformers import SentenceTransformer
         except ImportError:
             raise SemanticValidationError(
                 "sentence-transformers not installed. Install with: pip install aisert[sentence-transformers]"
             )
+        if chunk_size is not None:
+            if chunk_size <= 0 or not (0 <= chunk_overlap < chunk_size):
+                raise SemanticValidationError("chunk_overlap must be non-negative and smaller than chunk_size")
+            if chunk_aggregate not in ("max", "mean"):
+                raise SemanticValidationError("chunk_aggregate must be 'max' or 'mean'")
+            if max_chunks < 1:
+                raise SemanticValidationError("max_chunks must be at least 1")
         super().__init__()
-        self.model = SentenceTransformer(model_name)
+        with self._lock:
+            if model_name not in self._models:
+                self._models[model_name] = SentenceTransformer(model_name)
+            self.model = self._models[model_name]
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.chunk_aggregate = chunk_aggregate
+        self.max_chunks = max_chunks
+
+    def _chunks(self, text: str):
+        """Split text into overlapping windows of at most ``chunk_size`` tokens."""
+        tokenizer = self.model.tokenizer
+        ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+        if len(ids) <= self.chunk_size:
+            return [text]
+        stride = self.chunk_size - self.chunk_overlap
+        starts = range(0, len(ids) - self.chunk_overlap, stride)
+        return [tokenizer.decode(ids[s:s + self.chunk_size]) for s in starts[:self.max_chunks]]
+
+    def _embed_text(self, text: str):
+        """Embedding of the text, or in chunked mode one embedding per window."""
+        if self.chunk_size is None:
+            return self.model.encode(text, convert_to_tensor=True)
+        return self.model.encode(self._chunks(text), convert_to_tensor=True)
+
+    def _embed_reference(self, text: str):
+        """The reference is never chunked: one embedding, truncated at the model's max sequence length."""
+        return self.model.encode(text, convert_to_tensor=True)
+
+    def _embed_pair(self, text: str, reference: str):
+        """Content (or its windows) and reference in one batch."""
+        if self.chunk_size is None:
+            embeddings = self.model.encode([text, reference], convert_to_tensor=True)
+            return embeddings[0], embeddings[1]
+        embeddings = self.model.encode(self._chunks(text) + [reference], convert_to_tensor=True)
+        return embeddings[:-1], embeddings[-1]
+
+    def _embedding_similarity(self, embedding, reference) -> float:
+        """Cosine similarity to the reference; in chunked mode the window scores are aggregated."""
+        from sentence_transformers import util
+
+        scores = util.pytorch_cos_sim(embedding, reference).flatten()
+        return (scores.max() if self.chunk_aggregate == "max" else scores.mean()).item()
+
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+
+        similarity_score = self._embedding_similarity(*self._embed_pair(text1, text2))
 
-    def validate(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        return self._score_result(self.label, similarity_score, threshold)
+
+    @classmethod
+    def get_instance(cls, model_name: str = "all-MiniLM-L6-v2", chunk_size: int = None, chunk_overlap: int = 32,
+                     chunk_aggregate: str = "max", max_chunks: int = 16, **kwargs):
+        key = model_name if chunk_size is None else f"{model_name}:{chunk_size}:{chunk_overlap}:{chunk_aggregate}:{max_chunks}"
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(model_name, chunk_size, chunk_overlap, chunk_aggregate, max_chunks)
+            return cls._instances[key]
+
+
+class ONNXSemanticValidator(SemanticValidatorBase):
+    """ONNX Runtime (CPU) based semantic similarity validator.
+
+    Runs a sentence-embedding model exported with
+    ``python -m aisert.validators.semantic_validator.onnx_export``. The model
+    directory holds ``model.onnx``, an optional int8 ``model_int8.onnx``, the
+    tokenizer files and ``onnx_config.json`` (pooling/normalization settings).
+    """
+    label = "ONNX"
+    _instances = {}
+    _lock = threading.RLock()
+
+    def __init__(self, model_dir: str, quantized: bool = False, intra_op_num_threads: int = None):
         try:
-            from sentence_transformers import util
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
         except ImportError:
             raise SemanticValidationError(
-                "sentence-transformers not installed. Install with: pip install aisert[sentence-transformers]"
+                "onnxruntime not installed. Install with: pip install aisert[onnx]"
             )
+        import json
+        import os
 
+        super().__init__()
+        model_file = "model_int8.onnx" if quantized else "model.onnx"
+        model_path = os.path.join(model_dir, model_file)
+        if not os.path.isfile(model_path):
+            raise SemanticValidationError(
+                f"ONNX model not found: {model_path}. "
+                f"Export one with: python -m aisert.validators.semantic_validator.onnx_export"
+            )
+
+        config_path = os.path.join(model_dir, "onnx_config.json")
+        settings = {"pooling": "mean", "normalize": True, "max_seq_length": 256}
+        if os.path.isfile(config_path):
+            with open(config_path) as f:
+                settings.update(json.load(f))
+        self.pooling = settings["pooling"]
+        self.normalize = settings["normalize"]
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=settings["max_seq_length"])
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_num_threads:
+            options.intra_op_num_threads = intra_op_num_threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts):
+        """Embed a list of texts into a (len(texts), dim) float32 array."""
+        import numpy as np
+
+        encodings = self.tokenizer.encode_batch(list(texts))
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        hidden = self.session.run(None, {k: v for k, v in feeds.items() if k in self.input_names})[0]
+
+        if self.pooling == "cls":
+            embeddings = hidden[:, 0]
+        else:
+            mask = attention_mask[..., None].astype(hidden.dtype)
+            embeddings = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            embeddings = embeddings / np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings.astype(np.float32, copy=False)
+
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
         if not (0 <= threshold <= 1):
             raise SemanticValidationError("Threshold must be between 0 and 1")
 
-        embeddings1 = self.model.encode(text1, convert_to_tensor=True)
-        embeddings2 = self.model.encode(text2, convert_to_tensor=True)
-        similarity_score = util.pytorch_cos_sim(embeddings1, embeddings2).item()
+        embeddings = self.encode([text1, text2])
+        similarity_score = self._embedding_similarity(embeddings[0], embeddings[1])
+
+        return self._score_result(self.label, similarity_score, threshold)
+
+    def _embed_text(self, text: str):
+        return self.encode([text])[0]
 
-        if similarity_score < threshold:
+    def _embed_pair(self, text: str, reference: str):
+        embeddings = self.encode([text, reference])
+        return embeddings[0], embeddings[1]
+
+    def _embedding_similarity(self, embedding, reference) -> float:
+        import numpy as np
+
+        norms = np.linalg.norm(embedding) * np.linalg.norm(reference)
+        return float(embedding @ reference / max(norms, 1e-12))
+
+    @classmethod
+    def get_instance(cls, model_name: str = None, quantized: bool = False, intra_op_num_threads: int = None,
+                     **kwargs):
+        if not model_name:
+            raise SemanticValidationError("model_name must point to an exported ONNX model directory.")
+        key = f"{model_name}:{quantized}:{intra_op_num_threads}"
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(model_name, quantized, intra_op_num_threads)
+            return cls._instances[key]
+
+
+class StaticEmbeddingSemanticValidator(SemanticValidatorBase):
+    """Static (lookup-table) embedding based semantic similarity validator.
+
+    Embeds text by tokenizing it and mean-pooling rows of a precomputed
+    token-to-vector table, so no model forward pass is needed. The model
+    directory is produced by
+    ``python -m aisert.validators.semantic_validator.static_distill`` and holds
+    ``embeddings.npy`` (memory-mapped on load) and ``tokenizer.json``.
+    """
+    label = "Static embedding"
+    _instances = {}
+    _lock = threading.RLock()
+
+    def __init__(self, model_dir: str):
+        try:
+            import numpy as np
+            from tokenizers import Tokenizer
+        except ImportError:
             raise SemanticValidationError(
-                f"Semantic similarity score: {similarity_score} is lesser than threshold: {threshold}")
+                "tokenizers not installed. Install with: pip install aisert[static]"
+            )
+        import os
+
+        super().__init__()
+        table_path = os.path.join(model_dir, "embeddings.npy")
+        if not os.path.isfile(table_path):
+            raise SemanticValidationError(
+                f"Static embedding table not found: {table_path}. "
+                f"Distill one with: python -m aisert.validators.semantic_validator.static_distill"
+            )
+        self.embeddings = np.load(table_path, mmap_mode="r")
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.no_padding()
+        self.tokenizer.no_truncation()
+
+    def encode(self, texts):
+        """Embed a list of texts into a (len(texts), dim) float32 array of unit vectors."""
+        import numpy as np
+
+        result = np.zeros((len(texts), self.embeddings.shape[1]), dtype=np.float32)
+        for row, encoding in enumerate(self.tokenizer.encode_batch(list(texts), add_special_tokens=False)):
+            if encoding.ids:
+                result[row] = self.embeddings[encoding.ids].mean(axis=0)
+        norms = np.linalg.norm(result, axis=1, keepdims=True)
+        return result / np.clip(norms, 1e-12, None)
+
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+
+        embeddings = self.encode([text1, text2])
+        similarity_score = self._embedding_similarity(embeddings[0], embeddings[1])
+
+        return self._score_result(self.label, similarity_score, threshold)
+
+    def _embed_text(self, text: str):
+        return self.encode([text])[0]
+
+    def _embed_pair(self, text: str, reference: str):
+        embeddings = self.encode([text, reference])
+        return embeddings[0], embeddings[1]
 
-        return Result(self.validator_name, True,
-                      f"Semantic similarity score: {similarity_score}, Threshold: {threshold}")
+    def _embedding_similarity(self, embedding, reference) -> float:
+        return float(embedding @ reference)
 
     @classmethod
-    def get_instance(cls, model_name: str = "all-MiniLM-L6-v2", **kwargs):
+    def get_instance(cls, model_name: str = None, **kwargs):
+        if not model_name:
+            raise SemanticValidationError("model_name must point to a distilled static embedding directory.")
         with cls._lock:
             if model_name not in cls._instances:
                 cls._instances[model_name] = cls(model_name)
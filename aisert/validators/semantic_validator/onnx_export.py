@@ -0,0 +1,108 @@
+"""Export a local sentence-transformers model to ONNX for the "onnx" semantic provider.
+
+Usage::
+
+    python -m aisert.validators.semantic_validator.onnx_export all-MiniLM-L6-v2 ./minilm-onnx --quantize
+
+The output directory can then be used as ``semantic_model`` with ``semantic_provider="onnx"``.
+"""
+
+import argparse
+import json
+import logging
+import os
+
+from ...exception import SemanticValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def export(model_name: str, output_dir: str, quantize: bool = False, opset: int = 14) -> str:
+    """
+    Export a sentence-transformers model to ``output_dir``.
+
+    Writes ``model.onnx`` (float32), ``model_int8.onnx`` when *quantize* is set
+    (dynamic int8 weight quantization), the tokenizer files and ``onnx_config.json``.
+
+    :param model_name: Name or local path of a sentence-transformers model.
+    :param output_dir: Directory to write the exported model to.
+    :param quantize: Also write a dynamically quantized int8 variant.
+    :param opset: ONNX opset version.
+    :return: The output directory.
+    """
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise SemanticValidationError(
+            "sentence-transformers not installed. Install with: pip install aisert[sentence-transformers]"
+        )
+
+    os.makedirs(output_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+
+    dummy = tokenizer(["Aisert exports this model."], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in dummy]
+
+    class _HiddenStates(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(input_names, inputs))).last_hidden_state
+
+    model_path = os.path.join(output_dir, "model.onnx")
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    with torch.no_grad():
+        torch.onnx.export(
+            _HiddenStates(transformer),
+            tuple(dummy[name] for name in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+    logger.info("Exported %s to %s", model_name, model_path)
+
+    if quantize:
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+        except ImportError:
+            raise SemanticValidationError(
+                "onnxruntime not installed. Install with: pip install aisert[onnx]"
+            )
+        quantized_path = os.path.join(output_dir, "model_int8.onnx")
+        quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        logger.info("Wrote int8 model to %s", quantized_path)
+
+    tokenizer.save_pretrained(output_dir)
+    pooling = st_model[1] if len(st_model) > 1 else None
+    settings = {
+        "pooling": "cls" if pooling is not None and pooling.pooling_mode_cls_token else "mean",
+        "normalize": any(type(module).__name__ == "Normalize" for module in st_model),
+        "max_seq_length": st_model.max_seq_length,
+    }
+    with open(os.path.join(output_dir, "onnx_config.json"), "w") as f:
+        json.dump(settings, f, indent=2)
+    return output_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a sentence-transformers model to ONNX for Aisert.")
+    parser.add_argument("model", help="sentence-transformers model name or local path")
+    parser.add_argument("output_dir", help="directory to write the ONNX model to")
+    parser.add_argument("--quantize", action="store_true", help="also write a dynamic int8 model_int8.onnx")
+    parser.add_argument("--opset", type=int, default=14, help="ONNX opset version (default: 14)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    export(args.model, args.output_dir, quantize=args.quantize, opset=args.opset)
+
+
+if __name__ == "__main__":
+    main()
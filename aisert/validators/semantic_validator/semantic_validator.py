@@ -1,29 +1,95 @@
 """Semantic validation wrapper for consistent interface."""
+import functools
+import threading
 
 from .semantic_validator_factory import SemanticValidatorFactory
 from .semantic_validator_base import SemanticValidatorBase
 from ...exception import SemanticValidationError
+from ...models.content_view import ContentView
 
 
 class SemanticValidator(SemanticValidatorBase):
     """Validates semantic similarity between texts."""
 
+    cost = 100
+    _instances = {}
+    _lock = threading.RLock()
+
     def __init__(self, config):
         super().__init__()
         if not config or not config.has_semantic_config():
             raise SemanticValidationError("Semantic validation requires semantic configuration")
         self.provider = config.semantic_provider
         self.model_name = config.semantic_model
+        self.options = getattr(config, "semantic_options", None) or {}
+
+    @classmethod
+    def get_instance(cls, config):
+        """Get the shared SemanticValidator for the config's semantic provider, model and options."""
+        if not config or not config.has_semantic_config():
+            raise SemanticValidationError("Semantic validation requires semantic configuration")
+        options = getattr(config, "semantic_options", None) or {}
+        key = (config.semantic_provider, config.semantic_model, repr(sorted(options.items())))
+        instance = cls._instances.get(key)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.setdefault(key, cls(config))
+        return instance
+
+    def _get_semantic_validator(self):
+        return SemanticValidatorFactory.get_instance(
+            provider=self.provider,
+            model_name=self.model_name,
+            **self.options
+        )
 
-    def validate(self, text1: str, text2: str, threshold: float = 0.8, **kwargs):
-        """Validates semantic similarity between two texts."""
+    def check(self, text1: str, text2: str, threshold: float = 0.8, **kwargs):
+        """Checks semantic similarity between two texts; a score below threshold is returned, not raised."""
         try:
-            semantic_validator = SemanticValidatorFactory.get_instance(
-                provider=self.provider,
-                model_name=self.model_name
-            )
+            semantic_validator = self._get_semantic_validator()
             
-            return semantic_validator.validate(text1, text2, threshold)
+            return semantic_validator.check_content(text1, text2, threshold)
+
+        except SemanticValidationError:
+            raise
+        except Exception as e:
+            raise SemanticValidationError(f"Unexpected error: {e}") from e
+
+    def prepare(self, text2: str, threshold: float = 0.8, **kwargs):
+        """
+        Resolves the provider (loading its model) once and lets it precompute the
+        reference text; returns a callable checking one content.
+        """
+        try:
+            prepared = self._get_semantic_validator().prepare(text2, threshold)
+        except SemanticValidationError:
+            raise
+        except Exception as e:
+            raise SemanticValidationError(f"Unexpected error: {e}") from e
+        return functools.partial(self._check_prepared, prepared)
+
+    def _check_prepared(self, prepared, text1: str):
+        try:
+            return prepared(text1)
+        except SemanticValidationError:
+            raise
+        except Exception as e:
+            raise SemanticValidationError(f"Unexpected error: {e}") from e
+
+    async def acheck(self, text1: str, text2: str, threshold: float = 0.8, **kwargs):
+        """
+        Awaitable variant of :meth:`check`.
+
+        Model loading on first use runs on the managed executor, so concurrent
+        first-use loads are awaited instead of blocking the event loop.
+        """
+        from ...utils.async_util import run_sync
+
+        try:
+            semantic_validator = await run_sync(self._get_semantic_validator)
+
+            return await semantic_validator.acheck(text1.text if type(text1) is ContentView else text1, text2,
+                                                   threshold)
 
         except SemanticValidationError:
             raise
@@ -1,11 +1,17 @@
 """Base class for semantic validators."""
 
+import functools
 import logging
+from ...exception import SemanticValidationError
+from ...models.content_view import ContentView
 from ...models.result import Result
 
 
 class SemanticValidatorBase:
     """Abstract base class for semantic validators."""
+
+    error_class = SemanticValidationError
+    label = "Semantic"
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -27,6 +33,29 @@ class SemanticValidatorBase:
         """
         pass
     
+    def check(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        """
+        Check semantic similarity between two texts without raising on failure.
+        
+        A similarity below the threshold is returned as a Result with
+        ``status=False``. Subclasses implement either this method or
+        :meth:`validate`; the default adapts :meth:`validate`'s exception.
+        
+        Args:
+            text1: First text to compare
+            text2: Second text to compare  
+            threshold: Minimum similarity threshold (0.0 to 1.0)
+            
+        Returns:
+            Result object with validation outcome
+        """
+        if type(self).validate is SemanticValidatorBase.validate:
+            raise NotImplementedError("Subclasses must implement check or validate.")
+        try:
+            return self.validate(text1, text2, threshold)
+        except SemanticValidationError as e:
+            return Result(self.validator_name, False, str(e))
+
     def validate(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
         """
         Validate semantic similarity between two texts.
@@ -42,4 +71,143 @@ class SemanticValidatorBase:
         Raises:
             SemanticValidationError: If validation fails
         """
-        pass
\ No newline at end of file
+        if type(self).check is SemanticValidatorBase.check:
+            raise NotImplementedError("Subclasses must implement check or validate.")
+        result = self.check(text1, text2, threshold)
+        if result.status is False:
+            raise SemanticValidationError(result.reason)
+        return result
+
+    def check_content(self, content, text2: str, threshold: float = 0.8) -> Result:
+        """
+        Like :meth:`check`, but ``content`` may be a :class:`~aisert.models.content_view.ContentView`.
+        
+        For a view, the content's text form is used, and providers that
+        implement :meth:`_embed_text` embed it once per chain and model. When
+        the content is not embedded yet, it is embedded together with the
+        reference through :meth:`_embed_pair`.
+        
+        Args:
+            content: Text or ContentView to compare
+            text2: Reference text
+            threshold: Minimum similarity threshold (0.0 to 1.0)
+            
+        Returns:
+            Result object with validation outcome
+        """
+        if type(content) is not ContentView:
+            return self.check(content, text2, threshold)
+        if not self._embeds:
+            return self.check(content.text, text2, threshold)
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+        reference = None
+
+        def embed_both():
+            nonlocal reference
+            embedding, reference = self._embed_pair(content.text, text2)
+            return embedding
+
+        embedding = content.derived(("embedding", self), embed_both)
+        if reference is None:
+            reference = self._embed_reference(text2)
+        return self._score_result(self.label, self._embedding_similarity(embedding, reference), threshold)
+
+    def prepare(self, text2: str, threshold: float = 0.8):
+        """
+        Bind the reference text and threshold once; returns a callable checking one content.
+        
+        Providers that implement :meth:`_embed_text` embed ``text2`` up front,
+        so each call only embeds the content.
+        
+        Args:
+            text2: Reference text
+            threshold: Minimum similarity threshold (0.0 to 1.0)
+            
+        Returns:
+            Callable taking ``text1`` (or a ContentView) and returning a Result
+        """
+        if not (0 <= threshold <= 1):
+            raise SemanticValidationError("Threshold must be between 0 and 1")
+        if not self._embeds:
+            return functools.partial(self.check_content, text2=text2, threshold=threshold)
+        return functools.partial(self._check_reference, self._embed_reference(text2), threshold)
+
+    @property
+    def _embeds(self) -> bool:
+        return type(self)._embed_text is not SemanticValidatorBase._embed_text
+
+    def _embed_text(self, text: str):
+        """
+        Embed one text. Providers that compare embeddings implement this and
+        :meth:`_embedding_similarity` (and set ``label``) so reference
+        embeddings can be precomputed and content embeddings cached per chain.
+        """
+        raise NotImplementedError
+
+    def _embed_reference(self, text: str):
+        """Embed the reference text; the same as :meth:`_embed_text` unless a provider embeds references differently."""
+        return self._embed_text(text)
+
+    def _embed_pair(self, text: str, reference: str):
+        """
+        Embed a content and a reference; returns ``(embedding, reference_embedding)``.
+
+        Providers that batch override this to embed both in one call.
+        """
+        return self._embed_text(text), self._embed_reference(reference)
+
+    def _embedding_similarity(self, embedding, reference) -> float:
+        """Similarity score between a content embedding and a reference embedding."""
+        raise NotImplementedError
+
+    def _check_reference(self, reference, threshold: float, content) -> Result:
+        if type(content) is ContentView:
+            view = content
+            embedding = view.derived(("embedding", self), lambda: self._embed_text(view.text))
+        else:
+            embedding = self._embed_text(content)
+        return self._score_result(self.label, self._embedding_similarity(embedding, reference), threshold)
+
+    def _score_result(self, label: str, score, threshold: float) -> Result:
+        """
+        Build the Result for a similarity score; the reason is only formatted when read.
+        
+        Args:
+            label: Provider label used in the reason (e.g. "TF-IDF")
+            score: Similarity score
+            threshold: Minimum similarity threshold
+        """
+        if score < threshold:
+            return Result(self.validator_name, False, "%s similarity score: %s is lesser than threshold: %s",
+                          args=(label, score, threshold), score=float(score))
+        return Result(self.validator_name, True, "%s similarity score: %s, Threshold: %s",
+                      args=(label, score, threshold), score=float(score))
+
+    async def acheck(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        """
+        Awaitable variant of :meth:`check`.
+        
+        The default implementation runs :meth:`check` on the managed executor.
+        Providers that call a remote API override this with an async client.
+        
+        Returns:
+            Result object with validation outcome
+        """
+        from ...utils.async_util import run_sync
+        return await run_sync(self.check, text1, text2, threshold)
+
+    async def avalidate(self, text1: str, text2: str, threshold: float = 0.8) -> Result:
+        """
+        Awaitable variant of :meth:`validate`.
+        
+        Returns:
+            Result object with validation outcome
+            
+        Raises:
+            SemanticValidationError: If validation fails
+        """
+        result = await self.acheck(text1, text2, threshold)
+        if result.status is False:
+            raise SemanticValidationError(result.reason)
+        return result
@@ -1,5 +1,6 @@
-from .common_semantic_validators import TFIDFSemanticValidator, HuggingFaceSemanticValidator, OpenAISemanticValidator, \
-    SentenceTransformersSemanticValidator
+from .common_semantic_validators import TFIDFSemanticValidator, HashingSemanticValidator, \
+    HuggingFaceSemanticValidator, OpenAISemanticValidator, SentenceTransformersSemanticValidator, \
+    ONNXSemanticValidator, StaticEmbeddingSemanticValidator
 from ...exception import SemanticValidationError
 
 
@@ -9,8 +10,11 @@ class SemanticValidatorFactory:
     _semantic_validators = {
         "sentence_transformers": SentenceTransformersSemanticValidator,
         "tfidf": TFIDFSemanticValidator,
+        "hashing": HashingSemanticValidator,
         "huggingface": HuggingFaceSemanticValidator,
         "openai": OpenAISemanticValidator,
+        "onnx": ONNXSemanticValidator,
+        "static": StaticEmbeddingSemanticValidator,
     }
 
     @classmethod
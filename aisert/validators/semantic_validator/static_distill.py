@@ -0,0 +1,88 @@
+"""Distill a local sentence-transformers model into a static token embedding table.
+
+Usage::
+
+    python -m aisert.validators.semantic_validator.static_distill all-MiniLM-L6-v2 ./minilm-static --dims 256
+
+Every vocabulary token is embedded once through the model (model2vec-style),
+optionally reduced with PCA, and written to ``embeddings.npy`` next to the
+tokenizer. The output directory can then be used as ``semantic_model`` with
+``semantic_provider="static"``.
+"""
+
+import argparse
+import logging
+import os
+
+from ...exception import SemanticValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def distill(model_name: str, output_dir: str, dims: int = None, batch_size: int = 1024) -> str:
+    """
+    Distill a sentence-transformers model into ``output_dir``.
+
+    :param model_name: Name or local path of a sentence-transformers model.
+    :param output_dir: Directory to write ``embeddings.npy`` and the tokenizer to.
+    :param dims: Optional PCA output dimension (must not exceed the model dimension).
+    :param batch_size: Number of vocabulary tokens embedded per forward pass.
+    :return: The output directory.
+    """
+    try:
+        import numpy as np
+        import torch
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise SemanticValidationError(
+            "sentence-transformers not installed. Install with: pip install aisert[sentence-transformers]"
+        )
+
+    os.makedirs(output_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    tokenizer = st_model.tokenizer
+    vocab_size = len(tokenizer)
+    special_ids = set(tokenizer.all_special_ids)
+    prefix = [tokenizer.cls_token_id] if tokenizer.cls_token_id is not None else []
+    suffix = [tokenizer.sep_token_id] if tokenizer.sep_token_id is not None else []
+
+    table = np.zeros((vocab_size, st_model.get_sentence_embedding_dimension()), dtype=np.float32)
+    with torch.no_grad():
+        for start in range(0, vocab_size, batch_size):
+            ids = [i for i in range(start, min(start + batch_size, vocab_size)) if i not in special_ids]
+            if not ids:
+                continue
+            input_ids = torch.tensor([prefix + [i] + suffix for i in ids])
+            features = {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
+            if "token_type_ids" in tokenizer.model_input_names:
+                features["token_type_ids"] = torch.zeros_like(input_ids)
+            table[ids] = st_model(features)["sentence_embedding"].numpy()
+            logger.debug("Embedded tokens %d-%d of %d", start, start + len(ids), vocab_size)
+
+    if dims:
+        if dims > table.shape[1]:
+            raise SemanticValidationError(f"dims {dims} exceeds model dimension {table.shape[1]}")
+        centered = table - table.mean(axis=0)
+        _, _, components = np.linalg.svd(centered, full_matrices=False)
+        table = centered @ components[:dims].T
+
+    np.save(os.path.join(output_dir, "embeddings.npy"), table.astype(np.float32))
+    tokenizer.backend_tokenizer.save(os.path.join(output_dir, "tokenizer.json"))
+    logger.info("Distilled %s into %s (%d x %d)", model_name, output_dir, *table.shape)
+    return output_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distill a sentence-transformers model into a static embedding table.")
+    parser.add_argument("model", help="sentence-transformers model name or local path")
+    parser.add_argument("output_dir", help="directory to write the embedding table to")
+    parser.add_argument("--dims", type=int, default=None, help="reduce to this many dimensions with PCA")
+    parser.add_argument("--batch-size", type=int, default=1024, help="tokens per forward pass (default: 1024)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    distill(args.model, args.output_dir, dims=args.dims, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+import codecs
+import json
+import re
+import types
+from typing import Annotated, Any, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field, RootModel, ValidationError
+
+from .schema_validator import SchemaValidator
+from ..exception import SchemaValidationError
+from ..models.result import Result
+from ..models.validator_enums import ValidatorEnums
+from ..utils.cache_util import LRUCache
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_BARE = re.compile(r'[^ \t\n\r{}\[\]:,"]*')
+_LITERAL = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null")
+_QUOTE_OR_ESCAPE = re.compile(r'["\\]')
+# ``X | Y`` unions have their own origin on Python 3.10+
+_UNION_TYPES = (Union,) + ((types.UnionType,) if hasattr(types, "UnionType") else ())
+
+# What the parser expects next
+_VALUE, _VALUE_OR_CLOSE, _KEY_OR_CLOSE, _KEY, _COLON, _NEXT, _END = range(7)
+
+
+class _Node:
+    """How one position of the schema is checked while streaming.
+
+    ``model``, ``list`` and ``dict`` nodes are descended into so their members
+    are checked as they close; a ``leaf`` is buffered and validated whole with
+    its TypeAdapter. Positions with no constraints (``Any``, unknown keys) have no node.
+    """
+
+    __slots__ = ("kind", "schema", "strict", "nullable", "keys", "required", "forbid_extra",
+                 "_fields", "_children", "_item_schema", "_item", "_key_schema", "_adapter")
+
+    MODEL, LIST, DICT, LEAF = "model", "list", "dict", "leaf"
+
+    def __init__(self, kind: str, schema: Any, strict: bool = False):
+        self.kind = kind
+        self.schema = schema
+        self.strict = strict
+        self.nullable = False
+        self._item_schema = None
+        self._item = None
+        self._adapter = None
+
+    @property
+    def adapter(self):
+        if self._adapter is None:
+            self._adapter = SchemaValidator._type_adapter(self.schema)
+        return self._adapter
+
+    def child(self, name: str) -> Optional["_Node"]:
+        """Node of a model field, built on first use so recursive models work."""
+        try:
+            return self._children[name]
+        except KeyError:
+            return self._children.setdefault(name, _build_node(self._fields[name], self.strict))
+
+    @property
+    def item(self) -> Optional["_Node"]:
+        """Node of list items or dict values."""
+        if self._item is None and self._item_schema is not None:
+            self._item = _build_node(self._item_schema, self.strict)
+        return self._item
+
+
+def _build_node(schema: Any, strict: bool = False) -> Optional[_Node]:
+    if schema is Any or schema is object:
+        return None
+    origin = get_origin(schema)
+    if origin in _UNION_TYPES:
+        members = [arg for arg in get_args(schema) if arg is not type(None)]
+        inner = _build_node(members[0], strict) if len(members) == 1 else None
+        if inner is None or inner.kind == _Node.LEAF:
+            return _Node(_Node.LEAF, schema, strict)
+        inner.nullable = True
+        return inner
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return _model_node(schema, strict)
+    if schema is list or origin is list:
+        node = _Node(_Node.LIST, schema, strict)
+        node._item_schema = (get_args(schema) or (Any,))[0]
+        return node
+    if schema is dict or origin is dict:
+        key_schema, value_schema = get_args(schema) or (str, Any)
+        node = _Node(_Node.DICT, schema, strict)
+        node._key_schema = None if key_schema in (str, Any) else key_schema
+        node._item_schema = value_schema
+        return node
+    return _Node(_Node.LEAF, schema, strict)
+
+
+def _model_node(model: type, strict: bool) -> _Node:
+    """
+    Models with validators, root models and non-string aliases are validated whole,
+    since their fields cannot be checked one at a time.
+    """
+    config = model.model_config
+    strict = config.get("strict", strict)
+    decorators = model.__pydantic_decorators__
+    fields = model.model_fields
+    if (issubclass(model, RootModel) or decorators.model_validators or decorators.field_validators
+            or decorators.validators or decorators.root_validators
+            or any(not isinstance(field.validation_alias, (str, type(None))) for field in fields.values())):
+        return _Node(_Node.LEAF, model, strict)
+
+    node = _Node(_Node.MODEL, model, strict)
+    by_alias = config.get("validate_by_alias", True)
+    by_name = config.get("populate_by_name", False) or config.get("validate_by_name", False)
+    node.keys, node.required, node._fields, node._children = {}, {}, {}, {}
+    for name, field in fields.items():
+        key = field.validation_alias if by_alias and field.validation_alias else name
+        node.keys[key] = name
+        if by_name:
+            node.keys[name] = name
+        if field.is_required():
+            node.required[name] = key
+        extras = list(field.metadata)
+        if field.discriminator is not None:
+            extras.append(Field(discriminator=field.discriminator))
+        node._fields[name] = Annotated[(field.annotation, *extras)] if extras else field.annotation
+    node.forbid_extra = config.get("extra") == "forbid"
+    return node
+
+
+class _Frame:
+    __slots__ = ("container", "node", "key", "index", "seen", "value_node")
+
+    def __init__(self, container: str, node: Optional[_Node]):
+        self.container = container
+        self.node = node
+        self.key = None
+        self.index = 0
+        self.seen = set()
+        self.value_node = None
+
+
+class StreamingSchemaValidator:
+    """
+    Validates streamed JSON against a schema as it arrives, failing on the first violation.
+
+    Chunks are tokenized incrementally and matched against the schema's
+    structure: each scalar is validated against its field type as soon as it
+    is complete, unknown keys are rejected when the model forbids extras, and
+    missing required fields are reported when their object closes. Memory is
+    bounded by the nesting depth plus the longest single value, not by the
+    document size.
+
+    Models with field or model validators, root models, unions of models and
+    constrained containers are buffered and validated whole when they close;
+    their members are not checked earlier. Use one instance per stream.
+
+    Example usage::
+
+        stream = StreamingSchemaValidator(Answer)
+        for chunk in response:
+            if stream.feed(chunk) is not None:
+                break  # fail fast, e.g. wrong type or unknown enum value in an early field
+        result = stream.close()
+
+    .. versionadded:: 0.2.0
+    """
+
+    _roots = LRUCache(max_entries=256)
+
+    def __init__(self, schema: Any):
+        """
+        :param schema: Pydantic model class or generic type, as for ``assert_schema``
+        :raises SchemaValidationError: If the schema is not a Pydantic model or generic type
+        """
+        if isinstance(schema, dict):
+            raise SchemaValidationError("JSON Schema documents cannot be streamed; use assert_schema")
+        adapter = SchemaValidator._adapter(schema)
+        self.validator_name = ValidatorEnums.SCHEMA.value
+        self._root = self._roots.get_or_create(schema, lambda: _build_node(schema)) \
+            if _hashable(schema) else _build_node(schema)
+        self._title = schema.__name__ if isinstance(schema, type) else _title(adapter)
+        self._stack = []
+        self._expect = _VALUE
+        self._capture = None
+        self._capture_node = None
+        self._capture_depth = 0
+        self._pending = None
+        self._pending_string = False
+        self._escaped = False
+        self._pending_at = 0
+        self._base = 0
+        self._at = 0
+        self._decoder = None
+        self._failure = None
+
+    @property
+    def failure(self) -> Optional[Result]:
+        """The failed Result once a violation is found, otherwise None."""
+        return self._failure
+
+    def feed(self, chunk) -> Optional[Result]:
+        """
+        Consume the next chunk of the document.
+
+        :param chunk: Text, or UTF-8 bytes (characters split across chunks are handled)
+        :return: None while the document is valid so far, otherwise the failed Result
+        """
+        if self._failure is None:
+            self._consume(self._decode(chunk), final=False)
+        return self._failure
+
+    def close(self) -> Result:
+        """
+        Finish the document.
+
+        :return: Result true if the complete document matched the schema, otherwise the failure
+        """
+        if self._failure is None:
+            self._consume(self._decode(b"", final=True) if self._decoder else "", final=True)
+        if self._failure is None and self._expect != _END:
+            self._syntax_error("Unexpected end of input", self._base)
+        return self._failure or Result(self.validator_name, True, "")
+
+    def _decode(self, chunk, final: bool = False) -> str:
+        if isinstance(chunk, str):
+            return chunk
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError as e:
+            self._syntax_error(f"Invalid UTF-8 ({e.reason})", self._base)
+            return ""
+
+    def _consume(self, text: str, final: bool):
+        pos = 0 if self._pending is None else self._resume(text, final)
+        end = len(text)
+        while 0 <= pos < end and self._failure is None:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos == end:
+                break
+            self._at = self._base + pos
+            char = text[pos]
+            if char == '"':
+                stop = self._string_end(text, pos + 1)
+                if stop == -1:
+                    self._hold(text[pos:], True)
+                    break
+                self._token(text[pos:stop])
+                pos = stop
+            elif char in "{}[]:,":
+                self._punct(char)
+                pos += 1
+            else:
+                stop = _BARE.match(text, pos).end()
+                if stop == end and not final:
+                    self._hold(text[pos:], False)
+                    break
+                self._token(text[pos:stop])
+                pos = stop
+        self._base += end
+        if final and self._pending is not None and self._failure is None:
+            self._syntax_error("Unterminated string", self._pending_at)
+
+    def _hold(self, piece: str, string: bool):
+        """Keep an unfinished token; pieces are joined once it completes, so long strings are not copied per chunk."""
+        self._pending = [piece]
+        self._pending_string = string
+        self._pending_at = self._at
+
+    def _resume(self, text: str, final: bool) -> int:
+        """Complete a token left unfinished by the previous chunk; returns where to continue, or -1."""
+        if self._pending_string:
+            stop = -1 if not text else self._string_end(text, 1 if self._escaped else 0)
+        else:
+            stop = _BARE.match(text).end()
+            stop = -1 if stop == len(text) and not final else stop
+        if stop == -1:
+            self._pending.append(text)
+            return -1
+        self._pending.append(text[:stop])
+        token, self._pending = "".join(self._pending), None
+        self._at = self._pending_at
+        self._token(token)
+        return stop
+
+    def _string_end(self, text: str, pos: int) -> int:
+        """Index just past the closing quote, or -1 with ``_escaped`` set if the text ends inside an escape."""
+        search = _QUOTE_OR_ESCAPE.search
+        while True:
+            match = search(text, pos)
+            if match is None:
+                self._escaped = False
+                return -1
+            if match.group() == '"':
+                return match.end()
+            pos = match.end() + 1
+            if pos > len(text):
+                self._escaped = True
+                return -1
+
+    def _punct(self, char: str):
+        expect = self._expect
+        if char in "{[":
+            if expect != _VALUE and expect != _VALUE_OR_CLOSE:
+                return self._unexpected(char)
+            return self._open(char)
+        if char in "}]":
+            frame = self._stack[-1] if self._stack else None
+            if frame is None or frame.container != ("{" if char == "}" else "["):
+                return self._syntax_error(f"Unexpected '{char}'", self._at)
+            if expect == _NEXT or (expect == _VALUE_OR_CLOSE and char == "]") or (
+                    expect == _KEY_OR_CLOSE and char == "}"):
+                return self._close(frame, char)
+            return self._unexpected(char)
+        if expect != (_COLON if char == ":" else _NEXT):
+            return self._unexpected(char)
+        if self._capture is not None:
+            self._capture.append(char)
+        if char == ":":
+            self._expect = _VALUE
+        elif self._stack[-1].container == "{":
+            self._expect = _KEY
+        else:
+            self._stack[-1].index += 1
+            self._expect = _VALUE
+
+    def _open(self, char: str):
+        node = self._value_node()
+        if self._capture is not None:
+            self._capture.append(char)
+            node = None
+        elif node is not None:
+            if node.kind == _Node.LEAF:
+                self._capture, self._capture_node, self._capture_depth = [char], node, len(self._stack)
+                node = None
+            elif (node.kind != _Node.LIST) != (char == "{"):
+                return self._check(node, "{}" if char == "{" else "[]", hide_input=True)
+        self._stack.append(_Frame(char, node))
+        self._expect = _KEY_OR_CLOSE if char == "{" else _VALUE_OR_CLOSE
+
+    def _close(self, frame: _Frame, char: str):
+        self._stack.pop()
+        if self._capture is not None:
+            self._capture.append(char)
+            if len(self._stack) == self._capture_depth:
+                text, self._capture = "".join(self._capture), None
+                self._check(self._capture_node, text)
+        elif frame.node is not None and frame.node.kind == _Node.MODEL:
+            missing = [key for name, key in frame.node.required.items() if name not in frame.seen]
+            if missing:
+                return self._fail([{"type": "missing", "loc": (key,), "input": None} for key in missing],
+                                  hide_input=True)
+        self._expect = _NEXT if self._stack else _END
+
+    def _token(self, text: str):
+        expect = self._expect
+        if expect == _KEY or expect == _KEY_OR_CLOSE:
+            if text[0] != '"':
+                return self._syntax_error("Expecting property name enclosed in double quotes", self._at)
+            self._expect = _COLON
+            return self._key(text)
+        if expect != _VALUE and expect != _VALUE_OR_CLOSE:
+            return self._unexpected(text)
+        if text[0] != '"' and not _LITERAL.fullmatch(text):
+            return self._syntax_error("Expecting value", self._at)
+        node = self._value_node()
+        self._expect = _NEXT if self._stack else _END
+        if self._capture is not None:
+            self._capture.append(text)
+        elif node is not None and not (node.nullable and text == "null"):
+            self._check(node, text)
+
+    def _key(self, text: str):
+        frame = self._stack[-1]
+        node = frame.node
+        if self._capture is not None:
+            self._capture.append(text)
+            return
+        if node is None:
+            return
+        try:
+            key = json.loads(text)
+        except ValueError as e:
+            return self._syntax_error(e.msg, self._at)
+        frame.key = key
+        if node.kind == _Node.DICT:
+            if node._key_schema is not None:
+                self._check_key(node._key_schema, key)
+            frame.value_node = node.item
+            return
+        name = node.keys.get(key)
+        if name is None:
+            frame.value_node = None
+            if node.forbid_extra:
+                self._fail([{"type": "extra_forbidden", "loc": (), "input": None}], hide_input=True)
+            return
+        frame.seen.add(name)
+        frame.value_node = node.child(name)
+
+    def _value_node(self) -> Optional[_Node]:
+        if not self._stack:
+            return self._root
+        frame = self._stack[-1]
+        if frame.container == "{":
+            return frame.value_node
+        return frame.node.item if frame.node is not None else None
+
+    def _path(self) -> tuple:
+        return tuple(frame.key if frame.container == "{" else frame.index for frame in self._stack)
+
+    def _check(self, node: _Node, text: str, hide_input: bool = False):
+        try:
+            node.adapter.validate_json(text, strict=True if node.strict else None)
+        except ValidationError as e:
+            self._fail(e.errors(include_url=False), hide_input)
+        except Exception as e:
+            raise SchemaValidationError(f"Unexpected error: {e}")
+
+    def _check_key(self, schema: Any, key: str):
+        try:
+            SchemaValidator._type_adapter(schema).validate_strings(key)
+        except ValidationError as e:
+            self._fail(e.errors(include_url=False))
+
+    def _fail(self, errors: list, hide_input: bool = False):
+        """Record pydantic errors, with their locations made relative to the document root."""
+        path = self._path()
+        for error in errors:
+            error["loc"] = path + tuple(error["loc"])
+        error = ValidationError.from_exception_data(self._title, errors, hide_input=hide_input)
+        self._failure = Result(self.validator_name, False, "%s", args=(error,), count=len(errors))
+
+    def _unexpected(self, token: str):
+        expecting = {_COLON: "Expecting ':' delimiter", _NEXT: "Expecting ',' delimiter", _END: "Extra data",
+                     _KEY: "Expecting property name enclosed in double quotes"}
+        self._syntax_error(expecting.get(self._expect, "Expecting value"), self._at)
+
+    def _syntax_error(self, message: str, offset: int):
+        self._failure = Result(self.validator_name, False, "Content is not a valid JSON: %s (char %d)",
+                               args=(message, offset))
+
+
+def _hashable(schema: Any) -> bool:
+    try:
+        hash(schema)
+        return True
+    except TypeError:
+        return False
+
+
+def _title(adapter) -> str:
+    """Title pydantic gives errors for a generic schema, e.g. ``list[Answer]``."""
+    try:
+        adapter.validate_python(object())
+    except ValidationError as e:
+        return e.title
+    return "Schema"
@@ -1,5 +1,5 @@
 from functools import cached_property
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from .token_validator_base import TokenValidatorBase
 from ...exception import TokenValidationError
 
@@ -9,10 +9,60 @@ import threading
 class OpenAITokenValidator(TokenValidatorBase):
     """
     A token counter for OpenAI models.
+
+    Instances are shared per encoding rather than per model name: model names
+    are resolved to their tiktoken encoding through a local table (exact names,
+    then prefixes), so e.g. "gpt-4", "gpt-4-0613" and "gpt-3.5-turbo" all use
+    the one ``cl100k_base`` instance and its single encoding handle. Names
+    missing from the table are resolved by tiktoken once, and models tiktoken
+    does not know keep an instance of their own.
     """
     _instances = {}
     _lock = threading.RLock()
 
+    MODEL_ENCODINGS: Dict[str, str] = {
+        "o1": "o200k_base",
+        "o3": "o200k_base",
+        "o4-mini": "o200k_base",
+        "gpt-5": "o200k_base",
+        "gpt-4.1": "o200k_base",
+        "gpt-4o": "o200k_base",
+        "gpt-4": "cl100k_base",
+        "gpt-3.5-turbo": "cl100k_base",
+        "gpt-3.5": "cl100k_base",
+        "gpt-35-turbo": "cl100k_base",
+        "davinci-002": "cl100k_base",
+        "babbage-002": "cl100k_base",
+        "text-embedding-ada-002": "cl100k_base",
+        "text-embedding-3-small": "cl100k_base",
+        "text-embedding-3-large": "cl100k_base",
+        "text-davinci-003": "p50k_base",
+        "text-davinci-002": "p50k_base",
+        "gpt2": "gpt2",
+        "gpt-2": "gpt2",
+    }
+    # checked in order, so a prefix must come before any shorter prefix of it
+    MODEL_PREFIX_ENCODINGS: Tuple[Tuple[str, str], ...] = (
+        ("o1-", "o200k_base"),
+        ("o3-", "o200k_base"),
+        ("o4-mini-", "o200k_base"),
+        ("gpt-5", "o200k_base"),
+        ("gpt-4.5-", "o200k_base"),
+        ("gpt-4.1-", "o200k_base"),
+        ("chatgpt-4o-", "o200k_base"),
+        ("gpt-4o-", "o200k_base"),
+        ("gpt-4-", "cl100k_base"),
+        ("gpt-3.5-turbo-", "cl100k_base"),
+        ("gpt-35-turbo-", "cl100k_base"),
+        ("gpt-oss-", "o200k_harmony"),
+        ("ft:gpt-4o", "o200k_base"),
+        ("ft:gpt-4", "cl100k_base"),
+        ("ft:gpt-3.5-turbo", "cl100k_base"),
+        ("ft:davinci-002", "cl100k_base"),
+        ("ft:babbage-002", "cl100k_base"),
+    )
+    _resolved: Dict[str, Optional[str]] = {}
+
     def __init__(self, token_model, token_encoding):
         super().__init__()
         self.token_model = token_model
@@ -20,14 +70,50 @@ class OpenAITokenValidator(TokenValidatorBase):
 
     @classmethod
     def get_instance(cls, token_model: str = None, token_encoding: str = None, **kwargs):
+        """
+        Get the instance for the encoding of the specified model or the specified encoding.
+        :param token_model: The model to count tokens for; resolved to its encoding.
+        :param token_encoding: The tiktoken encoding name; takes precedence over the model.
+        :return: An instance of OpenAITokenValidator, shared by all models with the same encoding.
+        """
         if not token_encoding and not token_model:
             raise TokenValidationError("Either token_encoding or token_model must be provided.")
 
+        if not token_encoding:
+            token_encoding = cls.encoding_for_model(token_model)
+            if token_encoding:
+                token_model = None
         key = token_encoding or token_model
-        with cls._lock:
-            if key not in cls._instances:
-                cls._instances[key] = cls(token_model, token_encoding)
-            return cls._instances[key]
+        instance = cls._instances.get(key)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.setdefault(key, cls(token_model, token_encoding))
+        return instance
+
+    @classmethod
+    def encoding_for_model(cls, token_model: str) -> Optional[str]:
+        """
+        Returns the tiktoken encoding name of a model, or None if it is unknown.
+
+        The local table is checked first; other names are looked up in tiktoken
+        once, and every answer is remembered.
+        :param token_model: The model name, e.g. "gpt-4o-2024-05-13".
+        """
+        try:
+            return cls._resolved[token_model]
+        except KeyError:
+            pass
+        encoding = cls.MODEL_ENCODINGS.get(token_model)
+        if encoding is None:
+            encoding = next((encoding for prefix, encoding in cls.MODEL_PREFIX_ENCODINGS
+                             if token_model.startswith(prefix)), None)
+        if encoding is None:
+            try:
+                import tiktoken
+                encoding = tiktoken.encoding_name_for_model(token_model)
+            except (ImportError, KeyError):
+                encoding = None
+        return cls._resolved.setdefault(token_model, encoding)
 
     @cached_property
     def encoding_client(self):
@@ -39,9 +125,9 @@ class OpenAITokenValidator(TokenValidatorBase):
 
         try:
             if self.token_encoding:
-                self.logger.info(f"Using token encoding: {self.token_encoding}")
+                self.logger.info("Using token encoding: %s", self.token_encoding)
                 try:
-                    if self.token_encoding not in tiktoken.list_encodings():
+                    if self.token_encoding not in tiktoken.list_encoding_names():
                         raise TokenValidationError(
                             f"Encoding {self.token_encoding} not found in tiktoken."
                         )
@@ -65,11 +151,11 @@ class OpenAITokenValidator(TokenValidatorBase):
         """
         try:
             token_length = len(self.encoding_client.encode(text))
-            self.logger.info(f"Token size is {token_length}.")
+            self.logger.debug("Token size is %d.", token_length)
             return token_length
         except Exception as e:
             raise TokenValidationError(
-                f"Failed to count tokens for model {self.token_model}: {e}",
+                f"Failed to count tokens for {self.token_encoding or self.token_model}: {e}",
             )
 
 
@@ -109,7 +195,7 @@ class HuggingFaceTokenValidator(TokenValidatorBase):
         from transformers import AutoTokenizer
 
         try:
-            self.logger.info(f"Using token model: {self.token_model}")
+            self.logger.info("Using token model: %s", self.token_model)
             tokenizer = AutoTokenizer.from_pretrained(self.token_model)
             return tokenizer
         except Exception as e:
@@ -120,7 +206,7 @@ class HuggingFaceTokenValidator(TokenValidatorBase):
     def count(self, text):
         try:
             token_length = len(self.encoding_client.encode(text))
-            self.logger.info(f"Token size is {token_length}.")
+            self.logger.debug("Token size is %d.", token_length)
             return token_length
         except Exception as e:
             raise TokenValidationError(
@@ -170,6 +256,27 @@ class AnthropicTokenValidator(TokenValidatorBase):
                 f"Failed to get anthropic client: {e}"
             )
 
+    @cached_property
+    def _async_clients(self):
+        """anthropic async clients for ``acount``, one per running event loop."""
+        from ...utils.async_util import LoopClient
+        import anthropic
+
+        return LoopClient(anthropic.AsyncClient)
+
+    @property
+    def async_encoding_client(self):
+        """
+        Returns the async client for the specified token model, one per running event loop.
+        :return: The async client object.
+        """
+        try:
+            return self._async_clients.get()
+        except Exception as e:
+            raise TokenValidationError(
+                f"Failed to get anthropic async client: {e}"
+            )
+
     def count(self, text):
         """
         Counts the number of tokens in the provided text.
@@ -180,7 +287,24 @@ class AnthropicTokenValidator(TokenValidatorBase):
             token_length = self.encoding_client.count_tokens(
                 model=self.token_model, messages=text
             )
-            self.logger.info(f"Token size is {token_length}.")
+            self.logger.debug("Token size is %d.", token_length)
+            return token_length
+        except Exception as e:
+            raise TokenValidationError(
+                f"Failed to count tokens for model {self.token_model}: {e}",
+            )
+
+    async def acount(self, text):
+        """
+        Counts the number of tokens in the provided text using the async client.
+        :param text: The input text to count tokens from.
+        :return: The number of tokens in the text.
+        """
+        try:
+            token_length = await self.async_encoding_client.count_tokens(
+                model=self.token_model, messages=text
+            )
+            self.logger.debug("Token size is %d.", token_length)
             return token_length
         except Exception as e:
             raise TokenValidationError(
@@ -229,6 +353,14 @@ class GoogleTokenValidator(TokenValidatorBase):
                 f"Failed to get google genai client: {e}"
             )
 
+    @cached_property
+    def _async_clients(self):
+        """genai clients for ``acount``, one per running event loop."""
+        from ...utils.async_util import LoopClient
+        from google import genai
+
+        return LoopClient(genai.Client)
+
     def count(self, text):
         """
         Counts the number of tokens in the provided text.
@@ -240,7 +372,26 @@ class GoogleTokenValidator(TokenValidatorBase):
                 model=self.token_model,
                 contents=text
             ).total_tokens
-            self.logger.info(f"Token size is {token_length}.")
+            self.logger.debug("Token size is %d.", token_length)
+            return token_length
+        except Exception as e:
+            raise TokenValidationError(
+                f"Failed to count tokens for model {self.token_model}: {e}",
+            )
+
+    async def acount(self, text):
+        """
+        Counts the number of tokens in the provided text using the async client.
+        :param text: The input text to count tokens from.
+        :return: The number of tokens in the text.
+        """
+        try:
+            response = await self._async_clients.get().aio.models.count_tokens(
+                model=self.token_model,
+                contents=text
+            )
+            token_length = response.total_tokens
+            self.logger.debug("Token size is %d.", token_length)
             return token_length
         except Exception as e:
             raise TokenValidationError(
@@ -1,9 +1,11 @@
 """Token validation module for counting and validating token limits in text content."""
+import functools
 import json
 
 from .token_validator_factory import TokenValidatorFactory
 from ...exception import TokenValidationError
 from ..validator import BaseValidator
+from ...models.content_view import ContentView
 from ...models.result import Result
 from ...models.validator_enums import ValidatorEnums
 
@@ -11,6 +13,9 @@ from ...models.validator_enums import ValidatorEnums
 class TokenValidator(BaseValidator):
     """Validates the number of tokens in a given text."""
 
+    cost = 10
+    error_class = TokenValidationError
+
     def __init__(self, config):
         super().__init__(ValidatorEnums.TOKENS)
         if not config or not config.has_token_config():
@@ -19,28 +24,82 @@ class TokenValidator(BaseValidator):
         self.token_model = config.token_model
         self.token_encoding = config.token_encoding
 
-    def validate(self, text, token_limit: int = 100, **kwargs):
-        """Validates the number of tokens in the text."""
+    @classmethod
+    def get_instance(cls, config):
+        """Get the shared TokenValidator for the config's token provider, model and encoding."""
+        if not config or not config.has_token_config():
+            raise TokenValidationError("Token validation requires token configuration")
+        key = (cls, config.token_provider, config.token_model, config.token_encoding)
+        instance = BaseValidator._instances.get(key)
+        if instance is None:
+            with BaseValidator._lock:
+                instance = BaseValidator._instances.setdefault(key, cls(config))
+        return instance
+
+    def prepare(self, token_limit: int = 100, **kwargs):
+        """Resolves the token provider once and returns a callable checking one content."""
+        return functools.partial(self._check_prepared, self._load_token_validator(), token_limit)
+
+    def _check_prepared(self, token_validator, token_limit: int, text) -> Result:
         try:
-            token_validator = TokenValidatorFactory.get_instance(
-                model_provider=self.token_provider,
-                token_model=self.token_model,
-                token_encoding=self.token_encoding
-            )
-            
+            if type(text) is ContentView:
+                view = text
+                return self._result(view.derived(("tokens", token_validator), lambda: token_validator.count(view.text)),
+                                    token_limit)
+
             if not isinstance(text, str):
                 text = json.dumps(text)
 
-            token_count = token_validator.count(text)
-            self.logger.debug(f"Token count: {token_count}")
+            return self._result(token_validator.count(text), token_limit)
+
+        except TokenValidationError:
+            raise
+        except Exception as e:
+            raise TokenValidationError(f"Unexpected error: {e}") from e
+
+    def _get_token_validator(self):
+        return TokenValidatorFactory.get_instance(
+            model_provider=self.token_provider,
+            token_model=self.token_model,
+            token_encoding=self.token_encoding
+        )
+
+    def _load_token_validator(self):
+        try:
+            return self._get_token_validator()
+        except TokenValidationError:
+            raise
+        except Exception as e:
+            raise TokenValidationError(f"Unexpected error: {e}") from e
+
+    def _result(self, token_count: int, token_limit: int) -> Result:
+        self.logger.debug("Token count: %d", token_count)
+        if token_count > token_limit:
+            return Result(self.validator_name, False, "Token limit exceeded: %d tokens found, limit is %d",
+                          args=(token_count, token_limit), count=token_count)
+
+        return Result(self.validator_name, True, "Token count %d is within limit %d",
+                      args=(token_count, token_limit), count=token_count)
+
+    def check(self, text, token_limit: int = 100, **kwargs):
+        """Checks the number of tokens in the text; an exceeded limit is returned as a failed Result."""
+        return self._check_prepared(self._load_token_validator(), token_limit, text)
+
+    async def acheck(self, text, token_limit: int = 100, **kwargs):
+        """Awaitable variant of :meth:`check`; provider loading runs on the managed executor."""
+        from ...utils.async_util import run_sync
+
+        try:
+            token_validator = await run_sync(self._get_token_validator)
+
+            if type(text) is ContentView:
+                text = text.text
+            elif not isinstance(text, str):
+                text = json.dumps(text)
 
-            if token_count > token_limit:
-                raise TokenValidationError(
-                    f"Token limit exceeded: {token_count} tokens found, limit is {token_limit}")
-            
-            return Result(self.validator_name, True, f"Token count {token_count} is within limit {token_limit}")
+            return self._result(await token_validator.acount(text), token_limit)
 
         except TokenValidationError:
             raise
         except Exception as e:
-            raise TokenValidationError(f"Unexpected error: {e}") from e
\ No newline at end of file
+            raise TokenValidationError(f"Unexpected error: {e}") from e
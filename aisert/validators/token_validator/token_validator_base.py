@@ -78,3 +78,19 @@ class TokenValidatorBase:
             count = validator.count("Hello world")  # Returns token count
         """
         raise NotImplementedError("Subclasses must implement the count method.")
+
+    async def acount(self, text: str) -> int:
+        """
+        Awaitable variant of :meth:`count`.
+        
+        The default implementation runs :meth:`count` on the managed executor.
+        Providers that call a remote API override this with an async client.
+        
+        Args:
+            text: Input text to count tokens for
+        
+        Returns:
+            Number of tokens in the text
+        """
+        from ...utils.async_util import run_sync
+        return await run_sync(self.count, text)
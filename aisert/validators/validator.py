@@ -1,5 +1,8 @@
+import functools
 import logging
+import threading
 
+from ..exception import AisertError
 from ..models.result import Result
 from ..models.validator_enums import ValidatorEnums
 
@@ -15,8 +18,15 @@ class BaseValidator:
     Attributes:
         validator_name: Human-readable name of the validator
         logger: Logger instance for debugging and error reporting
+        cost: Relative cost of a validation; cheaper rules run first in fail-fast chains
+        error_class: Exception raised by :meth:`validate` when validation fails
     """
 
+    cost = 1
+    error_class = AisertError
+    _instances = {}
+    _lock = threading.RLock()
+
     def __init__(self, name: ValidatorEnums):
         """
         Initialize base validator with name and logging.
@@ -27,19 +37,111 @@ class BaseValidator:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.validator_name = name.value
 
+    @classmethod
+    def get_instance(cls):
+        """
+        Get the shared instance of this validator.
+        
+        Validators hold no per-call state, so one instance per class (or per
+        configuration, for validators that take one) is reused across chains
+        and threads.
+        
+        Returns:
+            Shared validator instance
+        """
+        instance = BaseValidator._instances.get(cls)
+        if instance is None:
+            with BaseValidator._lock:
+                instance = BaseValidator._instances.setdefault(cls, cls())
+        return instance
+
+    def check(self, *args, **kwargs) -> Result:
+        """
+        Perform validation and return the result without raising on failure.
+        
+        This is the hot path used by :class:`~aisert.Aisert`: a failed validation
+        is returned as a Result with ``status=False`` and its reason, so no
+        exception is built unless the caller is strict. Invalid arguments (for
+        example a non-list of items) still raise.
+        
+        Subclasses implement this method. For validators that only implement
+        :meth:`validate`, the default adapts its exception into a failed Result.
+        
+        Returns:
+            Result object containing validator name, status, and reason
+        
+        Raises:
+            NotImplementedError: If subclass implements neither check nor validate
+        """
+        if type(self).validate is BaseValidator.validate:
+            raise NotImplementedError("Subclasses must implement this method.")
+        try:
+            return self.validate(*args, **kwargs)
+        except AisertError as e:
+            return Result(self.validator_name, False, str(e))
+
     def validate(self, *args, **kwargs) -> Result:
         """
-        Perform validation and return result.
+        Perform validation and return result, raising on failure.
         
-        Must be implemented by all subclasses to define specific validation logic.
+        Runs :meth:`check` and raises :attr:`error_class` with the failure reason
+        if the validation did not pass.
         
         Returns:
             Result object containing validator name, status, and reason
         
         Raises:
-            NotImplementedError: If subclass doesn't implement this method
+            AisertError: The validator's :attr:`error_class` if validation fails
+            NotImplementedError: If subclass implements neither check nor validate
+        """
+        if type(self).check is BaseValidator.check:
+            raise NotImplementedError("Subclasses must implement this method.")
+        result = self.check(*args, **kwargs)
+        if result.status is False:
+            raise self.error_class(result.reason)
+        return result
+
+    def prepare(self, *args, **kwargs):
+        """
+        Bind everything but the content once and return a callable checking one content.
+        
+        Used by :class:`~aisert.Pipeline` so per-content runs only do per-content
+        work. Validators override this to validate arguments, resolve providers
+        or precompute state up front; the default binds the arguments to :meth:`check`.
+        
+        Returns:
+            Callable taking the content and returning a Result
+        """
+        return functools.partial(self._check_with_args, args, kwargs)
+
+    def _check_with_args(self, args, kwargs, content) -> Result:
+        return self.check(content, *args, **kwargs)
+
+    async def acheck(self, *args, **kwargs) -> Result:
+        """
+        Awaitable variant of :meth:`check`.
+        
+        Runs :meth:`check` on the managed executor so CPU-bound work does not
+        block the event loop. Validators with remote providers override this to
+        use async clients.
+        
+        Returns:
+            Result object containing validator name, status, and reason
+        """
+        from ..utils.async_util import run_sync
+        return await run_sync(self.check, *args, **kwargs)
+
+    async def avalidate(self, *args, **kwargs) -> Result:
+        """
+        Awaitable variant of :meth:`validate`; raises :attr:`error_class` on failure.
+        
+        Returns:
+            Result object containing validator name, status, and reason
         """
-        raise NotImplementedError("Subclasses must implement this method.")
+        result = await self.acheck(*args, **kwargs)
+        if result.status is False:
+            raise self.error_class(result.reason)
+        return result
 
     @property
     def name(self):
@@ -0,0 +1,77 @@
+"""
+Offline evals - one report per row vs columnar batch validation
+
+Validates the same rows with a contains/not-contains/schema rule set twice:
+building one ``Aisert`` chain and ``AisertReport`` per row, and with
+``Aisert.validate_many`` returning a single columnar ``BatchReport``. About a
+third of the rows repeat, as they do for canned refusals and templated answers.
+
+    python benchmarks/batch_validation_benchmark.py --rows 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from aisert import Aisert
+
+
+class Answer(BaseModel):
+    answer: str
+    confidence: float
+
+
+def make_rows(count: int):
+    rows = []
+    for i in range(count):
+        if i % 3 == 0:
+            rows.append('{"answer": "I cannot help with that.", "confidence": 1.0}')
+        else:
+            rows.append(f'{{"answer": "Refund #{i} is processed within 30 days.", "confidence": 0.{i % 10}}}')
+    return rows
+
+
+def per_row(rows):
+    return [(Aisert(row)
+             .assert_contains(["Refund"], strict=False)
+             .assert_not_contains(["spam"], strict=False)
+             .assert_schema(Answer, strict=False)
+             .collect()) for row in rows]
+
+
+def batch(rows, workers):
+    rules = (Aisert.rules()
+             .assert_contains(["Refund"])
+             .assert_not_contains(["spam"])
+             .assert_schema(Answer))
+    return Aisert.validate_many(rows, rules, workers=workers)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    rows = make_rows(args.rows)
+
+    start = time.perf_counter()
+    reports = per_row(rows)
+    per_row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = batch(rows, args.workers)
+    batch_time = time.perf_counter() - start
+
+    assert report.status.tolist() == [r.status for r in reports]
+    print(f"{'per-row reports':<18}{per_row_time:>8.2f}s {len(rows) / per_row_time:>12,.0f} rows/s")
+    print(f"{'validate_many':<18}{batch_time:>8.2f}s {len(rows) / batch_time:>12,.0f} rows/s")
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
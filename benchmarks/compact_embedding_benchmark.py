@@ -0,0 +1,60 @@
+"""
+Compact embedding storage - memory vs accuracy trade-off
+
+Encodes a corpus of embeddings as float32/float16/int8, optionally truncated to
+fewer leading dimensions, and reports memory, similarity-kernel time and the
+score error / top-10 recall against full float32 cosine similarity.
+
+    python benchmarks/compact_embedding_benchmark.py                       # synthetic 1536-d corpus
+    python benchmarks/compact_embedding_benchmark.py --embeddings vecs.npy # real (e.g. OpenAI) embeddings
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aisert.utils.embedding_util import CompactEmbeddings
+
+
+def synthetic_corpus(rows: int, dims: int, seed: int = 0):
+    """Random vectors with decaying per-dimension variance, similar to Matryoshka-trained embeddings."""
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal((rows, dims)) / np.sqrt(np.arange(1, dims + 1))).astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--embeddings", default=None, help=".npy file of shape (rows, dims)")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = np.load(args.embeddings) if args.embeddings else synthetic_corpus(args.rows, args.dims)
+    queries = corpus[np.random.default_rng(1).choice(len(corpus), args.queries, replace=False)]
+    reference = CompactEmbeddings.encode(corpus, dtype="float32")
+    expected = [reference.similarity(q) for q in queries]
+
+    print(f"{'format':<18}{'MB':>10}{'ms/query':>10}{'max err':>10}{'recall@10':>11}")
+    for dimensions in (None, 512, 256):
+        for dtype in CompactEmbeddings.DTYPES:
+            store = CompactEmbeddings.encode(corpus, dtype=dtype, dimensions=dimensions)
+            start = time.perf_counter()
+            scores = [store.similarity(q) for q in queries]
+            elapsed = (time.perf_counter() - start) / len(queries) * 1000
+
+            error = max(float(np.abs(s - e).max()) for s, e in zip(scores, expected))
+            recall = np.mean([
+                len(set(np.argsort(-s)[:10]) & set(np.argsort(-e)[:10])) / 10 for s, e in zip(scores, expected)
+            ])
+            label = f"{dtype}/{dimensions or corpus.shape[1]}"
+            print(f"{label:<18}{store.nbytes / 2 ** 20:>10.1f}{elapsed:>10.2f}{error:>10.4f}{recall:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Failure-heavy workloads - exception path vs result path
+
+Runs a non-strict contains/not-contains/schema chain over rows where ~30% fail
+and compares the previous exception-based failure handling (validators raise,
+the chain catches, logs at error level and builds a Result) with the current
+path where validators return failed Results directly.
+
+    python benchmarks/failure_path_benchmark.py --rows 100000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from aisert import Aisert, AisertError
+from aisert.models.result import Result
+
+
+class Answer(BaseModel):
+    answer: str
+    confidence: float
+
+
+def make_rows(count: int):
+    good = '{"answer": "You can request a refund within 30 days.", "confidence": 0.9}'
+    bad = '{"answer": "This is spam", "confidence": "high"}'
+    return [bad if i % 10 < 3 else good for i in range(count)]
+
+
+def legacy_run(self, validator, strict, *args, **kwargs):
+    """The previous Aisert._run: every failure raises, is caught, logged at error level and converted."""
+    try:
+        result = validator.validate(*args, **kwargs)
+    except AisertError as e:
+        if strict:
+            self.logger.error(f"{validator.validator_name} validation failed")
+            raise
+        self.logger.error(f"{validator.validator_name} validation failed: {str(e)}")
+        result = Result(validator.validator_name, False, str(e))
+    return result
+
+
+def run_chain(rows):
+    for row in rows:
+        (Aisert(row)
+         .assert_contains(["refund"], strict=False)
+         .assert_not_contains(["spam"], strict=False)
+         .assert_schema(Answer, strict=False)
+         .collect())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    # Error logs are usually enabled in production; send them nowhere so only formatting is measured.
+    logging.basicConfig(level=logging.ERROR, handlers=[logging.NullHandler()])
+    rows = make_rows(args.rows)
+
+    current_run = Aisert._run
+    for name, run_impl in (("exception path", legacy_run), ("result path", current_run)):
+        Aisert._run = run_impl
+        try:
+            start = time.perf_counter()
+            run_chain(rows)
+            elapsed = time.perf_counter() - start
+        finally:
+            Aisert._run = current_run
+        print(f"{name:<16}{elapsed:>8.2f}s {elapsed / len(rows) * 1e6:>8.1f} us/row")
+
+
+if __name__ == "__main__":
+    main()
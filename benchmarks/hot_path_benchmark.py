@@ -0,0 +1,45 @@
+"""
+Per-call Python overhead of a trivial validation chain
+
+Times ``Aisert(content).assert_contains(...).assert_not_contains(...).assert_contains(...).collect()``
+on a short string, where the checks themselves are nearly free, so the number
+reported is the overhead paid on every call: construction, validator lookup,
+result and report objects (or only the status with ``collect(detail="status")``).
+
+    python benchmarks/hot_path_benchmark.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aisert import Aisert
+
+CONTENT = "Thanks for reaching out! You can request a refund within 30 days."
+
+
+def chain(detail="full"):
+    return (Aisert(CONTENT)
+            .assert_contains(["refund"], strict=False)
+            .assert_not_contains(["spam", "scam"], strict=False)
+            .assert_contains(["30 days"], strict=False)
+            .collect(detail))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    assert chain().status is True
+    for detail in ("full", "status"):
+        best = min(timeit.repeat(lambda: chain(detail), number=args.number, repeat=args.repeat)) / args.number
+        print(f"three-rule chain, detail={detail!r}: {best * 1e6:.2f} us/call ({1 / best:,.0f} calls/s)")
+
+
+if __name__ == "__main__":
+    main()
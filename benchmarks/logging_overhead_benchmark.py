@@ -0,0 +1,106 @@
+"""
+Cost of hot-path logging when it is switched off
+
+Runs a contains/not-contains/schema chain over a small and a large (~1 MB) JSON
+payload twice: with the package loggers in place but DEBUG disabled (the usual
+production setup), and with every logger replaced by a no-op object, i.e. a
+build without logging. The two columns should match; any gap is formatting
+work done for messages nobody sees.
+
+    python benchmarks/logging_overhead_benchmark.py
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import List
+
+from pydantic import BaseModel
+
+from aisert import Aisert
+from aisert.validators.contains_validator import ContainsValidator
+from aisert.validators.not_contains_validator import NotContainsValidator
+from aisert.validators.schema_validator import SchemaValidator
+
+
+class Item(BaseModel):
+    id: int
+    text: str
+
+
+class Payload(BaseModel):
+    answer: str
+    items: List[Item]
+
+
+class NoLogger:
+    """Stand-in for a logger in a build without logging."""
+
+    def isEnabledFor(self, level):
+        return False
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    debug = info = warning = error = _noop
+
+
+def make_payload(items: int) -> str:
+    return json.dumps({
+        "answer": "You can request a refund within 30 days.",
+        "items": [{"id": i, "text": f"line {i} of the refund policy"} for i in range(items)],
+    })
+
+
+def chain(content):
+    return (Aisert(content)
+            .assert_contains(["refund"], strict=False)
+            .assert_not_contains(["spam"], strict=False)
+            .assert_schema(Payload, strict=False)
+            .collect())
+
+
+def loggers():
+    return [Aisert] + [cls.get_instance() for cls in (ContainsValidator, NotContainsValidator, SchemaValidator)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    payloads = {"small (60 B)": ('{"answer": "refund", "items": []}', 20_000),
+                "large (~1 MB)": (make_payload(25_000), 20)}
+
+    owners = loggers()
+    originals = [owner.logger for owner in owners]
+    modes = {"logging disabled": originals, "no logging": [NoLogger() for _ in owners]}
+    for label, (content, number) in payloads.items():
+        assert chain(content).status is True
+        timings = {mode: float("inf") for mode in modes}
+        # Alternate the modes on every repeat so machine noise hits both alike.
+        for _ in range(args.repeat):
+            for mode, replacements in modes.items():
+                for owner, replacement in zip(owners, replacements):
+                    owner.logger = replacement
+                gc.collect()
+                try:
+                    elapsed = timeit.timeit(lambda: chain(content), number=number) / number
+                finally:
+                    for owner, original in zip(owners, originals):
+                        owner.logger = original
+                timings[mode] = min(timings[mode], elapsed)
+        print(f"{label:<14}" + "".join(f"{mode}: {t * 1e6:>10.1f} us   " for mode, t in timings.items())
+              + f"ratio: {timings['logging disabled'] / timings['no logging']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
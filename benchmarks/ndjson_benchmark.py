@@ -0,0 +1,69 @@
+"""
+Nightly dumps - one chain per NDJSON line vs Aisert.validate_ndjson
+
+Writes an NDJSON file of structured outputs (1% invalid) and validates it
+against one model twice: reading it line by line with an ``Aisert(line)
+.assert_schema(Model)`` chain per line, and with ``Aisert.validate_ndjson``
+reading blocks and validating each line with the cached adapter.
+
+    python benchmarks/ndjson_benchmark.py --lines 500000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from aisert import Aisert
+
+
+class Answer(BaseModel):
+    answer: str
+    confidence: float
+    sources: List[str]
+
+
+def write_dump(path: str, count: int):
+    with open(path, "w") as file:
+        for i in range(count):
+            confidence = "high" if i % 100 == 0 else i / count
+            file.write(json.dumps({"answer": f"answer {i}", "confidence": confidence, "sources": ["a", "b"]}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dump.ndjson")
+        write_dump(path, args.lines)
+        size = os.path.getsize(path) / 1e6
+
+        start = time.perf_counter()
+        failed = 0
+        with open(path) as file:
+            for line in file:
+                failed += not Aisert(line).assert_schema(Answer, strict=False).collect().status
+        per_line = time.perf_counter() - start
+
+        start = time.perf_counter()
+        report = Aisert.validate_ndjson(path, Answer, workers=args.workers)
+        batch = time.perf_counter() - start
+        assert report.failed == failed
+
+    print(f"{args.lines} lines, {size:.1f} MB, {failed} invalid")
+    print(f"chain per line:   {args.lines / per_line:>10,.0f} lines/s")
+    print(f"validate_ndjson:  {args.lines / batch:>10,.0f} lines/s   speedup: {per_line / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+ONNX Runtime vs sentence-transformers - latency and accuracy comparison
+
+Exports the model (fp32 + int8) if needed, then compares per-pair latency and
+similarity scores of the "onnx" provider against the PyTorch baseline.
+
+    python benchmarks/onnx_semantic_benchmark.py --model all-MiniLM-L6-v2 --threads 4
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aisert.validators.semantic_validator.common_semantic_validators import (
+    ONNXSemanticValidator,
+    SentenceTransformersSemanticValidator,
+)
+from aisert.validators.semantic_validator.onnx_export import export
+
+PAIRS = [
+    ("The cat sat on the mat.", "A cat is sitting on a rug."),
+    ("Reset your password from the account settings page.", "How do I change my password?"),
+    ("Python is a programming language.", "Snakes live in trees."),
+    ("Our refund policy allows returns within 30 days.", "You can get your money back in a month."),
+    ("The meeting has been moved to Thursday.", "Quarterly revenue grew by 12 percent."),
+] * 20
+
+
+def scores(encode):
+    """Cosine similarity per pair using an ``encode(list_of_texts) -> array`` function."""
+    embeddings = np.asarray(encode([text for pair in PAIRS for text in pair]), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return (embeddings[0::2] * embeddings[1::2]).sum(axis=1)
+
+
+def latency_ms(validator, rounds: int = 3):
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text1, text2 in PAIRS:
+            validator.validate(text1, text2, threshold=0)
+        timings.append((time.perf_counter() - start) / len(PAIRS) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or f"{args.model.replace('/', '_')}-onnx"
+    if not os.path.isfile(os.path.join(output_dir, "model_int8.onnx")):
+        export(args.model, output_dir, quantize=True)
+
+    baseline = SentenceTransformersSemanticValidator.get_instance(model_name=args.model)
+    candidates = {
+        "onnx-fp32": ONNXSemanticValidator.get_instance(model_name=output_dir, intra_op_num_threads=args.threads),
+        "onnx-int8": ONNXSemanticValidator.get_instance(model_name=output_dir, quantized=True,
+                                                        intra_op_num_threads=args.threads),
+    }
+
+    base_scores = scores(baseline.model.encode)
+    print(f"{'backend':<24}{'ms/pair':>10}{'max |diff|':>14}{'mean |diff|':>14}")
+    print(f"{'sentence-transformers':<24}{latency_ms(baseline):>10.2f}{0:>14.4f}{0:>14.4f}")
+    for name, validator in candidates.items():
+        diffs = np.abs(scores(validator.encode) - base_scores)
+        print(f"{name:<24}{latency_ms(validator):>10.2f}{diffs.max():>14.4f}{diffs.mean():>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
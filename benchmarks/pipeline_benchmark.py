@@ -0,0 +1,67 @@
+"""
+Per-request chain vs compiled pipeline
+
+Builds the same contains/not-contains/schema/semantic chain for every request
+and compares it with a ``Pipeline`` compiled once, which validates the rule
+arguments, resolves the semantic provider, builds the schema adapter and
+embeds the reference text up front. Uses the "hashing" semantic provider so
+no model download is needed; pass ``--tokens`` to add an OpenAI token rule
+(requires the tiktoken encoding to be available).
+
+    python benchmarks/pipeline_benchmark.py --number 20000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from aisert import Aisert, AisertConfig
+
+CONTENT = '{"answer": "You can request a refund within 30 days of purchase.", "confidence": 0.92}'
+REFERENCE = "Customers can get a refund within thirty days after buying."
+
+
+class Answer(BaseModel):
+    answer: str
+    confidence: float
+
+
+def build(chain, semantic: bool, tokens: bool):
+    chain = (chain
+             .assert_contains(["refund", "30 days"], strict=False)
+             .assert_not_contains(["spam", "guarantee"], strict=False)
+             .assert_schema(Answer, strict=False))
+    if semantic:
+        chain = chain.assert_semantic_matches(REFERENCE, threshold=0.2, strict=False)
+    return chain.assert_tokens(200, strict=False) if tokens else chain
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tokens", action="store_true")
+    args = parser.parse_args()
+
+    config = AisertConfig(token_provider="openai", token_model="gpt-4o",
+                          semantic_provider="hashing", semantic_model="hashing")
+    for semantic in (False, True):
+        pipeline = build(Aisert.rules(config), semantic, args.tokens).compile()
+        per_request = lambda: build(Aisert(CONTENT, config), semantic, args.tokens).collect()
+        compiled = lambda: pipeline.run(CONTENT)
+
+        assert per_request().rules == compiled().rules
+        number = args.number if not semantic else max(1, args.number // 20)
+        print(f"{len(pipeline)} rules{' incl. semantic' if semantic else ''}:")
+        for name, run in (("per-request chain", per_request), ("compiled pipeline", compiled)):
+            best = min(timeit.repeat(run, number=number, repeat=args.repeat)) / number
+            print(f"  {name:<20}{best * 1e6:>10.1f} us/call {1 / best:>12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Schema validation - TypeAdapter per call vs cached adapter
+
+Times ``SchemaValidator.check`` on a small model and on a nested model with
+40 fields per level, comparing the previous behaviour (a new ``TypeAdapter``
+built on every call) with the cached adapter, for a model and for a
+``List[Model]`` generic alias.
+
+    python benchmarks/schema_adapter_benchmark.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from aisert.validators.schema_validator import SchemaValidator
+
+
+class Small(BaseModel):
+    answer: str
+    confidence: float
+    sources: List[str]
+
+
+def large_model():
+    fields = {f"field_{i}": (float if i % 3 else str, ...) for i in range(40)}
+    inner = create_model("Inner", **fields)
+    return create_model("Large", items=(List[inner], ...), **fields)
+
+
+def large_payload():
+    fields = {f"field_{i}": (1.5 if i % 3 else "text") for i in range(40)}
+    return json.dumps({**fields, "items": [fields] * 3})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    validator = SchemaValidator.get_instance()
+    large = large_model()
+    small_payload = '{"answer": "yes", "confidence": 0.9, "sources": ["a", "b"]}'
+    cases = [
+        ("small model", Small, small_payload),
+        ("small List[Model]", List[Small], f"[{small_payload}, {small_payload}]"),
+        ("40-field nested model", large, large_payload()),
+        ("40-field List[Model]", List[large], f"[{large_payload()}]"),
+    ]
+
+    for name, schema, payload in cases:
+        assert validator.check(payload, schema).status is True
+        per_call = lambda: TypeAdapter(schema).validate_python(json.loads(payload))
+        cached = lambda: validator.check(payload, schema)
+        timings = [min(timeit.repeat(run, number=args.number, repeat=args.repeat)) / args.number
+                   for run in (per_call, cached)]
+        print(f"{name:<24}adapter per call: {timings[0] * 1e6:>9.1f} us   cached: {timings[1] * 1e6:>7.1f} us"
+              f"   speedup: {timings[0] / timings[1]:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
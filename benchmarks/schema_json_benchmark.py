@@ -0,0 +1,71 @@
+"""
+Schema validation - json.loads + validate_python vs single-pass validate_json
+
+Times validating JSON text against a model, comparing the previous behaviour
+(parse with ``json.loads`` then validate the Python objects) with
+``SchemaValidator.check``, which hands ``str``/``bytes`` content straight to
+pydantic-core. Payloads range from 1 KB to 10 MB; throughput is reported in MB/s.
+
+    python benchmarks/schema_json_benchmark.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from aisert.validators.schema_validator import SchemaValidator
+
+
+class Source(BaseModel):
+    title: str
+    url: str
+    score: float
+
+
+class Answer(BaseModel):
+    answer: str
+    confidence: float
+    sources: List[Source]
+
+
+def payload(size: int) -> str:
+    """An Answer serialized to roughly ``size`` bytes."""
+    source = {"title": "Refund policy", "url": "https://example.com/refunds", "score": 0.87}
+    per_source = len(json.dumps(source)) + 2
+    count = max(1, (size - 60) // per_source)
+    return json.dumps({"answer": "Refunds are issued within 14 days.", "confidence": 0.92,
+                       "sources": [source] * count})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=0.5, help="Approximate time per measurement")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    validator = SchemaValidator.get_instance()
+    adapter = SchemaValidator._adapter(Answer)
+
+    for label, size in (("1 KB", 1 << 10), ("100 KB", 100 << 10), ("1 MB", 1 << 20), ("10 MB", 10 << 20)):
+        text = payload(size)
+        for kind, content in (("str", text), ("bytes", text.encode())):
+            assert validator.check(content, Answer).status is True
+            two_pass = lambda: adapter.validate_python(json.loads(content))
+            one_pass = lambda: validator.check(content, Answer)
+            number = max(1, int(args.seconds / max(timeit.timeit(two_pass, number=1), 1e-6)))
+            timings = [min(timeit.repeat(run, number=number, repeat=args.repeat)) / number
+                       for run in (two_pass, one_pass)]
+            mb = len(content) / 1e6
+            print(f"{label:>7} {kind:<6}loads+validate: {mb / timings[0]:>8.1f} MB/s"
+                  f"   validate_json: {mb / timings[1]:>8.1f} MB/s   speedup: {timings[0] / timings[1]:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Static embeddings vs transformer providers - throughput and score agreement
+
+Distills the model if needed, then reports pairs/second for each provider and
+the Pearson correlation of its similarity scores with sentence-transformers.
+
+    python benchmarks/static_embedding_benchmark.py --model all-MiniLM-L6-v2 --dims 256
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aisert.validators.semantic_validator.common_semantic_validators import (
+    SentenceTransformersSemanticValidator,
+    StaticEmbeddingSemanticValidator,
+    TFIDFSemanticValidator,
+)
+from aisert.validators.semantic_validator.static_distill import distill
+
+PAIRS = [
+    ("The cat sat on the mat.", "A cat is sitting on a rug."),
+    ("Reset your password from the account settings page.", "How do I change my password?"),
+    ("Python is a programming language.", "Snakes live in trees."),
+    ("Our refund policy allows returns within 30 days.", "You can get your money back in a month."),
+    ("The meeting has been moved to Thursday.", "Quarterly revenue grew by 12 percent."),
+    ("Drink plenty of water when exercising.", "Hydration matters during workouts."),
+    ("The train to Berlin is delayed.", "Stock prices fell sharply today."),
+    ("Preheat the oven to 200 degrees.", "Set the oven temperature before baking."),
+]
+
+
+def score(validator, text1, text2):
+    return validator.check(text1, text2, threshold=0).score
+
+
+def run(validator, rounds: int = 50):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text1, text2 in PAIRS:
+            validator.validate(text1, text2, threshold=0)
+    pairs_per_second = rounds * len(PAIRS) / (time.perf_counter() - start)
+    return pairs_per_second, np.array([score(validator, t1, t2) for t1, t2 in PAIRS])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--dims", type=int, default=None)
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or f"{args.model.replace('/', '_')}-static"
+    if not os.path.isfile(os.path.join(output_dir, "embeddings.npy")):
+        distill(args.model, output_dir, dims=args.dims)
+
+    providers = {
+        "sentence-transformers": SentenceTransformersSemanticValidator.get_instance(model_name=args.model),
+        "static": StaticEmbeddingSemanticValidator.get_instance(model_name=output_dir),
+        "tfidf": TFIDFSemanticValidator.get_instance(),
+    }
+    results = {name: run(validator) for name, validator in providers.items()}
+    reference = results["sentence-transformers"][1]
+
+    print(f"{'provider':<24}{'pairs/s':>12}{'pearson r':>12}")
+    for name, (throughput, scores) in results.items():
+        print(f"{name:<24}{throughput:>12.0f}{np.corrcoef(scores, reference)[0, 1]:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
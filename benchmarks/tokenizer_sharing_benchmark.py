@@ -0,0 +1,93 @@
+"""
+Multi-model deployment - one OpenAI token counter per model vs per encoding
+
+A service configured with many OpenAI model names (dated snapshots, Azure
+deployment names, fine-tunes) loads token counters for all of them. Each
+strategy runs in a fresh interpreter, so startup time and peak RSS are not
+skewed by the other:
+
+- per model: the previous behaviour, one ``OpenAITokenValidator`` per model
+  name, each resolving its encoding through tiktoken on first use
+- per encoding: ``OpenAITokenValidator.get_instance``, which resolves names
+  through the local table and shares one instance per encoding
+
+Also times the ``get_instance`` lookup made by every ``assert_tokens`` call.
+Loading encodings needs network access or a populated ``TIKTOKEN_CACHE_DIR``.
+
+    python benchmarks/tokenizer_sharing_benchmark.py
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aisert.validators.token_validator.common_token_validators import OpenAITokenValidator
+
+MODELS = [
+    "gpt-4", "gpt-4-0613", "gpt-4-32k", "gpt-4-turbo", "gpt-4-turbo-2024-04-09",
+    "gpt-3.5-turbo", "gpt-3.5-turbo-0125", "gpt-3.5-turbo-16k", "gpt-35-turbo", "gpt-35-turbo-16k",
+    "gpt-4o", "gpt-4o-2024-05-13", "gpt-4o-2024-08-06", "gpt-4o-mini", "gpt-4o-mini-2024-07-18",
+    "gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano", "o1", "o1-mini", "o3", "o3-mini", "o4-mini",
+    "ft:gpt-4o-mini-2024-07-18:acme::abc123", "ft:gpt-3.5-turbo-0125:acme::def456",
+    "text-embedding-3-small", "text-embedding-3-large", "text-embedding-ada-002",
+]
+TEXT = "Refunds are accepted within 30 days of purchase with the original receipt. " * 20
+
+
+def child(strategy: str):
+    start = time.perf_counter()
+    if strategy == "per-model":
+        counters = [OpenAITokenValidator(model, None) for model in MODELS]
+    else:
+        counters = [OpenAITokenValidator.get_instance(token_model=model) for model in MODELS]
+    for counter in counters:
+        counter.count(TEXT)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": elapsed, "instances": len({id(counter) for counter in counters}),
+                      "peak_mb": peak_kb / 1024}))
+
+
+def run_child(strategy: str):
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", strategy],
+                             capture_output=True, text=True)
+    if process.returncode:
+        return None, process.stderr.strip().splitlines()[-1]
+    return json.loads(process.stdout), None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--child", choices=("per-model", "per-encoding"))
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    print(f"{len(MODELS)} model names, "
+          f"{len({OpenAITokenValidator.encoding_for_model(model) for model in MODELS})} encodings")
+    for strategy in ("per-model", "per-encoding"):
+        stats, error = run_child(strategy)
+        if stats is None:
+            print(f"{strategy:<14}could not load encodings: {error}")
+            continue
+        print(f"{strategy:<14}instances: {stats['instances']:>3}   load + first count: {stats['seconds'] * 1e3:>8.1f} ms"
+              f"   peak RSS: {stats['peak_mb']:>7.1f} MB")
+
+    lookup = lambda: [OpenAITokenValidator.get_instance(token_model=model) for model in MODELS]
+    lookup()
+    seconds = min(timeit.repeat(lookup, number=args.number // len(MODELS), repeat=5))
+    print(f"get_instance lookup: {seconds / (args.number // len(MODELS) * len(MODELS)) * 1e9:.0f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,18 @@
 """Tests for core Aisert functionality."""
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from pydantic import BaseModel
+from typing import List
 
 from aisert import Aisert, AisertConfig, AisertError
 from aisert.exception import (
     SchemaValidationError,
     ContainsValidationError,
     TokenValidationError,
-    SemanticValidationError
+    SemanticValidationError,
+    PathValidationError
 )
 
 
@@ -279,4 +283,471 @@ class TestErrorHandling:
         
         # Test with strict=True should raise
         with pytest.raises(AisertError):
-            aisert._validate(Mock(validate=Mock(side_effect=AisertError("test"))), True)
\ No newline at end of file
+            aisert._validate(Mock(validate=Mock(side_effect=AisertError("test"))), True)
+
+class TestCollectDetail:
+    """Test collect detail levels."""
+
+    def test_collect_status_returns_bool(self):
+        """Test detail="status" returns only the overall status."""
+        assert Aisert("Hello world").assert_contains(["Hello"]).collect(detail="status") is True
+        assert Aisert("Hello world").assert_contains(["bye"], strict=False).collect(detail="status") is False
+
+    def test_collect_full_exposes_typed_results(self):
+        """Test the report carries typed fields alongside the rules dictionaries."""
+        report = Aisert("Hello world").assert_contains(["bye", "ciao"], strict=False).collect()
+        assert report.results[1].count == 2
+        assert report.rules[1]["reason"] == "Following items not present in the content: ['bye', 'ciao']"
+
+    def test_collect_rejects_unknown_detail(self):
+        """Test an unknown detail level raises AisertError."""
+        with pytest.raises(AisertError):
+            Aisert("Hello world").collect(detail="verbose")
+
+
+class TestValidateMany:
+    """Test columnar batch validation."""
+
+    def test_validate_many_returns_columnar_report(self):
+        """Test per-rule arrays, pass rates and failure samples."""
+        rules = Aisert.rules().assert_contains(["refund"]).assert_not_contains(["spam"])
+        report = Aisert.validate_many(["refund ok", "no luck", "refund spam"], rules, workers=1)
+
+        assert report.size == 3
+        assert report.status.tolist() == [True, False, False]
+        assert report.passed.tolist() == [[True, True], [False, True], [True, False]]
+        assert report.pass_rates.tolist() == pytest.approx([2 / 3, 2 / 3])
+        assert report.failures[1] == [(1, "Following items not present in the content: ['refund']")]
+        assert report.failures[2][0][0] == 2
+
+    def test_validate_many_deduplicates_contents(self):
+        """Test identical contents are validated once and expanded back to every row."""
+        from aisert.validators.contains_validator import ContainsValidator
+        rules = Aisert.rules().assert_contains(["refund"])
+        check = ContainsValidator.check
+        with patch.object(ContainsValidator, "check", autospec=True, side_effect=check) as spy:
+            report = Aisert.validate_many(["refund", "nope", "refund", {"a": 1}, {"a": 1}], rules,
+                                          chunk_size=2)
+        assert spy.call_count == 3
+        assert report.status.tolist() == [True, False, True, False, False]
+
+    def test_validate_many_keeps_non_json_rows_apart(self):
+        """Test rows that are not exact JSON are neither rejected nor merged with look-alike rows."""
+        from decimal import Decimal
+        rows = [{1: "a", "b": "c"}, {"x": Decimal("1")}, {"x": "1"}, {1: "a"}, {"1": "a"}, {"x": "1"}]
+        rules = Aisert.rules().assert_path("$..*", lambda value: isinstance(value, str), strict=False)
+        report = Aisert.validate_many(rows, rules)
+        assert report.status.tolist() == [True, False, True, True, True, True]
+        rules = Aisert.rules().assert_path("$['1']", strict=False)
+        assert Aisert.validate_many([{1: "a"}, {"1": "a"}], rules).status.tolist() == [False, True]
+
+    def test_validate_many_skips_unmet_dependencies(self):
+        """Test rules whose dependencies failed are marked skipped, not run."""
+        rules = Aisert.rules().assert_contains(["refund"]).assert_contains(["days"]).depends_on(1)
+        report = Aisert.validate_many(["refund in 30 days", "30 days"], rules, workers=2, chunk_size=1)
+        assert report.skipped.tolist() == [[False, False], [False, True]]
+        assert report.status.tolist() == [True, False]
+
+    def test_validate_many_requires_rule_set(self):
+        """Test an immediate chain is rejected as a rule set."""
+        with pytest.raises(AisertError):
+            Aisert.validate_many(["text"], Aisert("text"))
+
+
+class TestPipeline:
+    """Test compiled pipelines."""
+
+    def test_pipeline_matches_immediate_chain(self):
+        """Test a pipeline reports the same results as the equivalent chain."""
+        pipeline = Aisert.rules().assert_contains(["Hello"]).assert_not_contains(["spam"], strict=False).compile()
+        expected = Aisert("Hello spam").assert_contains(["Hello"]).assert_not_contains(["spam"], strict=False).collect()
+
+        assert len(pipeline) == 2
+        assert pipeline.run("Hello spam").rules == expected.rules
+        assert pipeline.run("Hello world", detail="status") is True
+        with pytest.raises(ContainsValidationError):
+            pipeline.run("Goodbye")
+
+    def test_pipeline_prepares_rules_once(self):
+        """Test schema adapters are built at compile time, not per run."""
+        from aisert.validators.schema_validator import SchemaValidator
+        with patch.object(SchemaValidator, "_adapter", wraps=SchemaValidator._adapter) as adapter:
+            pipeline = Aisert.rules().assert_schema(TestModel, strict=False).compile()
+            reports = [pipeline.run('{"name": "n", "age": %d}' % age) for age in range(5)]
+        assert adapter.call_count == 1
+        assert all(report.status for report in reports)
+
+    def test_pipeline_is_thread_safe(self):
+        """Test concurrent runs keep their results separate."""
+        from concurrent.futures import ThreadPoolExecutor
+        pipeline = Aisert.rules().assert_contains(["yes"], strict=False).compile()
+        contents = ["yes" if i % 2 else "no" for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            statuses = list(pool.map(lambda c: pipeline.run(c, detail="status"), contents))
+        assert statuses == [c == "yes" for c in contents]
+
+    def test_pipeline_honours_dependencies(self):
+        """Test a rule is skipped when the rule it depends on fails."""
+        pipeline = (Aisert.rules().assert_contains(["refund"], strict=False)
+                    .assert_contains(["days"], strict=False).depends_on(1).compile())
+        report = pipeline.run("30 days")
+        assert report.rules[2]["skipped"] is True
+
+    def test_compile_invalid_rule_fails_early(self):
+        """Test invalid rule arguments raise at compile time."""
+        with pytest.raises(ContainsValidationError):
+            Aisert.rules().assert_contains("not a list").compile()
+        with pytest.raises(AisertError):
+            Aisert("text").compile()
+
+
+class TestContentView:
+    """Test derived content is computed once per chain."""
+
+    @patch('aisert.validators.token_validator.token_validator_factory.TokenValidatorFactory.get_instance')
+    def test_chain_parses_and_counts_once(self, mock_factory):
+        """Test JSON text is never parsed in Python and tokens are counted once however many rules use them."""
+        import json
+        mock_validator = Mock()
+        mock_validator.count.return_value = 5
+        mock_factory.return_value = mock_validator
+        config = AisertConfig(token_provider="openai", token_model="gpt-3.5-turbo")
+
+        with patch("aisert.models.content_view.json.loads", wraps=json.loads) as loads:
+            report = (
+                Aisert('{"name": "Ada", "age": 36}', config)
+                .assert_schema(TestModel)
+                .assert_schema(List[int], strict=False)
+                .assert_tokens(10)
+                .assert_tokens(20)
+                .collect()
+            )
+        assert report.rules[2]["status"] is False
+        assert loads.call_count == 0  # validated from the JSON text by pydantic-core
+        assert mock_validator.count.call_count == 1
+
+    @patch('aisert.validators.token_validator.token_validator_factory.TokenValidatorFactory.get_instance')
+    def test_chain_serializes_dict_once(self, mock_factory):
+        """Test dict content is serialized once for all token rules."""
+        import json
+        mock_validator = Mock()
+        mock_validator.count.return_value = 5
+        mock_factory.return_value = mock_validator
+        config = AisertConfig(token_provider="openai", token_model="gpt-3.5-turbo")
+
+        with patch("aisert.models.content_view.json.dumps", wraps=json.dumps) as dumps:
+            Aisert({"key": "value"}, config, deferred=True).assert_tokens(10).assert_tokens(20).collect()
+        assert dumps.call_count == 1
+        mock_validator.count.assert_called_once_with('{"key": "value"}')
+
+    def test_chain_embeds_content_once(self):
+        """Test the content is embedded once for several semantic rules."""
+        pytest.importorskip("sklearn")
+        from aisert.validators.semantic_validator.common_semantic_validators import HashingSemanticValidator
+        config = AisertConfig(semantic_provider="hashing", semantic_model="hashing")
+        transform = HashingSemanticValidator.transform
+
+        with patch.object(HashingSemanticValidator, "transform", autospec=True, side_effect=transform) as spy:
+            report = (
+                Aisert("refund within 30 days", config)
+                .assert_semantic_matches("refund", 0.1)
+                .assert_semantic_matches("30 days", 0.1)
+                .collect()
+            )
+        assert report.status is True
+        assert spy.call_count == 3  # content once, each reference once
+
+
+class TestAsyncAisert:
+    """Test asyncio validation API."""
+
+    def test_async_chain_collects(self):
+        """Test the fluent chain runs on collect and returns a report."""
+        import asyncio
+        from aisert import AsyncAisert
+
+        report = asyncio.run(
+            AsyncAisert("Hello world")
+            .assert_contains(["Hello"], strict=False)
+            .assert_not_contains(["Hello"], strict=False)
+            .collect()
+        )
+        assert report.status is False
+        assert report.rules[1]['status'] is True
+        assert report.rules[2]['status'] is False
+
+    def test_async_strict_raises_on_collect(self):
+        """Test strict failures are raised when collect is awaited."""
+        import asyncio
+        from aisert import AsyncAisert
+
+        aisert = AsyncAisert("test").assert_contains(["missing"], strict=True)
+        with pytest.raises(ContainsValidationError):
+            asyncio.run(aisert.collect())
+
+    @patch('aisert.validators.token_validator.token_validator_factory.TokenValidatorFactory.get_instance')
+    def test_async_token_count_uses_acount(self, mock_factory):
+        """Test token validation awaits the provider's async count."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from aisert import AsyncAisert
+
+        mock_validator = Mock()
+        mock_validator.acount = AsyncMock(return_value=5)
+        mock_factory.return_value = mock_validator
+
+        config = AisertConfig(token_provider="anthropic", token_model="claude-3")
+        report = asyncio.run(AsyncAisert({"key": "value"}, config).assert_tokens(10).collect())
+        assert report.status is True
+        mock_validator.acount.assert_awaited_once_with('{"key": "value"}')
+        mock_validator.count.assert_not_called()
+
+    def test_async_schema_runs_on_executor(self):
+        """Test CPU-bound validators run off the event loop thread."""
+        import asyncio
+        import threading
+        from aisert import AsyncAisert
+        from aisert.validators.schema_validator import SchemaValidator
+
+        threads = []
+        original = SchemaValidator.check
+
+        def record_thread(self, *args, **kwargs):
+            threads.append(threading.current_thread())
+            return original(self, *args, **kwargs)
+
+        with patch.object(SchemaValidator, "check", record_thread):
+            report = asyncio.run(AsyncAisert('{"name": "John", "age": 30}').assert_schema(TestModel).collect())
+        assert report.status is True
+        assert threads and threads[0] is not threading.main_thread()
+
+
+class TestDeferredExecution:
+    """Test deferred (lazy) execution plans."""
+
+    @patch('aisert.validators.token_validator.token_validator_factory.TokenValidatorFactory.get_instance')
+    def test_rules_run_on_collect_concurrently(self, mock_factory):
+        """Test assert_* only records and collect runs rules concurrently."""
+        import time
+
+        mock_validator = Mock()
+        mock_validator.count.side_effect = lambda text: time.sleep(0.2) or 5
+        mock_factory.return_value = mock_validator
+        config = AisertConfig(token_provider="openai", token_model="gpt-3.5-turbo")
+
+        aisert = Aisert("Hello world", config, deferred=True)
+        for _ in range(3):
+            aisert.assert_tokens(10, strict=False)
+        mock_validator.count.assert_not_called()
+
+        start = time.perf_counter()
+        report = aisert.collect()
+        assert time.perf_counter() - start < 0.5
+        assert report.status is True
+        assert list(report.rules) == [1, 2, 3]
+
+    def test_report_order_matches_calls(self):
+        """Test report numbering follows the assert_* call order."""
+        report = (
+            Aisert("Hello world", deferred=True)
+            .assert_contains(["missing"], strict=False)
+            .assert_contains(["Hello"], strict=False)
+            .assert_not_contains(["world"], strict=False)
+            .collect()
+        )
+        assert [rule['status'] for rule in report.rules.values()] == [False, True, False]
+        assert report.rules[3]['validator'] == 'NotContainsValidator'
+
+    def test_strict_failure_raised_on_collect(self):
+        """Test strict failures surface from collect in deferred mode."""
+        aisert = Aisert("test", deferred=True).assert_contains(["missing"], strict=True)
+        with pytest.raises(ContainsValidationError):
+            aisert.collect()
+
+
+class TestFailFast:
+    """Test cost-aware ordering, fail-fast skipping and rule dependencies."""
+
+    @patch('aisert.validators.token_validator.token_validator_factory.TokenValidatorFactory.get_instance')
+    def test_expensive_rules_skipped_after_cheap_failure(self, mock_factory):
+        """Test cheap rules run first and later rules are reported as skipped."""
+        mock_validator = Mock()
+        mock_validator.count.return_value = 5
+        mock_factory.return_value = mock_validator
+        config = AisertConfig(token_provider="openai", token_model="gpt-3.5-turbo")
+
+        report = (
+            Aisert("Hello spam", config, deferred=True, fail_fast=True)
+            .assert_tokens(10, strict=False)
+            .assert_not_contains(["spam"], strict=False)
+            .collect()
+        )
+        assert report.status is False
+        mock_validator.count.assert_not_called()
+        assert report.rules[1]['skipped'] is True
+        assert report.rules[1]['status'] is None
+        assert report.rules[2]['status'] is False
+
+    def test_immediate_mode_fail_fast(self):
+        """Test fail-fast skips rules added after a failure without deferring."""
+        report = (
+            Aisert("Hello", fail_fast=True)
+            .assert_contains(["missing"], strict=False)
+            .assert_contains(["Hello"], strict=False)
+            .collect()
+        )
+        assert report.rules[2]['skipped'] is True
+
+    def test_depends_on_skips_when_dependency_fails(self):
+        """Test a dependent rule is skipped when its dependency fails."""
+        report = (
+            Aisert('{"name": "John"}', deferred=True)
+            .assert_schema(TestModel, strict=False)
+            .assert_contains(["John"], strict=False).depends_on(1)
+            .assert_contains(["name"], strict=False)
+            .collect()
+        )
+        assert [rule['status'] for rule in report.rules.values()] == [False, None, True]
+        assert report.rules[2]['skipped'] is True
+
+    def test_depends_on_runs_when_dependency_passes(self):
+        """Test a dependent rule runs when its dependency passes."""
+        report = (
+            Aisert('{"name": "John", "age": 30}', deferred=True)
+            .assert_schema(TestModel, strict=False)
+            .assert_contains(["John"], strict=False).depends_on(1)
+            .collect()
+        )
+        assert report.status is True
+
+    def test_depends_on_requires_deferred(self):
+        """Test depends_on is rejected for immediately executed chains."""
+        with pytest.raises(AisertError):
+            Aisert("Hello").assert_contains(["Hello"]).depends_on(1)
+
+
+class TestSchemaExtraction:
+    """Test assert_schema(extract=True) across execution modes."""
+
+    def test_extract_in_chain_and_pipeline(self):
+        """Test extraction in immediate, deferred and compiled chains."""
+        content = 'Sure, here it is:\n```json\n{"name": "John", "age": 30}\n```'
+        assert Aisert(content).assert_schema(TestModel, extract=True).collect().status is True
+        assert Aisert(content, deferred=True).assert_schema(TestModel, strict=False, extract=True).collect().status
+        pipeline = Aisert.rules().assert_schema(TestModel, strict=False, extract=True).compile()
+        assert pipeline.run(content, detail="status") is True
+        with pytest.raises(SchemaValidationError):
+            Aisert(content).assert_schema(TestModel)
+
+
+class TestValidateNdjson:
+    """Test batch NDJSON schema validation."""
+
+    LINES = ['{"name": "John", "age": 30}', '{"name": "Jane", "age": "old"}', "", '{"name": "Bob"}', "not json"]
+
+    def test_file_in_small_chunks(self, tmp_path):
+        """Test lines split across read blocks, blank lines and 1-based failure line numbers."""
+        path = tmp_path / "outputs.ndjson"
+        path.write_text("\r\n".join(self.LINES * 50) + "\n")
+        for workers in (1, None, 2):
+            report = Aisert.validate_ndjson(path, TestModel, workers=workers, chunk_bytes=64, max_failure_samples=4)
+            assert report.size == 250
+            assert report.validated == 200
+            assert report.failed == 150
+            assert report.failed_lines[:3].tolist() == [2, 4, 5]
+            assert [line for line, _ in report.failures] == [2, 4, 5, 7]
+            assert "age" in report.failures[0][1]
+            assert report.failures[2][1].startswith("Content is not a valid JSON")
+
+    def test_iterables_and_file_objects(self):
+        """Test iterables of lines and text file objects."""
+        import io
+        report = Aisert.validate_ndjson(iter(self.LINES), TestModel)
+        assert report.passed.tolist() == [True, False, True, False, False]
+        assert report.blank.tolist() == [False, False, True, False, False]
+        assert report.pass_rate == 0.25
+        report = Aisert.validate_ndjson(io.StringIO("\n".join(self.LINES[:1] * 3)), TestModel, chunk_bytes=10)
+        assert report.status is True and report.size == 3
+        assert Aisert.validate_ndjson([], TestModel).size == 0
+
+
+class TestSchemaAny:
+    """Test assert_schema_any in chains."""
+
+    def test_reports_matched_schema(self):
+        """Test the matched model is named in the report and a mismatch raises when strict."""
+        class Refusal(BaseModel):
+            reason: str
+
+        report = Aisert('{"reason": "policy"}').assert_schema_any([TestModel, Refusal]).collect()
+        assert report.rules[1]["reason"] == "Matched schema: Refusal"
+        report = Aisert('{"name": "John", "age": 30}', deferred=True) \
+            .assert_schema_any([TestModel, Refusal], strict=False).collect()
+        assert report.rules[1]["reason"] == "Matched schema: TestModel"
+        with pytest.raises(SchemaValidationError):
+            Aisert('{"name": "John"}').assert_schema_any([TestModel, Refusal])
+
+
+class TestAssertPath:
+    """Test assert_path in chains."""
+
+    def test_path_rules_share_one_parse(self):
+        """Test JSONPath rules in one chain parse the content once."""
+        content = '{"user": {"email": "a@b.c"}, "items": [{"price": 3}, {"price": 0}]}'
+        with patch("aisert.models.content_view.json.loads", wraps=json.loads) as loads:
+            report = (Aisert(content, deferred=True)
+                      .assert_path("$.user.email")
+                      .assert_path("$.items[*].price", lambda price: price > 0, strict=False)
+                      .assert_schema(TestModel, strict=False)
+                      .collect())
+        assert loads.call_count == 1
+        assert [rule["status"] for rule in report.rules.values()] == [True, False, False]
+        assert report.rules[2]["reason"] == "Value at $.items[1].price failed the check: 0"
+        with pytest.raises(PathValidationError):
+            Aisert(content).assert_path("$.user.phone")
+
+    def test_json_schema_rules_share_the_parse(self):
+        """Test JSON Schema rules reuse the chain's parsed content."""
+        content = '{"user": {"email": "a@b.c"}}'
+        schema = {"type": "object", "required": ["user"]}
+        with patch("json.loads", wraps=json.loads) as loads:
+            report = (Aisert(content, deferred=True)
+                      .assert_path("$.user.email")
+                      .assert_schema(schema)
+                      .assert_schema({"type": "array"}, strict=False)
+                      .collect())
+        assert loads.call_count == 1
+        assert [rule["status"] for rule in report.rules.values()] == [True, True, False]
+
+
+class TestStructuredContains:
+    """Test contains assertions on dict/list content in chains."""
+
+    def test_tool_call_payload(self):
+        """Test values, keys and paths of a tool call are searched, in chains and pipelines."""
+        tool_call = {"name": "refund", "arguments": {"reason": "damaged item", "amount": 20}}
+        report = (Aisert(tool_call)
+                  .assert_contains(["damaged"], paths=["$.arguments.reason"], substring=True)
+                  .assert_contains(["amount"], strict=False)
+                  .assert_contains(["amount"], keys=True)
+                  .assert_not_contains(["refund"], paths=["$.arguments"])
+                  .collect())
+        assert [rule["status"] for rule in report.rules.values()] == [True, False, True, True]
+        pipeline = (Aisert.rules()
+                    .assert_not_contains(["damaged"], strict=False, paths=["$..reason"], substring=True).compile())
+        assert pipeline.run(json.dumps(tool_call)).status is False
+        assert pipeline.run({"arguments": {"reason": "late"}}).status is True
+
+    def test_keys_on_text_content(self):
+        """Test keys=True leaves text content searched as text."""
+        report = (Aisert("hello world")
+                  .assert_contains(["hello"], keys=True)
+                  .assert_not_contains(["spam"], keys=True)
+                  .collect())
+        assert report.status is True
+
+    def test_baseline_list_and_scalar_matching(self):
+        """Test list elements and scalar values are matched whole, not as substrings."""
+        assert Aisert([1, 2, 3]).assert_contains([1]).collect().status is True
+        assert Aisert({"n": 5}).assert_contains(["5"]).collect().status is True
+        assert Aisert(["pineapple"]).assert_not_contains(["apple"]).collect().status is True
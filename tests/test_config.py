@@ -118,4 +118,33 @@ class TestDefaultConfig:
         assert DefaultConfig.token_model == "gpt-3.5-turbo"
         assert DefaultConfig.token_provider == "openai"
         assert DefaultConfig.semantic_model == "text-embedding-3-small"
-        assert DefaultConfig.token_encoding is None
\ No newline at end of file
+        assert DefaultConfig.token_encoding is None
+
+class TestDefaultConfigCache:
+    """Test the default configuration is cached."""
+
+    def test_default_config_shared_until_defaults_change(self):
+        """Test get_default_config reuses one instance and set_defaults refreshes it."""
+        first = AisertConfig.get_default_config()
+        assert AisertConfig.get_default_config() is first
+
+        AisertConfig.set_defaults(token_model="gpt-4")
+        try:
+            refreshed = AisertConfig.get_default_config()
+            assert refreshed is not first
+            assert refreshed.token_model == "gpt-4"
+        finally:
+            AisertConfig.set_defaults(token_model="gpt-3.5-turbo")
+
+    def test_default_semantic_options(self):
+        """Test semantic_options set through set_defaults reach the default config."""
+        first = AisertConfig.get_default_config()
+        AisertConfig.set_defaults(semantic_options={"intra_op_num_threads": 4})
+        try:
+            refreshed = AisertConfig.get_default_config()
+            assert refreshed is not first
+            assert refreshed.semantic_options == {"intra_op_num_threads": 4}
+            assert DefaultConfig.to_dict()["semantic_options"] == {"intra_op_num_threads": 4}
+        finally:
+            AisertConfig.set_defaults(semantic_options={})
+        assert AisertConfig.get_default_config().semantic_options == {}
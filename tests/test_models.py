@@ -133,4 +133,36 @@ class TestAisertReport:
         assert report.status is False
         assert len(report.rules) == 2
         assert report.rules["SchemaValidator"]["status"] is True
-        assert report.rules["ContainsValidator"]["status"] is False
\ No newline at end of file
+        assert report.rules["ContainsValidator"]["status"] is False
+
+class TestCompactModels:
+    """Test result objects use __slots__."""
+
+    def test_result_has_no_instance_dict(self):
+        """Test Result, AisertStatus and AisertReport are slotted."""
+        assert not hasattr(Result("V", True), "__dict__")
+        assert not hasattr(AisertStatus(), "__dict__")
+        assert not hasattr(AisertReport(True, {}), "__dict__")
+
+
+class TestLazyResults:
+    """Test reasons and report rules are built only when read."""
+
+    def test_reason_template_formatted_on_access(self):
+        """Test a template reason is formatted once, on first access."""
+        result = Result("TokenValidator", False, "Token limit exceeded: %d tokens found, limit is %d",
+                        args=(150, 100), count=150)
+        assert result._reason == ("Token limit exceeded: %d tokens found, limit is %d", (150, 100))
+        assert result.reason == "Token limit exceeded: 150 tokens found, limit is 100"
+        assert result._reason == result.reason
+        assert result.to_dict()["count"] == 150
+        assert "score" not in result.to_dict()
+
+    def test_report_builds_rules_from_results(self):
+        """Test rules are built from Result objects on first access."""
+        results = {1: Result("semantic", True, "%s similarity score: %s", args=("TF-IDF", 0.9), score=0.9)}
+        report = AisertReport(True, results=results)
+        assert report._rules is None
+        assert report.results[1].score == 0.9
+        assert report.rules[1]["reason"] == "TF-IDF similarity score: 0.9"
+        assert report.rules is report.rules
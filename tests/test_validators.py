@@ -1,7 +1,11 @@
 """Tests for individual validator functionality."""
+import json
+import logging
+from enum import Enum
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import List
 
 from aisert.validators.schema_validator import SchemaValidator
@@ -13,7 +17,8 @@ from aisert.exception import (
     SchemaValidationError,
     ContainsValidationError,
     SemanticValidationError,
-    TokenValidationError
+    TokenValidationError,
+    PathValidationError
 )
 
 
@@ -162,16 +167,42 @@ class TestTokenValidator:
         mock_validator.count.assert_called_with('[1, 2, 3]')
         assert result.status is True
 
+    def test_anthropic_async_client_per_event_loop(self):
+        """Test acount works across separate asyncio.run calls and reuses the client within a loop."""
+        import asyncio
+        from aisert.validators.token_validator.common_token_validators import AnthropicTokenValidator
+
+        class LoopBoundClient:
+            def __init__(self):
+                self.loop = asyncio.get_running_loop()
+
+            async def count_tokens(self, model, messages):
+                if asyncio.get_running_loop() is not self.loop:
+                    raise RuntimeError("Event loop is closed")
+                return len(messages)
+
+        anthropic = MagicMock()
+        anthropic.AsyncClient.side_effect = LoopBoundClient
+        validator = AnthropicTokenValidator("claude-test")
+
+        async def count_twice():
+            return [await validator.acount("abc"), await validator.acount("abcd")]
+
+        with patch.dict("sys.modules", {"anthropic": anthropic}):
+            assert asyncio.run(count_twice()) == [3, 4]
+            assert asyncio.run(count_twice()) == [3, 4]
+        assert anthropic.AsyncClient.call_count == 2
+
 
 class TestOpenAITokenValidator:
     """Test OpenAITokenValidator functionality."""
 
-    @patch('tiktoken.encoding_for_model')
-    def test_count_with_model(self, mock_encoding_for_model):
+    @patch('tiktoken.get_encoding')
+    def test_count_with_model(self, mock_get_encoding):
         """Test token counting with model."""
         mock_encoding = Mock()
         mock_encoding.encode.return_value = [1, 2, 3, 4, 5]
-        mock_encoding_for_model.return_value = mock_encoding
+        mock_get_encoding.return_value = mock_encoding
 
         validator = OpenAITokenValidator.get_instance(token_model="gpt-3.5-turbo")
         count = validator.count("test text")
@@ -188,3 +219,706 @@ class TestOpenAITokenValidator:
             validator1 = OpenAITokenValidator.get_instance(token_model="gpt-3.5-turbo")
             validator2 = OpenAITokenValidator.get_instance(token_model="gpt-3.5-turbo")
             assert validator1 is validator2
+
+    def test_models_share_encoding_instance(self):
+        """Test models resolving to the same encoding share one instance, resolved without tiktoken."""
+        with patch('tiktoken.encoding_name_for_model') as lookup:
+            shared = OpenAITokenValidator.get_instance(token_model="gpt-4")
+            assert OpenAITokenValidator.get_instance(token_model="gpt-4-0613") is shared
+            assert OpenAITokenValidator.get_instance(token_model="gpt-3.5-turbo") is shared
+            assert OpenAITokenValidator.get_instance(token_encoding="cl100k_base") is shared
+            assert OpenAITokenValidator.get_instance(token_model="gpt-4o-2024-05-13") is not shared
+        lookup.assert_not_called()
+        assert shared.token_encoding == "cl100k_base"
+        assert OpenAITokenValidator.encoding_for_model("not-an-openai-model") is None
+        unknown = OpenAITokenValidator.get_instance(token_model="not-an-openai-model")
+        assert unknown.token_model == "not-an-openai-model" and unknown.token_encoding is None
+
+
+class TestSemanticProviders:
+    """Test semantic provider registration and configuration."""
+
+    def test_onnx_provider_registered(self):
+        """Test the ONNX provider is available through the factory."""
+        from aisert.validators.semantic_validator import SemanticValidatorFactory
+        from aisert.validators.semantic_validator.common_semantic_validators import ONNXSemanticValidator
+        assert SemanticValidatorFactory._semantic_validators["onnx"] is ONNXSemanticValidator
+
+    def test_onnx_missing_model_dir(self, tmp_path):
+        """Test ONNX provider reports a missing export as a semantic error."""
+        from aisert.validators.semantic_validator.common_semantic_validators import ONNXSemanticValidator
+        with pytest.raises(SemanticValidationError):
+            ONNXSemanticValidator.get_instance(model_name=str(tmp_path / "missing"))
+
+    @patch('aisert.validators.semantic_validator.semantic_validator_factory.SemanticValidatorFactory.get_instance')
+    def test_semantic_options_passed_to_provider(self, mock_factory):
+        """Test semantic_options from the config reach the provider factory."""
+        from aisert import AisertConfig
+        config = AisertConfig(semantic_provider="onnx", semantic_model="./minilm-onnx",
+                              semantic_options={"quantized": True, "intra_op_num_threads": 2})
+        SemanticValidator(config).validate("a", "b", 0.5)
+        mock_factory.assert_called_with(provider="onnx", model_name="./minilm-onnx",
+                                        quantized=True, intra_op_num_threads=2)
+
+    def test_static_provider_similarity(self, tmp_path):
+        """Test the static provider mean-pools table rows per token."""
+        np = pytest.importorskip("numpy")
+        tokenizers = pytest.importorskip("tokenizers")
+        from aisert.validators.semantic_validator import SemanticValidatorFactory
+
+        vocab = {"[UNK]": 0, "cats": 1, "purr": 2, "stocks": 3, "fall": 4}
+        tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="[UNK]"))
+        tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+        tokenizer.save(str(tmp_path / "tokenizer.json"))
+        np.save(tmp_path / "embeddings.npy",
+                np.array([[0, 0], [1, 0], [1, 0.1], [0, 1], [0.1, 1]], dtype=np.float32))
+
+        validator = SemanticValidatorFactory.get_instance("static", model_name=str(tmp_path))
+        assert validator.validate("cats purr", "purr", threshold=0.9).status is True
+        with pytest.raises(SemanticValidationError):
+            validator.validate("cats purr", "stocks fall", threshold=0.5)
+
+    def test_sentence_transformers_chunk_windows(self):
+        """Test chunked mode splits long content into capped, overlapping windows."""
+        from aisert.validators.semantic_validator.common_semantic_validators import \
+            SentenceTransformersSemanticValidator
+
+        tokenizer = Mock(side_effect=lambda text, add_special_tokens: {"input_ids": list(range(10))})
+        tokenizer.decode.side_effect = lambda ids: " ".join(map(str, ids))
+        validator = object.__new__(SentenceTransformersSemanticValidator)
+        validator.model = Mock(tokenizer=tokenizer)
+        validator.chunk_size, validator.chunk_overlap, validator.max_chunks = 4, 1, 16
+
+        assert validator._chunks("long") == ["0 1 2 3", "3 4 5 6", "6 7 8 9"]
+        validator.max_chunks = 2
+        assert validator._chunks("long") == ["0 1 2 3", "3 4 5 6"]
+        validator.chunk_size = 20
+        assert validator._chunks("short") == ["short"]
+
+    def test_sentence_transformers_chunk_cap_and_long_reference(self):
+        """Test only capped windows are decoded and a long reference is embedded whole."""
+        from aisert.validators.semantic_validator.common_semantic_validators import \
+            SentenceTransformersSemanticValidator
+
+        tokenizer = Mock(side_effect=lambda text, add_special_tokens: {"input_ids": list(range(1000))})
+        tokenizer.decode.side_effect = lambda ids: " ".join(map(str, ids))
+        validator = object.__new__(SentenceTransformersSemanticValidator)
+        validator.model = Mock(tokenizer=tokenizer)
+        validator.chunk_size, validator.chunk_overlap, validator.max_chunks = 4, 1, 3
+
+        assert len(validator._chunks("long content")) == 3
+        assert tokenizer.decode.call_count == 3
+        reference = "long reference " * 500
+        validator.prepare(reference, threshold=0.5)
+        validator.model.encode.assert_called_once_with(reference, convert_to_tensor=True)
+
+    def test_view_content_and_reference_embedded_in_one_call(self):
+        """Test a chain's first semantic rule embeds the content and reference in one request."""
+        from aisert.models.content_view import ContentView
+        from aisert.validators.semantic_validator.common_semantic_validators import (
+            OpenAISemanticValidator, SentenceTransformersSemanticValidator)
+
+        openai = MagicMock()
+        openai.OpenAI.return_value.embeddings.create.side_effect = lambda model, input: Mock(
+            data=[Mock(embedding=[1.0, 0.5, 0.0]) for _ in input])
+        validator = OpenAISemanticValidator("text-embedding-3-small")
+        view = ContentView("content")
+        with patch.dict("sys.modules", {"openai": openai}):
+            assert validator.check_content(view, "reference", threshold=0.9).status is True
+            assert validator.check_content(view, "other", threshold=0.9).status is True
+        create = openai.OpenAI.return_value.embeddings.create
+        assert [call.kwargs["input"] for call in create.call_args_list] == [["content", "reference"], ["other"]]
+
+        validator = object.__new__(SentenceTransformersSemanticValidator)
+        validator.model = MagicMock()
+        validator.chunk_size = 4
+        validator._chunks = Mock(return_value=["window 1", "window 2"])
+        validator._embedding_similarity = Mock(return_value=1.0)
+        validator.validator_name, validator.label = "semantic", "Sentence Transformers"
+        validator.check_content(ContentView("long content"), "reference", threshold=0.5)
+        validator.model.encode.assert_called_once_with(["window 1", "window 2", "reference"], convert_to_tensor=True)
+
+    def test_openai_embeddings_cached_with_dimensions(self):
+        """Test OpenAI embeddings are requested with dimensions and served from the compact cache."""
+        from aisert.validators.semantic_validator.common_semantic_validators import OpenAISemanticValidator
+
+        openai = MagicMock()
+        openai.OpenAI.return_value.embeddings.create.side_effect = lambda model, input, dimensions: Mock(
+            data=[Mock(embedding=[1.0, 0.5, 0.0]) for _ in input])
+        validator = OpenAISemanticValidator("text-embedding-3-small", dimensions=3, embedding_dtype="int8")
+        with patch.dict("sys.modules", {"openai": openai}):
+            assert validator.validate("a", "b", threshold=0.9).status is True
+            validator.validate("a", "b", threshold=0.9)
+
+        create = openai.OpenAI.return_value.embeddings.create
+        create.assert_called_once_with(model="text-embedding-3-small", input=["a", "b"], dimensions=3)
+
+
+class TestCompactEmbeddings:
+    """Test compact embedding storage and similarity kernels."""
+
+    @pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+    def test_similarity_close_to_float32(self, dtype):
+        """Test compact formats approximate float32 cosine similarity."""
+        np = pytest.importorskip("numpy")
+        from aisert.utils.embedding_util import CompactEmbeddings
+
+        vectors = np.random.default_rng(0).standard_normal((50, 64)).astype(np.float32)
+        expected = CompactEmbeddings.encode(vectors, dtype="float32").similarity(vectors[0])
+        store = CompactEmbeddings.encode(vectors, dtype=dtype)
+        assert np.allclose(store.similarity(vectors[0]), expected, atol=0.02)
+        assert store.similarity(CompactEmbeddings.encode(vectors[0], dtype=dtype))[0] == pytest.approx(1, abs=0.02)
+
+    def test_dimension_truncation_and_memory(self):
+        """Test leading-dimension truncation and int8 memory footprint."""
+        np = pytest.importorskip("numpy")
+        from aisert.utils.embedding_util import CompactEmbeddings
+
+        store = CompactEmbeddings.encode(np.ones((10, 1536)), dtype="int8", dimensions=256)
+        assert store.data.shape == (10, 256)
+        assert store.nbytes == 10 * 256 + 10 * 4
+        with pytest.raises(ValueError):
+            CompactEmbeddings.encode(np.ones(4), dtype="int4")
+
+
+class TestTFIDFSemanticValidator:
+    """Test the TF-IDF semantic provider."""
+
+    def test_concurrent_checks_and_chains(self):
+        """Test the shared instance gives the sequential scores under concurrent checks and deferred chains."""
+        from concurrent.futures import ThreadPoolExecutor
+        from aisert import Aisert, AisertConfig
+        from aisert.validators.semantic_validator.common_semantic_validators import TFIDFSemanticValidator
+        validator = TFIDFSemanticValidator.get_instance()
+        pairs = [(f"order {i} refund policy {'word ' * (i % 7)}", f"refund {i % 5} days") for i in range(200)]
+        expected = [validator.check(a, b, 0.1).reason for a, b in pairs]
+        with ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(lambda pair: validator.check(*pair, 0.1).reason, pairs)) == expected
+
+        config = AisertConfig(semantic_provider="tfidf")
+
+        def chain(i):
+            aisert = Aisert(f"refund policy number {i}", config, deferred=True)
+            for reference in ("refund policy", f"number {i}", "shipping times", f"policy {i} refund"):
+                aisert.assert_semantic_matches(reference, 0.0, strict=False)
+            return aisert.collect().status
+
+        with ThreadPoolExecutor(8) as pool:
+            assert all(pool.map(chain, range(100)))
+
+
+class TestHashingSemanticValidator:
+    """Test the stateless hashing semantic provider."""
+
+    def test_similarity_and_threshold(self):
+        """Test identical text matches and unrelated text fails."""
+        from aisert.validators.semantic_validator import SemanticValidatorFactory
+        validator = SemanticValidatorFactory.get_instance("hashing")
+        assert validator.validate("reset your password", "reset your password", 0.99).status is True
+        with pytest.raises(SemanticValidationError):
+            validator.validate("reset your password", "quarterly revenue grew", 0.5)
+
+    def test_validate_many_matches_single(self):
+        """Test batch scoring agrees with one-at-a-time scoring."""
+        from aisert.validators.semantic_validator.common_semantic_validators import HashingSemanticValidator
+        validator = HashingSemanticValidator.get_instance()
+        contents = ["how do I reset my password", "the weather is nice", "password reset steps"]
+        scores = validator.similarities(contents, "reset password")
+        for content, score in zip(contents, scores):
+            assert validator.similarities([content], "reset password")[0] == pytest.approx(score)
+        assert [r.status for r in validator.validate_many(contents, "reset password", 0.3)] == \
+            [bool(s >= 0.3) for s in scores]
+
+    def test_thread_safe(self):
+        """Test concurrent scoring gives the same result as sequential scoring."""
+        from concurrent.futures import ThreadPoolExecutor
+        from aisert.validators.semantic_validator.common_semantic_validators import HashingSemanticValidator
+        validator = HashingSemanticValidator.get_instance()
+        texts = [f"response number {i} about billing" for i in range(64)]
+        expected = [validator.similarities([t], "billing question")[0] for t in texts]
+        with ThreadPoolExecutor(8) as pool:
+            actual = list(pool.map(lambda t: validator.similarities([t], "billing question")[0], texts))
+        assert actual == pytest.approx(expected)
+
+
+class TestCheckWithoutRaising:
+    """Test the exception-free check() path."""
+
+    def test_check_returns_failed_result(self):
+        """Test check reports failures as results and validate still raises."""
+        validator = ContainsValidator()
+        result = validator.check("Hello world", ["missing"])
+        assert result.status is False
+        assert "missing" in result.reason
+        with pytest.raises(ContainsValidationError, match="missing"):
+            validator.validate("Hello world", ["missing"])
+
+    def test_schema_check_returns_failed_result(self):
+        """Test schema mismatches and invalid JSON are returned as failed results."""
+        validator = SchemaValidator()
+        assert validator.check('{"name": "John"}', TestUser).status is False
+        assert "Content is not a valid JSON" in validator.check("invalid json", TestUser).reason
+
+    def test_non_strict_chain_builds_no_exception(self):
+        """Test non-strict failures never construct the validator's exception."""
+        from aisert import Aisert
+        with patch.object(ContainsValidator, "error_class") as error_class:
+            report = Aisert("Hello").assert_contains(["missing"], strict=False).collect()
+        assert report.status is False
+        error_class.assert_not_called()
+
+    def test_validate_only_subclass_adapted(self):
+        """Test validators implementing only validate() still work through check()."""
+        from aisert.validators.validator import BaseValidator
+        from aisert.models.validator_enums import ValidatorEnums
+
+        class LegacyValidator(BaseValidator):
+            def __init__(self):
+                super().__init__(ValidatorEnums.CONTAINS)
+
+            def validate(self, content):
+                raise ContainsValidationError("legacy failure")
+
+        result = LegacyValidator().check("anything")
+        assert result.status is False
+        assert result.reason == "legacy failure"
+
+
+class TestSharedValidators:
+    """Test validators are shared instead of rebuilt per call."""
+
+    def test_stateless_validators_are_singletons(self):
+        """Test get_instance returns one instance per validator class."""
+        from aisert.validators.not_contains_validator import NotContainsValidator
+        assert ContainsValidator.get_instance() is ContainsValidator.get_instance()
+        assert NotContainsValidator.get_instance() is not ContainsValidator.get_instance()
+        assert isinstance(NotContainsValidator.get_instance(), NotContainsValidator)
+
+    def test_config_validators_shared_per_config_values(self):
+        """Test token validators are shared between equal configurations."""
+        from aisert import AisertConfig
+        first = TokenValidator.get_instance(AisertConfig(token_provider="openai", token_model="gpt-4"))
+        second = TokenValidator.get_instance(AisertConfig(token_provider="openai", token_model="gpt-4"))
+        other = TokenValidator.get_instance(AisertConfig(token_provider="openai", token_model="gpt-4o"))
+        assert first is second
+        assert first is not other
+
+
+class TestLazyLogging:
+    """Test hot-path logging does no formatting work when disabled."""
+
+    def test_schema_check_does_not_format_content_when_debug_disabled(self):
+        """Test content is never stringified for disabled debug logs."""
+        class Model(BaseModel):
+            name: str
+
+        class Content(dict):
+            formatted = 0
+
+            def __repr__(self):
+                Content.formatted += 1
+                return super().__repr__()
+
+            __str__ = __repr__
+
+        validator = SchemaValidator()
+        validator.logger.setLevel(logging.INFO)
+        try:
+            assert validator.check(Content(name="ok"), Model).status is True
+        finally:
+            validator.logger.setLevel(logging.NOTSET)
+        assert Content.formatted == 0
+
+    def test_sanitize_text_preview_is_bounded(self):
+        """Test previews are bounded for large text and structured content."""
+        from aisert.utils.print_util import PrintUtil
+        assert PrintUtil.sanitize_text("a\nb") == "a\\nb"
+        assert len(PrintUtil.sanitize_text("x" * 1_000_000)) == PrintUtil.MAX_PREVIEW
+        assert len(PrintUtil.sanitize_text({"items": list(range(100_000))})) <= PrintUtil.MAX_PREVIEW
+
+
+class TestSchemaAdapterCache:
+    """Test compiled TypeAdapters are reused."""
+
+    def test_adapter_cached_per_schema(self):
+        """Test models and generic aliases get one adapter each."""
+        assert SchemaValidator._adapter(TestUser) is SchemaValidator._adapter(TestUser)
+        assert SchemaValidator._adapter(List[TestUser]) is SchemaValidator._adapter(List[TestUser])
+        assert SchemaValidator._adapter(List[TestUser]) is not SchemaValidator._adapter(TestUser)
+
+    def test_adapter_built_once_across_checks(self):
+        """Test repeated checks do not rebuild the adapter."""
+        class Fresh(BaseModel):
+            value: int
+
+        with patch("aisert.validators.schema_validator.TypeAdapter", wraps=TypeAdapter) as spy:
+            for i in range(3):
+                assert SchemaValidator().check('{"value": %d}' % i, List[Fresh]).status is False
+                assert SchemaValidator().check([{"value": i}], List[Fresh]).status is True
+        assert spy.call_count == 1
+
+    def test_lru_cache_is_bounded(self):
+        """Test the least recently used entry is evicted first."""
+        from aisert.utils.cache_util import LRUCache
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get_or_create("a", lambda: 0) == 1
+
+
+class TestSchemaJsonText:
+    """Test JSON text is parsed and validated in one pass."""
+
+    def test_binary_json_content(self):
+        """Test bytes, bytearray and memoryview content validate like str."""
+        validator = SchemaValidator()
+        valid = b'{"name": "John", "age": 30}'
+        invalid = b'{"name": "John", "age": "thirty"}'
+        for wrap in (bytes, bytearray, memoryview):
+            assert validator.check(wrap(valid), TestUser).status is True
+            result = validator.check(wrap(invalid), TestUser)
+            assert result.status is False
+            assert "age" in result.reason
+            assert result.count == 1
+
+    def test_invalid_json_reason_unchanged(self):
+        """Test malformed JSON still reports the standard-library message."""
+        validator = SchemaValidator()
+        for content in ("not json", b"not json", '{"name": "John",'):
+            result = validator.check(content, TestUser)
+            assert result.status is False
+            assert result.reason.startswith("Content is not a valid JSON: ")
+        assert validator.check("not json", TestUser).reason.endswith("Expecting value: line 1 column 1 (char 0)")
+
+    def test_json_text_not_parsed_in_python(self):
+        """Test valid JSON text never goes through json.loads."""
+        with patch("aisert.validators.schema_validator.json.loads") as loads:
+            assert SchemaValidator().check('{"name": "John", "age": 30}', TestUser).status is True
+            assert SchemaValidator().check('{"name": "John"}', TestUser).status is False
+        loads.assert_not_called()
+
+
+class TestSchemaExtraction:
+    """Test JSON extraction from chatty output before schema validation."""
+
+    def test_find_spans(self):
+        """Test fences, prose, brackets inside strings and mismatched brackets."""
+        from aisert.utils.json_util import JsonUtil
+        assert JsonUtil.extract('Sure!\n```json\n{"a": "}{["}\n```\nThanks') == '{"a": "}{["}'
+        assert JsonUtil.extract('See [note] below: {"a": [1, "\\"]"]} ok') == '{"a": [1, "\\"]"]}'
+        assert JsonUtil.extract('```python\nx = {1: 2}\n```\n```json\n[1, 2]\n```') == "[1, 2]"
+        assert JsonUtil.extract('{"a": [1}, {"b": 2}') == '{"b": 2}'
+        assert JsonUtil.extract('truncated {"a": "b') is None
+        assert JsonUtil.extract("no json here") is None
+
+    def test_stray_brackets_and_quotes_in_prose(self):
+        """Test an opener or quote in prose that never closes does not hide the JSON after it."""
+        from aisert.utils.json_util import JsonUtil
+        for text in ['Sure :-{ here you go {"a": 1}', 'Set [1, 2 is open. Answer: {"a": 1}',
+                     'fill in {placeholder):\n{"a": 1}', 'He wrote {"oops and then {"a": 1}']:
+            assert JsonUtil.extract(text) == '{"a": 1}', text
+        assert JsonUtil.extract('{ [ ] ' * 1000) == "[ ]"
+        prose = 'Sure :-{ the user is {"name": "John", "age": 30}'
+        assert SchemaValidator().check(prose, TestUser, extract=True).status is True
+
+    def test_extract_validates_span(self):
+        """Test fenced and prose-wrapped JSON passes only in extraction mode."""
+        content = 'Here is the user:\n```json\n{"name": "John", "age": 30}\n```\nAnything else?'
+        assert SchemaValidator().check(content, TestUser).status is False
+        assert SchemaValidator().check(content, TestUser, extract=True).status is True
+        assert SchemaValidator().check(content.encode(), TestUser, extract=True).status is True
+        prose = 'As noted [1], the user is {"name": "John", "age": 30}.'
+        assert SchemaValidator().check(prose, TestUser, extract=True).status is True
+
+    def test_extract_failures(self):
+        """Test the longest span's failure is reported, and missing JSON is reported."""
+        result = SchemaValidator().check('See [1]: {"name": "John", "age": "thirty"}', TestUser, extract=True)
+        assert result.status is False
+        assert "age" in result.reason
+        result = SchemaValidator().check("I cannot answer that.", TestUser, extract=True)
+        assert result.status is False
+        assert result.reason == "No JSON object or array found in content"
+
+
+class Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class StreamedAnswer(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    answer: str
+    color: Color
+    sources: List[TestUser]
+
+
+class TestStreamingSchema:
+    """Test incremental validation of streamed JSON."""
+
+    @staticmethod
+    def stream(content, schema, size=1):
+        from aisert import StreamingSchemaValidator
+        stream = StreamingSchemaValidator(schema)
+        for i in range(0, len(content), size):
+            if stream.feed(content[i:i + size]) is not None:
+                return i, stream.failure
+        return None, stream.close()
+
+    def test_valid_stream_any_chunking(self):
+        """Test str and UTF-8 byte chunks of any size pass."""
+        content = json.dumps({"answer": "say \"hé\" [ok] \\", "color": "red",
+                              "sources": [{"name": "John", "age": 30}] * 3})
+        for size in (1, 7, len(content)):
+            assert self.stream(content, StreamedAnswer, size)[1].status is True
+            assert self.stream(content.encode(), StreamedAnswer, size)[1].status is True
+
+    def test_fails_at_early_field(self):
+        """Test a bad enum value fails as soon as it closes, with its path."""
+        content = '{"answer": "x", "color": "green", "sources": [' + '{"name": "a", "age": 1}, ' * 1000
+        at, result = self.stream(content, StreamedAnswer)
+        assert at < 40
+        assert result.status is False
+        assert "color" in result.reason and "enum" in result.reason
+
+    def test_nested_missing_and_extra(self):
+        """Test nested type errors, missing fields and forbidden keys are reported by location."""
+        _, result = self.stream('{"answer": "x", "color": "red", "sources": [{"name": "a", "age": "old"}]}',
+                                StreamedAnswer)
+        assert "sources.0.age" in result.reason
+        _, result = self.stream('{"answer": "x", "sources": []}', StreamedAnswer)
+        assert "color" in result.reason and "Field required" in result.reason
+        _, result = self.stream('{"answer": "x", "mood": 1}', StreamedAnswer)
+        assert "mood" in result.reason and "Extra inputs" in result.reason
+
+    def test_invalid_json(self):
+        """Test malformed or truncated JSON is reported as invalid JSON."""
+        for content in ('{"answer" "x"}', '{"answer": "x"', '[1, 2] trailing', '[1, 2,'):
+            _, result = self.stream(content, List[int] if content[0] == "[" else StreamedAnswer)
+            assert result.status is False
+            assert result.reason.startswith("Content is not a valid JSON: ")
+
+    def test_memory_bounded_by_depth(self):
+        """Test a long array of models keeps no per-item state."""
+        from aisert import StreamingSchemaValidator
+        stream = StreamingSchemaValidator(List[TestUser])
+        stream.feed("[")
+        for _ in range(10_000):
+            assert stream.feed('{"name": "John", "age": 30}, ') is None
+        assert len(stream._stack) == 1 and stream._capture is None and stream._pending is None
+        stream.feed('{"name": "John", "age": 30}]')
+        assert stream.close().status is True
+
+
+class TestJsonSchemaDocuments:
+    """Test JSON Schema dicts as assert_schema schemas."""
+
+    SCHEMA = {
+        "title": "User",
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
+        "required": ["name", "age"],
+        "additionalProperties": False,
+    }
+
+    def test_validates_text_and_objects(self):
+        """Test str, bytes and dict content against a JSON Schema."""
+        validator = SchemaValidator()
+        assert validator.check('{"name": "John", "age": 30}', self.SCHEMA).status is True
+        assert validator.check({"name": "John", "age": 30}, self.SCHEMA).status is True
+        result = validator.check(b'{"name": "John", "age": -1, "x": 1}', self.SCHEMA)
+        assert result.status is False
+        assert result.count == 2
+        assert result.reason.startswith("2 validation errors for User\nage\n")
+        assert "Additional properties" in result.reason
+        assert validator.check("not json", self.SCHEMA).reason.startswith("Content is not a valid JSON: ")
+        assert validator.check('Sure: {"name": "John", "age": 30}', self.SCHEMA, extract=True).status is True
+
+    def test_formats_enforced(self):
+        """Test format keywords are checked with the draft's format checker."""
+        schema = {"type": "object", "properties": {"email": {"type": "string", "format": "email"}}}
+        validator = SchemaValidator()
+        assert validator.check('{"email": "a@b.c"}', schema).status is True
+        result = validator.check('{"email": "not an address"}', schema)
+        assert result.status is False
+        assert "is not a 'email'" in result.reason
+
+    def test_compiled_once_by_canonical_hash(self):
+        """Test equal schemas share one compiled validator regardless of key order."""
+        reordered = dict(reversed(list(self.SCHEMA.items())))
+        assert SchemaValidator._adapter(self.SCHEMA) is SchemaValidator._adapter(reordered)
+        with patch("aisert.validators.schema_validator.validator_for") as compile_schema:
+            for _ in range(3):
+                SchemaValidator().check('{"name": "John", "age": 30}', dict(self.SCHEMA))
+        compile_schema.assert_not_called()
+
+    def test_invalid_schema(self):
+        """Test malformed JSON Schema documents raise."""
+        with pytest.raises(SchemaValidationError, match="not a valid JSON Schema"):
+            SchemaValidator().check("{}", {"type": 5})
+
+
+class TestSchemaAny:
+    """Test validation against any of several schemas."""
+
+    def test_discriminated_union(self):
+        """Test the Literal tag field is used as discriminator and the matched model is reported."""
+        from typing import Literal
+        from aisert.validators.schema_any_validator import SchemaAnyValidator
+
+        class Reply(BaseModel):
+            type: Literal["reply"]
+            text: str
+
+        class Question(BaseModel):
+            type: Literal["question"]
+            text: str
+            options: List[str]
+
+        assert SchemaAnyValidator._find_discriminator((Reply, Question)) == "type"
+        validator = SchemaAnyValidator()
+        result = validator.check('{"type": "question", "text": "?", "options": ["a"]}', [Reply, Question])
+        assert result.status is True
+        assert result.reason == "Matched schema: Question"
+        result = validator.check('{"type": "question", "text": "?"}', [Reply, Question])
+        assert result.status is False
+        assert result.count == 1  # only the tagged model is validated
+        assert "question.options" in result.reason
+        assert SchemaAnyValidator._union_adapter([Reply, Question], None) is \
+            SchemaAnyValidator._union_adapter((Reply, Question), None)
+
+    def test_plain_union_parses_once(self):
+        """Test models without a tag field are tried as one union over a single parse."""
+        from aisert.validators.schema_any_validator import SchemaAnyValidator
+
+        class Age(BaseModel):
+            age: int
+
+        with patch("aisert.validators.schema_validator.json.loads") as loads:
+            result = SchemaAnyValidator().check('{"age": 3}', [TestUser, Age])
+        loads.assert_not_called()
+        assert result.status is True
+        assert result.reason == "Matched schema: Age"
+        result = SchemaAnyValidator().check('{"name": 3}', [TestUser, Age])
+        assert result.status is False
+        assert "TestUser.name" in result.reason and "Age.age" in result.reason
+
+    def test_invalid_schemas(self):
+        """Test empty or non-Pydantic schema lists raise."""
+        from aisert.validators.schema_any_validator import SchemaAnyValidator
+        with pytest.raises(SchemaValidationError):
+            SchemaAnyValidator().check("{}", [])
+        with pytest.raises(SchemaValidationError, match="not a valid Pydantic model"):
+            SchemaAnyValidator().check("{}", [TestUser, dict])
+
+    def test_matched_member_reported(self):
+        """Test generic members and same-named models are reported as the schema entry that matched."""
+        from typing import Dict
+        from aisert.validators.schema_any_validator import SchemaAnyValidator
+        validator = SchemaAnyValidator()
+        schemas = [List[int], Dict[str, int]]
+        assert validator.check("[1, 2]", schemas).reason == "Matched schema: %r" % List[int]
+        assert validator.check('{"a": 1}', schemas).reason == "Matched schema: %r" % Dict[str, int]
+        assert validator.check('["a"]', [List[int], List[str]]).reason == "Matched schema: %r" % List[str]
+
+        first = type("User", (BaseModel,), {"__annotations__": {"name": str}, "__module__": "first"})
+        second = type("User", (BaseModel,), {"__annotations__": {"age": int}, "__module__": "second"})
+        assert validator.check('{"age": 3}', [first, second]).reason == "Matched schema: second.User"
+
+
+class TestPathValidator:
+    """Test JSONPath assertions."""
+
+    DOCUMENT = {"user": {"email": "a@b.c"}, "items": [{"price": 3}, {"price": -1}, {"price": 5}]}
+
+    def test_paths(self):
+        """Test member, index, slice, wildcard and descendant steps with rendered locations."""
+        from aisert.utils.json_path import JsonPath
+
+        def find(path):
+            return [(JsonPath.location(loc), value) for loc, value in JsonPath.compile(path).find(self.DOCUMENT)]
+
+        assert find("$.items[*].price") == [("$.items[0].price", 3), ("$.items[1].price", -1), ("$.items[2].price", 5)]
+        assert find("$['user'].email") == [("$.user.email", "a@b.c")]
+        assert find("$.items[-1].price") == [("$.items[2].price", 5)]
+        assert find("$.items[1:].price") == [("$.items[1].price", -1), ("$.items[2].price", 5)]
+        assert [value for _, value in find("$..price")] == [3, -1, 5]
+        assert JsonPath.compile("$.items[*]") is JsonPath.compile("$.items[*]")
+        with pytest.raises(ValueError, match="Invalid JSONPath"):
+            JsonPath("$.items[?(@.price > 0)]")
+
+    def test_exists_and_predicates(self):
+        """Test existence, the first violation reported, short-circuiting and predicates over no matches."""
+        from aisert.validators.path_validator import PathValidator
+        validator = PathValidator()
+        assert validator.check(json.dumps(self.DOCUMENT), "$.user.email").status is True
+        result = validator.check(self.DOCUMENT, "$.user.phone")
+        assert result.status is False
+        assert result.reason == "Path $.user.phone matched nothing"
+        seen = []
+        result = validator.check(self.DOCUMENT, "$.items[*].price", lambda price: seen.append(price) or price > 0)
+        assert result.status is False
+        assert result.reason == "Value at $.items[1].price failed the check: -1"
+        assert seen == [3, -1]
+        result = validator.check(self.DOCUMENT, "$.items[*].price", lambda price: price > -5)
+        assert result.status is True and result.count == 3
+        result = validator.check(self.DOCUMENT, "$.user.phone", lambda value: False)
+        assert result.status is True and result.count == 0
+        assert "TypeError" in validator.check({"a": "x"}, "$.a", lambda value: value > 0).reason
+        assert validator.check("not json", "$.a").reason.startswith("Content is not a valid JSON: ")
+        with pytest.raises(PathValidationError):
+            validator.check(self.DOCUMENT, "items")
+
+
+class TestStructuredContains:
+    """Test contains checks over dict/list content."""
+
+    PAYLOAD = {"name": "lookup_order",
+               "arguments": {"order_id": "A-17", "count": 5, "notes": ["customer wants a refund", {"tag": "urgent"}]}}
+
+    def test_values_searched_without_serializing(self):
+        """Test nested values are matched whole in place, inside strings with substring and keys only on request."""
+        from aisert.validators.not_contains_validator import NotContainsValidator
+        validator = ContainsValidator()
+        with patch("json.dumps") as dumps:
+            result = validator.check(self.PAYLOAD, ["A-17", "urgent"])
+            flagged = NotContainsValidator().check([self.PAYLOAD], ["urgent", "spam"])
+        dumps.assert_not_called()
+        assert result.status is True and result.count == 2
+        assert flagged.status is False
+        assert flagged.reason == "Found flagged items: ['urgent']"
+        assert validator.check(self.PAYLOAD, ["refund"]).status is False
+        assert validator.check(self.PAYLOAD, ["refund"], substring=True).status is True
+        assert validator.check(self.PAYLOAD, ["order_id"]).status is False
+        assert validator.check(self.PAYLOAD, ["order_id"], keys=True).status is True
+        assert validator.check("hello world", ["hello"], keys=True).status is True
+        assert NotContainsValidator().check("hello world", ["spam"], keys=True).status is True
+
+    def test_scalars_and_list_elements(self):
+        """Test non-string items, scalar leaves and whole list elements match as before."""
+        from aisert.validators.not_contains_validator import NotContainsValidator
+        validator = ContainsValidator()
+        assert validator.check([1, 2, 3], [1]).status is True
+        assert validator.check([[1, 2], 3], [[1, 2]]).status is True
+        assert validator.check({"n": 5}, ["5"]).status is True
+        assert validator.check({"ok": True, "none": None}, [True, "None"]).status is True
+        assert NotContainsValidator().check(["pineapple"], ["apple"]).status is True
+        assert NotContainsValidator().check(["pineapple"], ["apple"], substring=True).status is False
+
+    def test_paths_and_early_exit(self):
+        """Test paths restrict the search and the walk stops once every item is found."""
+        from aisert.utils.json_path import JsonPath
+        from aisert.utils.json_util import JsonUtil
+        validator = ContainsValidator()
+        assert validator.check(self.PAYLOAD, ["refund"], paths=["$.arguments.notes"], substring=True).status is True
+        result = validator.check(json.dumps(self.PAYLOAD), ["lookup_order"], paths=["$.arguments"])
+        assert result.reason == "Following items not present in the content: ['lookup_order']"
+        assert validator.check("not json", ["a"], paths=["$.a"]).reason.startswith("Content is not a valid JSON: ")
+        values = JsonUtil.iter_values({"a": ["x", "needle", "y"], "b": "z"}, paths=[JsonPath.compile("$.a")])
+        assert JsonUtil.find_items(["needle"], values) == {0}
+        assert list(values) == ["y"]
+        with pytest.raises(ContainsValidationError, match="Invalid JSONPath"):
+            validator.check(self.PAYLOAD, ["a"], paths=["arguments"])